@@ -0,0 +1,307 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import zipfile
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from docx_html_converter.backends import get_backend  # noqa: E402
+from docx_html_converter.batch import convert_batch  # noqa: E402
+from docx_html_converter.cache import set_cache  # noqa: E402
+from docx_html_converter.constants import DOCX_EXTENSION  # noqa: E402
+from docx_html_converter.convertor import remove_html_prefix, remove_strong_tags  # noqa: E402
+from docx_html_converter.file_processor import save_file, set_html_ext  # noqa: E402
+from docx_html_converter.postprocessor import postprocess_html  # noqa: E402
+from docx_html_converter.sinks import (  # noqa: E402
+    DirectorySink,
+    NullSink,
+    OutputSink,
+    ZipSink,
+)
+from tests.docx_factory import make_docx  # noqa: E402
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+DEFAULT_WORKERS = (1, 2, 4, 8)
+DEFAULT_NESTED_LISTS = (100, 1000, 10000)
+BATCH_SINKS = ("directory", "zip", "null")
+WORDS = (
+    "convert", "document", "heading", "paragraph", "list", "bold", "pandoc", "html",
+    "output", "batch", "worker", "queue", "stage", "format", "table", "section",
+)
+SECTION_PARAGRAPHS = 20
+PREFIX_ITEMS = 5
+
+
+def make_run(text: str, bold: bool = False) -> str:
+    properties = "<w:rPr><w:b/></w:rPr>" if bold else ""
+    return f'<w:r>{properties}<w:t xml:space="preserve">{text}</w:t></w:r>'
+
+
+def make_paragraph(runs: str, style: str = "", level: int = -1) -> str:
+    properties = f'<w:pStyle w:val="{style}"/>' if style else ""
+    if level >= 0:
+        properties += f'<w:numPr><w:ilvl w:val="{level}"/><w:numId w:val="1"/></w:numPr>'
+    return f"<w:p><w:pPr>{properties}</w:pPr>{runs}</w:p>"
+
+
+def make_sentence(rng: random.Random, bold_ratio: float) -> str:
+    runs = []
+    for _ in range(rng.randint(4, 12)):
+        words = " ".join(rng.choice(WORDS) for _ in range(rng.randint(1, 4)))
+        runs.append(make_run(f"{words} ", bold=rng.random() < bold_ratio))
+    return "".join(runs)
+
+
+def generate_body(
+    paragraphs: int, list_ratio: float, bold_ratio: float, seed: int
+) -> str:
+    rng = random.Random(seed)
+    body = [
+        make_paragraph(make_run(f"Contents {index + 1}"), level=index % 2)
+        for index in range(PREFIX_ITEMS)
+    ]
+    for index in range(paragraphs):
+        if index % SECTION_PARAGRAPHS == 0:
+            title = f"Section {index // SECTION_PARAGRAPHS + 1}"
+            body.append(make_paragraph(make_run(title), style="Heading1"))
+        elif rng.random() < list_ratio:
+            level = rng.choice((0, 0, 0, 1, 1, 2))
+            body.append(make_paragraph(make_sentence(rng, bold_ratio), level=level))
+        else:
+            body.append(make_paragraph(make_sentence(rng, bold_ratio)))
+    return "".join(body)
+
+
+def generate_docx(
+    paragraphs: int, list_ratio: float = 0.4, bold_ratio: float = 0.5, seed: int = 0
+) -> bytes:
+    return make_docx(
+        generate_body(paragraphs, list_ratio, bold_ratio, seed), compression=zipfile.ZIP_DEFLATED
+    )
+
+
+def generate_nested_lists_html(lists: int) -> str:
+    nested_list = (
+        "<ul>\n<li>Item\n<ul>\n<li>Sub item\n<ol type=\"1\">\n<li>Step</li>\n</ol></li>\n"
+        "</ul></li>\n<li>Item</li>\n</ul>\n"
+    )
+    paragraph = "<p>Some <strong>bold</strong> text\nwrapped over lines.</p>\n"
+    return nested_list + (paragraph + nested_list) * lists
+
+
+def strip_ids(html_content: str) -> str:
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html_content, "html.parser")
+    for tag in soup.find_all(True):
+        tag.attrs.pop("id", None)
+    return str(soup)
+
+
+def postprocess(html_content: str) -> str:
+    chunks: List[str] = []
+    postprocess_html(html_content, chunks.append, remove_prefix=True, remove_strong=True)
+    return "".join(chunks)
+
+
+def time_stage(function: Callable, argument, repeat: int) -> Tuple[Dict[str, float], object]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function(argument)
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+    }, result
+
+
+def measure_stages(data: bytes, repeat: int, output_dir: str) -> Dict:
+    backend = get_backend()
+    html_path = os.path.join(output_dir, "stages.html")
+    stages: Dict[str, Dict[str, float]] = {}
+    stages["pandoc"], html_content = time_stage(
+        lambda content: backend.convert_bytes(content, DOCX_EXTENSION), data, repeat
+    )
+    stages["remove_html_prefix"], prefix_free = time_stage(
+        remove_html_prefix, html_content, repeat
+    )
+    stages["remove_strong_tags"], strong_free = time_stage(
+        remove_strong_tags, prefix_free, repeat
+    )
+    stages["strip_ids"], legacy_html = time_stage(strip_ids, strong_free, repeat)
+    stages["postprocess_html"], _ = time_stage(postprocess, html_content, repeat)
+    stages["write"], _ = time_stage(
+        lambda content: save_file(html_path, content), legacy_html, repeat
+    )
+    return {
+        "docx_bytes": len(data),
+        "html_chars": len(html_content),
+        "stages": stages,
+    }
+
+
+def measure_prefix(lists: int, repeat: int) -> Dict:
+    html_content = generate_nested_lists_html(lists)
+    stages: Dict[str, Dict[str, float]] = {}
+    stages["remove_html_prefix"], _ = time_stage(remove_html_prefix, html_content, repeat)
+    stages["postprocess_html"], _ = time_stage(postprocess, html_content, repeat)
+    return {"html_chars": len(html_content), "stages": stages}
+
+
+def create_batch_sink(sink_name: str, output_dir: str, worker_count: int) -> OutputSink:
+    if sink_name == "zip":
+        return ZipSink(os.path.join(output_dir, f"batch_{worker_count}.zip"))
+    if sink_name == "null":
+        return NullSink()
+    return DirectorySink()
+
+
+def measure_batch(
+    data: bytes, files: int, workers: Sequence[int], output_dir: str, sink_name: str
+) -> Dict[str, Dict[str, float]]:
+    path_pairs = []
+    for index in range(files):
+        docx_path = os.path.join(output_dir, f"batch_{index}.{DOCX_EXTENSION}")
+        with open(docx_path, "wb") as f:
+            f.write(data)
+        path_pairs.append((docx_path, set_html_ext(docx_path)))
+
+    report = {}
+    for worker_count in workers:
+        start = time.perf_counter()
+        with create_batch_sink(sink_name, output_dir, worker_count) as sink:
+            results = convert_batch(
+                path_pairs,
+                remove_prefix=True,
+                remove_strong=True,
+                max_workers=worker_count,
+                sink=sink,
+            )
+        elapsed = time.perf_counter() - start
+        if not all(result.success for result in results):
+            raise RuntimeError(next(r.message for r in results if not r.success))
+        report[str(worker_count)] = {
+            "seconds": round(elapsed, 3),
+            "files_per_s": round(files / elapsed, 2),
+        }
+    return report
+
+
+def run_benchmark(
+    sizes: Sequence[int],
+    repeat: int,
+    workers: Sequence[int],
+    batch_files: int,
+    batch_paragraphs: int,
+    batch_sink: str,
+    list_ratio: float,
+    bold_ratio: float,
+    nested_lists: Sequence[int] = (),
+) -> Dict:
+    set_cache(None)
+    report: Dict = {
+        "pandoc_version": get_backend().version(),
+        "stages": {},
+        "prefix": {},
+        "batch": {},
+    }
+    for lists in nested_lists:
+        report["prefix"][str(lists)] = measure_prefix(lists, repeat)
+    with tempfile.TemporaryDirectory() as output_dir:
+        for size in sizes:
+            data = generate_docx(size, list_ratio, bold_ratio)
+            report["stages"][str(size)] = measure_stages(data, repeat, output_dir)
+        if batch_files and workers:
+            data = generate_docx(batch_paragraphs, list_ratio, bold_ratio)
+            report["batch"] = measure_batch(
+                data, batch_files, workers, output_dir, batch_sink
+            )
+    return report
+
+
+def find_regressions(report: Dict, baseline: Dict, threshold: float) -> List[str]:
+    regressions = []
+    for section, unit in (("stages", "paragraphs"), ("prefix", "nested lists")):
+        for size, result in report.get(section, {}).items():
+            baseline_result = baseline.get(section, {}).get(size, {})
+            baseline_stages = baseline_result.get("stages", {})
+            for stage, timing in result["stages"].items():
+                if stage not in baseline_stages:
+                    continue
+                baseline_ms = baseline_stages[stage]["min_ms"]
+                if timing["min_ms"] > baseline_ms * threshold:
+                    regressions.append(
+                        f"{stage} ({size} {unit}): {timing['min_ms']} ms > "
+                        f"{baseline_ms} ms x {threshold}"
+                    )
+    for worker_count, result in report["batch"].items():
+        baseline_result = baseline.get("batch", {}).get(worker_count)
+        if baseline_result is None:
+            continue
+        if result["files_per_s"] * threshold < baseline_result["files_per_s"]:
+            regressions.append(
+                f"batch ({worker_count} workers): {result['files_per_s']} files/s < "
+                f"{baseline_result['files_per_s']} files/s / {threshold}"
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Time each conversion stage on a synthetic DOCX corpus."
+    )
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("-n", "--repeat", type=int, default=3)
+    parser.add_argument(
+        "--nested-lists", type=int, nargs="*", default=DEFAULT_NESTED_LISTS
+    )
+    parser.add_argument("-w", "--workers", type=int, nargs="*", default=DEFAULT_WORKERS)
+    parser.add_argument("--batch-files", type=int, default=16)
+    parser.add_argument("--batch-paragraphs", type=int, default=200)
+    parser.add_argument("--batch-sink", choices=BATCH_SINKS, default=BATCH_SINKS[0])
+    parser.add_argument("--list-ratio", type=float, default=0.4)
+    parser.add_argument("--bold-ratio", type=float, default=0.5)
+    parser.add_argument("-o", "--output", help="write the JSON report to this file")
+    parser.add_argument(
+        "--baseline", help="JSON report of a previous run to compare against"
+    )
+    parser.add_argument("--threshold", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        args.sizes,
+        args.repeat,
+        args.workers,
+        args.batch_files,
+        args.batch_paragraphs,
+        args.batch_sink,
+        args.list_ratio,
+        args.bold_ratio,
+        args.nested_lists,
+    )
+    report_json = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report_json)
+    else:
+        print(report_json)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = find_regressions(report, json.load(f), args.threshold)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_MODULES = (
+    "docx_html_converter",
+    "docx_html_converter.convertor",
+    "docx_html_converter.batch",
+    "docx_html_converter.cli",
+    "docx_html_converter.app",
+)
+HEAVY_MODULES = (
+    "tkinter",
+    "tkinterdnd2",
+    "pypandoc",
+    "bs4",
+    "urllib.request",
+    "ctypes",
+    "multiprocessing",
+)
+
+
+def measure_import(module: str) -> Dict[str, int]:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative_times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_time, name = line.split("|")
+        cumulative_times[name.strip()] = int(cumulative_time)
+    return cumulative_times
+
+
+def run_benchmark(modules: Sequence[str], repeat: int) -> Dict[str, Dict]:
+    report = {}
+    for module in modules:
+        samples: List[int] = []
+        loaded_modules = set()
+        for _ in range(repeat):
+            cumulative_times = measure_import(module)
+            samples.append(cumulative_times[module])
+            loaded_modules.update(cumulative_times)
+        report[module] = {
+            "median_us": int(statistics.median(samples)),
+            "min_us": min(samples),
+            "heavy_modules": sorted(
+                heavy for heavy in HEAVY_MODULES if heavy in loaded_modules
+            ),
+        }
+    return report
+
+
+def find_regressions(
+    report: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float
+) -> List[str]:
+    regressions = []
+    for module, result in report.items():
+        if module not in baseline:
+            continue
+        baseline_result = baseline[module]
+        if result["min_us"] > baseline_result["min_us"] * threshold:
+            regressions.append(
+                f"{module}: {result['min_us']} us > "
+                f"{baseline_result['min_us']} us x {threshold}"
+            )
+        new_heavy_modules = set(result["heavy_modules"]) - set(
+            baseline_result["heavy_modules"]
+        )
+        if new_heavy_modules:
+            regressions.append(
+                f"{module}: now imports {', '.join(sorted(new_heavy_modules))}"
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure cold import time with -X importtime."
+    )
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument("-n", "--repeat", type=int, default=5)
+    parser.add_argument("-o", "--output", help="write the JSON report to this file")
+    parser.add_argument(
+        "--baseline", help="JSON report of a previous run to compare against"
+    )
+    parser.add_argument("--threshold", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.modules, args.repeat)
+    report_json = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(report_json)
+    else:
+        print(report_json)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = find_regressions(report, json.load(f), args.threshold)
+        for regression in regressions:
+            print(regression, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
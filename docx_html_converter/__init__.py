@@ -1,3 +1,9 @@
-from .app import DocxHtmlConverter
+__all__ = ("DocxHtmlConverter",)
 
-__all__ = "DocxHtmlConverter"
+
+def __getattr__(name: str):
+    if name == "DocxHtmlConverter":
+        from .app import DocxHtmlConverter
+
+        return DocxHtmlConverter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,279 @@
+import asyncio
+import os
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .archives import read_docx_bytes
+from .backends import (
+    ConversionTimeout,
+    PypandocBackend,
+    get_backend,
+    get_pandoc_args,
+    get_pandoc_output,
+)
+from .constants import AST_ENGINE, AST_FORMAT, DOCX_EXTENSION, HTML_EXTENSION
+from .convertor import (
+    conversion_result,
+    finish_html,
+    get_cached_html,
+    get_engine,
+    get_timeout,
+    read_native_html,
+    start_image_extractor,
+    store_html,
+)
+from .images import ImageExtractor
+from .pandoc_ast import get_cached_ast, prepare_ast, store_ast
+from .results import ConversionResult
+from .sinks import DirectorySink, OutputSink
+from .telemetry import (
+    CONVERT_STAGE,
+    POSTPROCESS_STAGE,
+    READ_STAGE,
+    TOTAL_STAGE,
+    WRITE_STAGE,
+    ConversionTelemetry,
+)
+
+
+async def run_process_async(
+    args: List[str], data: bytes, timeout: Optional[float] = None
+) -> Tuple[int, bytes, bytes]:
+    process = await asyncio.create_subprocess_exec(
+        *args,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(process.communicate(data), timeout)
+    except asyncio.TimeoutError:
+        await _kill_process(process)
+        raise ConversionTimeout(
+            f"{os.path.basename(args[0])} did not finish within {timeout:g} s"
+        ) from None
+    except BaseException:
+        await _kill_process(process)
+        raise
+    return process.returncode, stdout, stderr
+
+
+async def _kill_process(process: asyncio.subprocess.Process) -> None:
+    if process.returncode is None:
+        process.kill()
+    await process.wait()
+
+
+def get_pandoc_path() -> str:
+    import pypandoc
+
+    return pypandoc.get_pandoc_path()
+
+
+async def run_pandoc_async(
+    pandoc_path: str,
+    data: bytes,
+    input_format: str,
+    output_format: str = HTML_EXTENSION,
+    timeout: Optional[float] = None,
+) -> str:
+    returncode, stdout, stderr = await run_process_async(
+        get_pandoc_args(pandoc_path, input_format, output_format), data, timeout=timeout
+    )
+    return get_pandoc_output(returncode, stdout, stderr)
+
+
+class AsyncConverter:
+    def __init__(self, max_concurrency: Optional[int] = None) -> None:
+        self.max_concurrency = max_concurrency or os.cpu_count() or 1
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency, thread_name_prefix="docx-html-converter"
+        )
+        self._pandoc_path: Optional[str] = None
+
+    async def convert_bytes(
+        self,
+        data: bytes,
+        *,
+        remove_prefix: bool,
+        remove_strong: bool,
+        input_format: str = DOCX_EXTENSION,
+        engine: Optional[str] = None,
+        timeout: Optional[float] = None,
+        images: Optional[ImageExtractor] = None,
+        minify: bool = False,
+        telemetry: Optional[ConversionTelemetry] = None,
+    ) -> str:
+        engine = get_engine(engine)
+        cache_key, cached_html = await self._run(
+            get_cached_html, data, remove_prefix, remove_strong, engine, images, minify
+        )
+        if cached_html is not None:
+            if telemetry is not None:
+                telemetry.cached = True
+            return cached_html
+
+        if telemetry is None:
+            telemetry = ConversionTelemetry("", "")
+        with telemetry.stage(CONVERT_STAGE):
+            raw_html = await self._read_html(
+                data, input_format, engine, remove_prefix, remove_strong, get_timeout(timeout)
+            )
+        with telemetry.stage(POSTPROCESS_STAGE):
+            image_sources = await self._run(images.sources) if images is not None else None
+            html_content = await self._run(
+                finish_html,
+                raw_html,
+                remove_prefix,
+                remove_strong,
+                engine,
+                image_sources=image_sources,
+                minify=minify,
+            )
+        await self._run(store_html, cache_key, html_content)
+        return html_content
+
+    async def docx_to_html(
+        self,
+        docx_path: str,
+        html_path: str,
+        remove_prefix: bool,
+        remove_strong: bool,
+        engine: Optional[str] = None,
+        sink: Optional[OutputSink] = None,
+        timeout: Optional[float] = None,
+        assets_dir: Optional[str] = None,
+        minify: bool = False,
+        telemetry: Optional[ConversionTelemetry] = None,
+    ) -> None:
+        if sink is None:
+            sink = DirectorySink()
+        if telemetry is None:
+            telemetry = ConversionTelemetry(docx_path, html_path)
+        images = await self._run(start_image_extractor, docx_path, html_path, sink, assets_dir)
+        try:
+            with telemetry.stage(READ_STAGE):
+                docx_content = await self._run(read_docx_bytes, docx_path)
+            telemetry.input_bytes = len(docx_content)
+
+            html_content = await self.convert_bytes(
+                docx_content,
+                remove_prefix=remove_prefix,
+                remove_strong=remove_strong,
+                input_format=os.path.splitext(docx_path)[1][1:],
+                engine=engine,
+                timeout=timeout,
+                images=images,
+                minify=minify,
+                telemetry=telemetry,
+            )
+            if images is not None:
+                await self._run(images.sources)
+        finally:
+            if images is not None:
+                await self._run(images.stop)
+        with telemetry.stage(WRITE_STAGE):
+            telemetry.output_bytes = await self._run(sink.write, html_path, html_content)
+
+    async def convert(
+        self,
+        docx_path: str,
+        html_path: str,
+        remove_prefix: bool,
+        remove_strong: bool,
+        engine: Optional[str] = None,
+        sink: Optional[OutputSink] = None,
+        timeout: Optional[float] = None,
+        assets_dir: Optional[str] = None,
+        minify: bool = False,
+    ) -> ConversionResult:
+        telemetry = ConversionTelemetry(docx_path, html_path)
+        try:
+            with telemetry.stage(TOTAL_STAGE):
+                await self.docx_to_html(
+                    docx_path,
+                    html_path,
+                    remove_prefix=remove_prefix,
+                    remove_strong=remove_strong,
+                    engine=engine,
+                    sink=sink,
+                    timeout=timeout,
+                    assets_dir=assets_dir,
+                    minify=minify,
+                    telemetry=telemetry,
+                )
+        except (RuntimeError, OSError) as msg:
+            return conversion_result(telemetry, msg)
+        return conversion_result(telemetry)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> "AsyncConverter":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.close()
+
+    async def _read_html(
+        self,
+        data: bytes,
+        input_format: str,
+        engine: str,
+        remove_prefix: bool,
+        remove_strong: bool,
+        timeout: Optional[float],
+    ) -> str:
+        native_html = await self._run(read_native_html, data, input_format, engine)
+        if native_html is not None:
+            return native_html
+        if engine == AST_ENGINE:
+            ast = await self._read_ast(data, input_format, timeout)
+            ast_data = await self._run(prepare_ast, ast, remove_prefix, remove_strong)
+            return await self._run_pandoc(ast_data, AST_FORMAT, HTML_EXTENSION, timeout)
+        return await self._run_pandoc(data, input_format, HTML_EXTENSION, timeout)
+
+    async def _read_ast(
+        self, data: bytes, input_format: str, timeout: Optional[float]
+    ) -> Dict[str, Any]:
+        cache_key, ast = await self._run(get_cached_ast, data, input_format)
+        if ast is not None:
+            return ast
+        ast_json = await self._run_pandoc(data, input_format, AST_FORMAT, timeout)
+        return await self._run(store_ast, cache_key, ast_json)
+
+    async def _run_pandoc(
+        self, data: bytes, input_format: str, output_format: str, timeout: Optional[float]
+    ) -> str:
+        backend = await self._run(get_backend)
+        async with self._semaphore:
+            if isinstance(backend, PypandocBackend):
+                if self._pandoc_path is None:
+                    self._pandoc_path = await self._run(get_pandoc_path)
+                return await run_pandoc_async(
+                    self._pandoc_path, data, input_format, output_format, timeout=timeout
+                )
+
+            cancel_event = threading.Event()
+            try:
+                return await self._run(
+                    backend.convert_bytes,
+                    data,
+                    input_format,
+                    timeout=timeout,
+                    cancel_event=cancel_event,
+                    output_format=output_format,
+                )
+            except asyncio.CancelledError:
+                cancel_event.set()
+                raise
+
+    async def _run(self, function: Callable, *args, **kwargs) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, partial(function, *args, **kwargs)
+        )
@@ -1,22 +1,51 @@
+import bisect
 import os.path
-import re
+import queue
+import threading
+import time
 import tkinter as tk
-from tkinter import filedialog, ttk
+from tkinter import filedialog, font, ttk
 from tkinter.ttk import Style
-from typing import List, Optional, Callable, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from tkinterdnd2 import TkinterDnD, DND_FILES
 from tkinterdnd2.TkinterDnD import DnDEvent
 
-from .constants import APP_WIDTH, APP_HEIGHT, MESSAGEBOX_DESTROY_TIME_MS, HTML_EXTENSION
-from .convertor import convert
-
-
-def extract_list_from_str(string_for_list: str) -> List[str]:
-    return [string for string in string_for_list.split("\n") if string != ""]
-
-
-def set_html_ext(file_path: str) -> str:
-    return f"{os.path.splitext(file_path)[0]}.{HTML_EXTENSION}"
+from .constants import (
+    APP_WIDTH,
+    APP_HEIGHT,
+    ASSETS_DIR_NAME,
+    CANCEL_POLL_INTERVAL_S,
+    GZIP_SIDECAR,
+    JSON_REPORT_FORMAT,
+    MESSAGEBOX_DESTROY_TIME_MS,
+    PROGRESS_POLL_INTERVAL_MS,
+    SCAN_CHUNK_SIZE,
+)
+from .batch import ConversionBatch, convert_batch, format_progress
+from .archives import scan_archive
+from .file_processor import is_zip_file, scan_docx_files, set_html_ext  # noqa: F401
+from .journal import BatchJournal, get_default_journal_path
+from .results import RESULT_SORT_KEYS, SKIPPED_STATUS, ConversionResult, write_report
+from .sinks import DirectorySink
+
+
+def configure_scrollbar_style(
+    background: str, active_background: str, trough_color: str
+) -> None:
+    scrollbar_style: Style = Style()
+    scrollbar_style.theme_use("clam")
+    scrollbar_style.configure(
+        "TScrollbar",
+        borderwidth=0,
+        highlightthickness=0,
+        background=background,
+        troughcolor=trough_color,
+    )
+    scrollbar_style.map(
+        "TScrollbar",
+        background=[("disabled", background), ("active", active_background)],
+        troughcolor=[("disabled", trough_color), ("active", trough_color)],
+    )
 
 
 class ColoredButton(tk.Button):
@@ -73,9 +102,6 @@ class ScrollableTextFrame(tk.Frame):
             borderwidth=0,
             highlightthickness=0,
         )
-        scrollbar_style: Style = Style()
-        scrollbar_style.theme_use("clam")
-
         self.vertical_scroll = ttk.Scrollbar(
             self,
             orient=tk.VERTICAL,
@@ -87,17 +113,8 @@ class ScrollableTextFrame(tk.Frame):
             command=self.input_text.xview,
         )
 
-        scrollbar_style.configure(
-            "TScrollbar",
-            borderwidth=0,
-            highlightthickness=0,
-            background=self.SCROLLBAR_BG,
-            troughcolor=self.SCROLLBAR_TROUGH_BG,
-        )
-        scrollbar_style.map(
-            "TScrollbar",
-            background=[("disabled", self.SCROLLBAR_BG), ("active", self.SCROLLBAR_ACTIVE_BG)],
-            troughcolor=[("disabled", self.SCROLLBAR_TROUGH_BG), ("active", self.SCROLLBAR_TROUGH_BG)],
+        configure_scrollbar_style(
+            self.SCROLLBAR_BG, self.SCROLLBAR_ACTIVE_BG, self.SCROLLBAR_TROUGH_BG
         )
 
         self.input_text.configure(
@@ -118,6 +135,115 @@ class ScrollableTextFrame(tk.Frame):
         self.grid_columnconfigure(0, weight=1)
 
 
+class PathListView(tk.Frame):
+    LIST_FIELD_WIDTH = 20
+    LIST_FIELD_HEIGHT = 20
+    LIST_FIELD_FG = "white"
+    LIST_FIELD_BG = "#012840"
+    WHEEL_SCROLL_ROWS = 3
+
+    def __init__(
+        self,
+        get_path: Callable[[int], str],
+        get_count: Callable[[], int],
+        _on_double_click: Optional[Callable] = None,
+        frame_padding: Optional[Tuple[int, int]] = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(*args, **kwargs)
+        self.get_path = get_path
+        self.get_count = get_count
+        self.padding = frame_padding
+        self.first_row = 0
+        self.visible_rows = self.LIST_FIELD_HEIGHT
+        self.path_list = tk.Listbox(
+            self,
+            width=self.LIST_FIELD_WIDTH,
+            height=self.LIST_FIELD_HEIGHT,
+            activestyle=tk.NONE,
+            exportselection=False,
+            background=self.LIST_FIELD_BG,
+            foreground=self.LIST_FIELD_FG,
+            borderwidth=0,
+            highlightthickness=0,
+            selectborderwidth=0,
+        )
+        self.vertical_scroll = ttk.Scrollbar(
+            self,
+            orient=tk.VERTICAL,
+            command=self.on_scroll,
+        )
+        self.horizontal_scroll = ttk.Scrollbar(
+            self,
+            orient=tk.HORIZONTAL,
+            command=self.path_list.xview,
+        )
+        configure_scrollbar_style(
+            ScrollableTextFrame.SCROLLBAR_BG,
+            ScrollableTextFrame.SCROLLBAR_ACTIVE_BG,
+            ScrollableTextFrame.SCROLLBAR_TROUGH_BG,
+        )
+        self.path_list.configure(xscrollcommand=self.horizontal_scroll.set)
+        self._place_elements()
+
+        self.path_list.bind("<Configure>", self._on_resize)
+        self.path_list.bind("<MouseWheel>", self._on_mouse_wheel)
+        self.path_list.bind("<Button-4>", self._on_mouse_wheel)
+        self.path_list.bind("<Button-5>", self._on_mouse_wheel)
+        if _on_double_click:
+            self.path_list.bind("<Double-Button-1>", _on_double_click)
+        self.refresh()
+
+    def refresh(self) -> None:
+        count = self.get_count()
+        self.first_row = max(min(self.first_row, count - self.visible_rows), 0)
+        last_row = min(self.first_row + self.visible_rows, count)
+        self.path_list.delete(0, tk.END)
+        if last_row > self.first_row:
+            self.path_list.insert(
+                tk.END, *(self.get_path(index) for index in range(self.first_row, last_row))
+            )
+        if count:
+            self.vertical_scroll.set(self.first_row / count, last_row / count)
+        else:
+            self.vertical_scroll.set(0.0, 1.0)
+
+    def on_scroll(self, action: str, value: str, unit: Optional[str] = None) -> None:
+        if action == tk.MOVETO:
+            self.first_row = int(float(value) * self.get_count())
+        elif action == tk.SCROLL:
+            rows = self.visible_rows if unit == tk.PAGES else 1
+            self.first_row += int(value) * rows
+        self.refresh()
+
+    def _on_mouse_wheel(self, event: tk.Event) -> None:
+        if event.num == 4 or getattr(event, "delta", 0) > 0:
+            self.on_scroll(tk.SCROLL, str(-self.WHEEL_SCROLL_ROWS), tk.UNITS)
+        else:
+            self.on_scroll(tk.SCROLL, str(self.WHEEL_SCROLL_ROWS), tk.UNITS)
+
+    def _on_resize(self, event: tk.Event) -> None:
+        row_height = (
+            font.Font(font=self.path_list.cget("font")).metrics("linespace")
+            + 1
+            + 2 * int(self.path_list.cget("selectborderwidth"))
+        )
+        visible_rows = max(event.height // row_height, 1)
+        if visible_rows != self.visible_rows:
+            self.visible_rows = visible_rows
+            self.refresh()
+
+    def _place_elements(self) -> None:
+        padx, pady = self.padding if self.padding else (5, 0)
+        self.configure(padx=padx, pady=pady)
+        self.path_list.grid_configure(row=0, column=0, sticky=tk.NSEW)
+        self.vertical_scroll.grid_configure(row=0, column=1, sticky=tk.NS)
+        self.horizontal_scroll.grid_configure(row=1, column=0, sticky=tk.EW)
+        self.grid_rowconfigure(0, weight=1)
+        self.grid_columnconfigure(0, weight=1)
+
+
 class ToplevelMessagebox(tk.Toplevel):
     TEXT_FIELD_WIDTH = 60
     TEXT_FIELD_HEIGHT = 10
@@ -181,12 +307,204 @@ class ToplevelMessagebox(tk.Toplevel):
         self.wait_window()
 
 
+class ResultsView(tk.Toplevel):
+    COLUMNS = ("file", "status", "duration", "size", "error")
+    COLUMN_WIDTHS = (220, 70, 70, 80, 220)
+    TABLE_HEIGHT = 15
+    FAILURE_TAG = "failure"
+    FAILURE_FG = "#e74c3c"
+    TEXT_FG = "white"
+
+    def __init__(self, bg_color: str, title: Optional[str] = None) -> None:
+        super().__init__()
+        self._bg_color = bg_color
+        self.results: Dict[int, ConversionResult] = {}
+        self.succeeded = 0
+        self.failed = 0
+        self.skipped = 0
+        self.sort_column: Optional[str] = None
+        self.sort_reverse = False
+        self._row_keys: List[Any] = []
+        self.failures_only = tk.BooleanVar(self, value=False)
+        self.configure(background=self._bg_color)
+        self.title(title)
+        self.protocol("WM_DELETE_WINDOW", self.withdraw)
+
+        self._table_frame = tk.Frame(self, background=self._bg_color)
+        self.table = ttk.Treeview(
+            self._table_frame,
+            columns=self.COLUMNS,
+            show="headings",
+            height=self.TABLE_HEIGHT,
+            selectmode=tk.BROWSE,
+        )
+        for column, width in zip(self.COLUMNS, self.COLUMN_WIDTHS):
+            self.table.heading(
+                column,
+                text=column.capitalize(),
+                command=(lambda column=column: self.sort_by(column))
+                if column in RESULT_SORT_KEYS
+                else "",
+            )
+            self.table.column(
+                column,
+                width=width,
+                anchor=tk.E if column in ("duration", "size") else tk.W,
+                stretch=column in ("file", "error"),
+            )
+        self.table.tag_configure(self.FAILURE_TAG, foreground=self.FAILURE_FG)
+        self.vertical_scroll = ttk.Scrollbar(
+            self._table_frame,
+            orient=tk.VERTICAL,
+            command=self.table.yview,
+        )
+        self.table.configure(yscrollcommand=self.vertical_scroll.set)
+
+        self._control_frame = tk.Frame(self, background=self._bg_color)
+        self.summary_label = tk.Label(
+            self._control_frame,
+            background=self._bg_color,
+            foreground=self.TEXT_FG,
+            anchor=tk.W,
+        )
+        self.failures_only_button = tk.Checkbutton(
+            self._control_frame,
+            text="Failures only",
+            variable=self.failures_only,
+            command=self.refresh,
+            background=self._bg_color,
+            foreground=self.TEXT_FG,
+            activebackground=self._bg_color,
+            activeforeground=self.TEXT_FG,
+            selectcolor=self._bg_color,
+            highlightthickness=0,
+        )
+        self.export_button = ColoredButton(
+            master=self._control_frame, text="Export", command=self.on_export
+        )
+        self._place_elements()
+        self._update_summary()
+
+    def add_result(self, index: int, result: ConversionResult) -> None:
+        self.results[index] = result
+        self._count(result)
+        if self._is_visible(result):
+            self._insert_row(index)
+        self._update_summary()
+
+    def clear(self) -> None:
+        self.results.clear()
+        self.succeeded = self.failed = self.skipped = 0
+        self._row_keys = []
+        self.table.delete(*self.table.get_children())
+        self._update_summary()
+
+    def sort_by(self, column: str) -> None:
+        if column == self.sort_column:
+            self.sort_reverse = not self.sort_reverse
+        else:
+            self.sort_column = column
+            self.sort_reverse = False
+        self.refresh()
+
+    def refresh(self) -> None:
+        self.table.delete(*self.table.get_children())
+        indexes = sorted(
+            (index for index, result in self.results.items() if self._is_visible(result)),
+            key=self._get_sort_key,
+        )
+        self._row_keys = [self._get_sort_key(index) for index in indexes]
+        if self.sort_reverse:
+            indexes.reverse()
+        for index in indexes:
+            self._insert_values(tk.END, index)
+
+    def visible_results(self) -> List[ConversionResult]:
+        return [self.results[int(row_id)] for row_id in self.table.get_children()]
+
+    def on_export(self) -> None:
+        report_path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=f".{JSON_REPORT_FORMAT}",
+            filetypes=(("JSON", "*.json"), ("CSV", "*.csv")),
+        )
+        if not report_path:
+            return None
+        try:
+            write_report(self.visible_results(), report_path)
+        except OSError as exc:
+            ToplevelMessagebox(
+                title="CONVERTER INFO",
+                text=f"Cannot write {report_path}: {exc}",
+                bg_color=self._bg_color,
+            )
+
+    def _is_visible(self, result: ConversionResult) -> bool:
+        return not (self.failures_only.get() and result.success)
+
+    def _get_sort_key(self, index: int) -> Any:
+        if self.sort_column is None:
+            return index
+        return RESULT_SORT_KEYS[self.sort_column](self.results[index])
+
+    def _insert_row(self, index: int) -> None:
+        sort_key = self._get_sort_key(index)
+        position = bisect.bisect_right(self._row_keys, sort_key)
+        self._row_keys.insert(position, sort_key)
+        if self.sort_reverse:
+            position = len(self._row_keys) - 1 - position
+        self._insert_values(position, index)
+
+    def _insert_values(self, position: Any, index: int) -> None:
+        result = self.results[index]
+        self.table.insert(
+            "",
+            position,
+            iid=str(index),
+            values=(
+                os.path.basename(result.docx_path),
+                result.status,
+                f"{result.duration_s:.2f} s",
+                f"{result.output_bytes / 1024:.1f} KB",
+                result.error or "",
+            ),
+            tags=() if result.success else (self.FAILURE_TAG,),
+        )
+
+    def _count(self, result: ConversionResult) -> None:
+        if result.status == SKIPPED_STATUS:
+            self.skipped += 1
+        elif result.success:
+            self.succeeded += 1
+        else:
+            self.failed += 1
+
+    def _update_summary(self) -> None:
+        self.summary_label.configure(
+            text=f"{len(self.results)} files | {self.succeeded} converted | "
+            f"{self.skipped} skipped | {self.failed} failed"
+        )
+
+    def _place_elements(self) -> None:
+        self._table_frame.pack_configure(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.table.grid_configure(row=0, column=0, sticky=tk.NSEW)
+        self.vertical_scroll.grid_configure(row=0, column=1, sticky=tk.NS)
+        self._table_frame.grid_rowconfigure(0, weight=1)
+        self._table_frame.grid_columnconfigure(0, weight=1)
+        self._control_frame.pack_configure(fill=tk.X, padx=5, pady=(0, 5))
+        self.summary_label.pack_configure(side=tk.LEFT, fill=tk.X, expand=True)
+        self.export_button.pack_configure(side=tk.RIGHT, padx=(5, 0))
+        self.failures_only_button.pack_configure(side=tk.RIGHT)
+
+
 class DocxHtmlConverter(TkinterDnD.Tk):
     MAIN_BG_COLOR = "black"
     LABEL_COLOR = "white"
 
-    def __init__(self) -> None:
+    def __init__(self, max_workers: Optional[int] = None) -> None:
         super().__init__()
+        self.max_workers = max_workers
+        self.batch = ConversionBatch()
         self._set_config()
 
         self.action_frame = tk.Frame(self, background=self.MAIN_BG_COLOR)
@@ -206,23 +524,20 @@ class DocxHtmlConverter(TkinterDnD.Tk):
         )
         self.right_label.grid_configure(row=0, column=1)
 
-        self.left_input_frame = ScrollableTextFrame(
+        self.left_input_frame = PathListView(
             master=self.action_frame,
-            _on_double_click=lambda event: self.on_left_input_double_click(
-                event,
-                self.left_input_frame.input_text,
-                self.right_input_frame.input_text,
-            ),
+            get_path=self.batch.input_path,
+            get_count=lambda: len(self.batch),
+            _on_double_click=self.on_left_input_double_click,
             background=self.MAIN_BG_COLOR,
         )
         self.left_input_frame.grid_configure(row=1, column=0, sticky=tk.NSEW)
 
-        self.right_input_frame = ScrollableTextFrame(
+        self.right_input_frame = PathListView(
             master=self.action_frame,
-            _on_double_click=lambda event: self.on_right_input_double_click(
-                event,
-                self.right_input_frame.input_text,
-            ),
+            get_path=self.batch.output_path,
+            get_count=lambda: len(self.batch),
+            _on_double_click=self.on_right_input_double_click,
             background=self.MAIN_BG_COLOR,
         )
         self.right_input_frame.grid_configure(row=1, column=1, sticky=tk.NSEW)
@@ -245,97 +560,255 @@ class DocxHtmlConverter(TkinterDnD.Tk):
             row=2, column=1, sticky=tk.NSEW, padx=5, pady=10
         )
 
+        self.progress_bar = ttk.Progressbar(
+            self.action_frame,
+            orient=tk.HORIZONTAL,
+            mode="determinate",
+        )
+        self.progress_bar.grid_configure(
+            row=3, column=0, columnspan=2, sticky=tk.EW, padx=5
+        )
+
+        self.progress_label = tk.Label(
+            self.action_frame,
+            background=self.MAIN_BG_COLOR,
+            foreground=self.LABEL_COLOR,
+            anchor=tk.W,
+        )
+        self.progress_label.grid_configure(row=4, column=0, sticky=tk.NSEW, padx=5)
+
+        self.cancel_button = ColoredButton(
+            master=self.action_frame,
+            text="Cancel",
+            command=self.on_cancel,
+            state=tk.DISABLED,
+        )
+        self.cancel_button.grid_configure(
+            row=4, column=1, sticky=tk.NSEW, padx=5, pady=10
+        )
+
         self.action_frame.grid_columnconfigure(0, weight=1, uniform="equal")
         self.action_frame.grid_columnconfigure(1, weight=1, uniform="equal")
         self.action_frame.grid_rowconfigure(0, weight=1)
         self.action_frame.grid_rowconfigure(1, weight=20)
         self.action_frame.grid_rowconfigure(2, weight=1)
+        self.action_frame.grid_rowconfigure(3, weight=1)
+        self.action_frame.grid_rowconfigure(4, weight=1)
+
+        self._result_queue: "queue.Queue[Optional[Tuple[int, ConversionResult]]]" = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._convert_thread: Optional[threading.Thread] = None
+        self._convert_results: List[Optional[ConversionResult]] = []
+        self._converted_count = 0
+        self._batch_error: Optional[str] = None
+        self._results_view: Optional[ResultsView] = None
+        self._convert_started_at = 0.0
+        self._scan_threads: List[threading.Thread] = []
+        self._scan_stop_event = threading.Event()
 
         self.remove_prefix = tk.BooleanVar(self, value=True)
         self.bind("<Control-z>", self.on_remove_prefix_shortcut_press)
         self.remove_strong = tk.BooleanVar(self, value=True)
         self.bind("<Control-x>", self.on_remove_strong_shortcut_press)
+        self.extract_images = tk.BooleanVar(self, value=False)
+        self.bind("<Control-i>", self.on_extract_images_shortcut_press)
+        self.compact_output = tk.BooleanVar(self, value=False)
+        self.bind("<Control-m>", self.on_compact_output_shortcut_press)
         self._set_dnd()
 
     def on_convert(self) -> None:
-        input_paths = extract_list_from_str(
-            self.left_input_frame.input_text.get(1.0, tk.END)
-        )
-        output_paths = extract_list_from_str(
-            self.right_input_frame.input_text.get(1.0, tk.END)
-        )
-
-        if len(input_paths) != len(output_paths):
+        if not self.batch and not self.is_scanning():
             ToplevelMessagebox(
-                title="ERROR",
-                text="The number of files to convert is not equal to the number of converted files!\n"
-                "Clear the inputs and try again.",
+                title="CONVERTER INFO",
+                text="Nothing to convert!",
                 bg_color=self.MAIN_BG_COLOR,
             )
             return None
 
-        remove_prefix_flag = self.remove_prefix.get()
-        remove_strong_flag = self.remove_strong.get()
-        convert_status_messages = []
-        for index, (input_path, output_path) in enumerate(
-            zip(input_paths, output_paths), 1
-        ):
-            message = convert(
-                input_path,
-                output_path,
-                remove_prefix=remove_prefix_flag,
-                remove_strong=remove_strong_flag
-            )
-            convert_status_messages.append(
-                f"{index}. {message}"
-            )
+        if self._convert_thread is not None:
+            return None
 
-        ToplevelMessagebox(
-            title="CONVERTER INFO",
-            text="\n".join(convert_status_messages)
-            if convert_status_messages
-            else "Nothing to convert!",
-            bg_color=self.MAIN_BG_COLOR,
+        self._result_queue = queue.Queue()
+        self._cancel_event = threading.Event()
+        self._convert_results = []
+        self._batch_error = None
+        self._convert_started_at = time.monotonic()
+        self._converted_count = 0
+        if self._results_view is None:
+            self._results_view = ResultsView(
+                title="CONVERSION RESULTS", bg_color=self.MAIN_BG_COLOR
+            )
+        else:
+            self._results_view.clear()
+            self._results_view.deiconify()
+        self._set_converting_state(True)
+        self._update_progress(0)
+
+        self._convert_thread = threading.Thread(
+            target=self._run_batch,
+            args=(
+                self._iter_path_pairs(self._cancel_event),
+                self.remove_prefix.get(),
+                self.remove_strong.get(),
+                self.extract_images.get(),
+                self.compact_output.get(),
+            ),
+            daemon=True,
         )
+        self._convert_thread.start()
+        self.after(PROGRESS_POLL_INTERVAL_MS, self._poll_convert_results)
+
+    def on_cancel(self) -> None:
+        self._cancel_event.set()
+        self.cancel_button.configure(state=tk.DISABLED)
+
+    def _iter_path_pairs(self, cancel_event: threading.Event) -> Iterator[Tuple[str, str]]:
+        index = 0
+        while not cancel_event.is_set():
+            if index < len(self.batch):
+                yield self.batch.path_pair(index)
+                index += 1
+            elif not self.is_scanning():
+                if index >= len(self.batch):
+                    return
+            else:
+                cancel_event.wait(CANCEL_POLL_INTERVAL_S)
 
-    def on_left_input_double_click(
+    def _run_batch(
         self,
-        event: tk.Event,
-        path_input: tk.Text,
-        path_output: tk.Text,
+        path_pairs: Iterator[Tuple[str, str]],
+        remove_prefix_flag: bool,
+        remove_strong_flag: bool,
+        extract_images_flag: bool,
+        compact_output_flag: bool,
     ) -> None:
-        file_list = filedialog.askopenfiles()
-        file_name_list = [file_path.name for file_path in file_list]
-        input_data = path_input.get(1.0, tk.END)
-        input_data_list = extract_list_from_str(input_data)
-        input_path_file_list = [
-            path for path in file_name_list if path not in input_data_list
-        ]
-        output_path_file_list = [
-            set_html_ext(path) for path in file_name_list if path not in input_data_list
-        ]
-        self._insert_data(path_input, input_path_file_list)
-        self._insert_data(path_output, output_path_file_list)
+        try:
+            with BatchJournal(get_default_journal_path()) as journal:
+                results = convert_batch(
+                    path_pairs,
+                    remove_prefix=remove_prefix_flag,
+                    remove_strong=remove_strong_flag,
+                    max_workers=self.max_workers,
+                    on_result=lambda index, result: self._result_queue.put((index, result)),
+                    cancel_event=self._cancel_event,
+                    journal=journal,
+                    assets_dir=ASSETS_DIR_NAME if extract_images_flag else None,
+                    sink=DirectorySink(sidecars=(GZIP_SIDECAR,)) if compact_output_flag else None,
+                    minify=compact_output_flag,
+                )
+                if not self._cancel_event.is_set() and all(result.success for result in results):
+                    journal.remove()
+        except Exception as exc:
+            self._batch_error = str(exc)
+        finally:
+            self._result_queue.put(None)
+
+    def _poll_convert_results(self) -> None:
+        finished = False
+        while True:
+            try:
+                result = self._result_queue.get_nowait()
+            except queue.Empty:
+                break
+            if result is None:
+                finished = True
+                break
+            index, conversion_result = result
+            if index >= len(self._convert_results):
+                self._convert_results.extend([None] * (index + 1 - len(self._convert_results)))
+            self._convert_results[index] = conversion_result
+            self._converted_count += 1
+            self._results_view.add_result(index, conversion_result)
+
+        self._update_progress(self._converted_count)
+        if not finished:
+            self.after(PROGRESS_POLL_INTERVAL_MS, self._poll_convert_results)
+            return None
 
-    def on_right_input_double_click(
-        self,
-        event: tk.Event,
-        path_output: tk.Text,
-    ) -> None:
-        input_data = path_output.get(1.0, tk.END)
-        input_data_list = extract_list_from_str(input_data)
+        self._convert_thread = None
+        self._set_converting_state(False)
+        self._results_view.deiconify()
+        self._results_view.lift()
+        if self._batch_error is not None:
+            ToplevelMessagebox(
+                title="CONVERTER INFO",
+                text=f"The conversion stopped before all files were converted: {self._batch_error}",
+                bg_color=self.MAIN_BG_COLOR,
+            )
+
+    def _update_progress(self, done: int) -> None:
+        total = max(len(self._convert_results), len(self.batch))
+        self.progress_bar.configure(maximum=max(total, 1), value=done)
+        self.progress_label.configure(
+            text=format_progress(
+                done, total, time.monotonic() - self._convert_started_at
+            )
+        )
+
+    def _set_converting_state(self, converting: bool) -> None:
+        idle_state = tk.DISABLED if converting else tk.NORMAL
+        self.convert_button.configure(state=idle_state)
+        self.clear_button.configure(state=idle_state)
+        self.cancel_button.configure(state=tk.NORMAL if converting else tk.DISABLED)
+
+    def on_left_input_double_click(self, event: tk.Event) -> None:
+        self.add_paths(filedialog.askopenfilenames())
+
+    def on_right_input_double_click(self, event: tk.Event) -> None:
         dir_path = filedialog.askdirectory()
-        if not dir_path or input_data == "\n":
+        if not dir_path:
             return None
-        input_data_list = list(
-            map(
-                lambda full_path: self._get_new_path(full_path, dir_path),
-                input_data_list,
-            )
+        self.batch.set_output_dir(dir_path)
+        self.right_input_frame.refresh()
+
+    def add_paths(self, file_paths: Iterable[str]) -> None:
+        docx_paths = []
+        for file_path in file_paths:
+            if is_zip_file(file_path):
+                self.add_dir(file_path)
+            else:
+                docx_paths.append(file_path)
+        if self.batch.add(docx_paths):
+            self._refresh_path_lists()
+
+    def add_dir(self, dir_path: str) -> None:
+        scan_thread = threading.Thread(
+            target=self._run_scan,
+            args=(dir_path, self._scan_stop_event),
+            daemon=True,
         )
-        path_output.configure(state=tk.NORMAL)
-        path_output.delete(1.0, tk.END)
-        self._insert_data(path_output, input_data_list)
+        self._scan_threads.append(scan_thread)
+        scan_thread.start()
+        if len(self._scan_threads) == 1:
+            self.after(PROGRESS_POLL_INTERVAL_MS, self._poll_scans)
+
+    def is_scanning(self) -> bool:
+        return any(scan_thread.is_alive() for scan_thread in self._scan_threads)
+
+    def _run_scan(self, dir_path: str, stop_event: threading.Event) -> None:
+        docx_paths: List[str] = []
+        scanner = scan_archive(dir_path) if is_zip_file(dir_path) else scan_docx_files(dir_path)
+        for docx_path in scanner:
+            if stop_event.is_set():
+                return None
+            docx_paths.append(docx_path)
+            if len(docx_paths) >= SCAN_CHUNK_SIZE:
+                self.batch.add(docx_paths, base_dir=dir_path)
+                docx_paths = []
+        if not stop_event.is_set():
+            self.batch.add(docx_paths, base_dir=dir_path)
+
+    def _poll_scans(self) -> None:
+        self._scan_threads = [
+            scan_thread for scan_thread in self._scan_threads if scan_thread.is_alive()
+        ]
+        self._refresh_path_lists()
+        if self._scan_threads:
+            self.after(PROGRESS_POLL_INTERVAL_MS, self._poll_scans)
+
+    def _refresh_path_lists(self) -> None:
+        self.left_input_frame.refresh()
+        self.right_input_frame.refresh()
 
     def _set_config(self) -> None:
         self.title("DOCX-HTML CONVERTER")
@@ -345,14 +818,7 @@ class DocxHtmlConverter(TkinterDnD.Tk):
 
     def _set_dnd(self) -> None:
         self.drop_target_register(DND_FILES)
-        self.dnd_bind(
-            "<<Drop>>",
-            lambda event: self.on_drop(
-                event,
-                self.left_input_frame.input_text,
-                self.right_input_frame.input_text,
-            ),
-        )
+        self.dnd_bind("<<Drop>>", self.on_drop)
 
     def on_remove_prefix_shortcut_press(self, event: tk.Event) -> None:
         current_value = self.remove_prefix.get()
@@ -374,48 +840,40 @@ class DocxHtmlConverter(TkinterDnD.Tk):
             bg_color=self.MAIN_BG_COLOR,
         )
 
-    def on_drop(
-        self,
-        event: DnDEvent,
-        path_input: tk.Text,
-        path_output: tk.Text,
-    ) -> None:
-        file_paths = event.data
-        curly_paths = re.findall(r"{([^}]*)}", file_paths)
-        cleaned_str = re.sub(r"{[^}]*}", "", file_paths)
-        space_separated_paths = cleaned_str.split()
-        file_paths = space_separated_paths + curly_paths
-
-        input_field_content = path_input.get(1.0, tk.END)
-        input_field_content_list = extract_list_from_str(input_field_content)
-        output_paths = []
-        temp_initial_paths = file_paths.copy()
-        for docx_path in temp_initial_paths:
-            if docx_path in input_field_content_list:
-                file_paths.remove(docx_path)
+    def on_extract_images_shortcut_press(self, event: tk.Event) -> None:
+        current_value = self.extract_images.get()
+        self.extract_images.set(not current_value)
+        ToplevelMessagebox(
+            title="IMAGE EXTRACTION STATUS",
+            text=f"You have changed the image extraction status to {not current_value}!",
+            destroy_timeout=MESSAGEBOX_DESTROY_TIME_MS,
+            bg_color=self.MAIN_BG_COLOR,
+        )
+
+    def on_compact_output_shortcut_press(self, event: tk.Event) -> None:
+        current_value = self.compact_output.get()
+        self.compact_output.set(not current_value)
+        ToplevelMessagebox(
+            title="COMPACT OUTPUT STATUS",
+            text=f"You have changed the compact output status to {not current_value}!",
+            destroy_timeout=MESSAGEBOX_DESTROY_TIME_MS,
+            bg_color=self.MAIN_BG_COLOR,
+        )
+
+    def on_drop(self, event: DnDEvent) -> None:
+        file_paths = []
+        for path in self.tk.splitlist(event.data):
+            if os.path.isdir(path):
+                self.add_dir(path)
             else:
-                output_paths.append(set_html_ext(docx_path))
-        self._insert_data(path_input, file_paths)
-        self._insert_data(path_output, output_paths)
+                file_paths.append(path)
+        self.add_paths(file_paths)
 
     def on_clear(self) -> None:
-        self.left_input_frame.input_text.configure(state=tk.NORMAL)
-        self.right_input_frame.input_text.configure(state=tk.NORMAL)
-        self.left_input_frame.input_text.delete(1.0, tk.END)
-        self.right_input_frame.input_text.delete(1.0, tk.END)
-        self.left_input_frame.input_text.configure(state=tk.DISABLED)
-        self.right_input_frame.input_text.configure(state=tk.DISABLED)
-
-    @staticmethod
-    def _insert_data(text_input: tk.Text, file_paths: List[str]) -> None:
-        text_input.configure(state=tk.NORMAL)
-        text_input.insert(tk.END, "\n".join(file_paths + [""]))
-        text_input.configure(state=tk.DISABLED)
-
-    @staticmethod
-    def _get_new_path(initial_full_path: str, new_dir_path: str) -> str:
-        file_name = os.path.basename(initial_full_path)
-        return os.path.join(new_dir_path, file_name)
+        self._scan_stop_event.set()
+        self._scan_stop_event = threading.Event()
+        self.batch.clear()
+        self._refresh_path_lists()
 
     def start(self) -> None:
         self.mainloop()
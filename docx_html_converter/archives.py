@@ -0,0 +1,97 @@
+import os
+import posixpath
+from typing import IO, Iterator, Optional, Tuple
+
+from .file_processor import is_docx_file, is_zip_file
+
+UNSAFE_MEMBER_PARTS = ("", ".", "..")
+
+
+def split_archive_path(path: str) -> Optional[Tuple[str, str]]:
+    head, tail = os.path.split(path)
+    member_parts = [tail]
+    while head and tail:
+        if is_zip_file(head) and os.path.isfile(head):
+            return head, "/".join(reversed(member_parts))
+        head, tail = os.path.split(head)
+        member_parts.append(tail)
+    return None
+
+
+def is_safe_member_name(member_name: str) -> bool:
+    return not any(
+        part in UNSAFE_MEMBER_PARTS
+        or os.sep in part
+        or (os.altsep is not None and os.altsep in part)
+        or os.path.splitdrive(part)[0]
+        for part in member_name.split("/")
+    )
+
+
+def scan_archive(archive_path: str) -> Iterator[str]:
+    import zipfile
+
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            member_names = sorted(
+                info.filename
+                for info in archive.infolist()
+                if not info.is_dir()
+                and is_docx_file(posixpath.basename(info.filename))
+                and is_safe_member_name(info.filename)
+            )
+    except (OSError, zipfile.BadZipFile):
+        return None
+    for member_name in member_names:
+        yield os.path.join(archive_path, *member_name.split("/"))
+
+
+def get_archive_output_dir(archive_path: str, output_dir: Optional[str] = None) -> str:
+    archive_path = os.path.normpath(archive_path)
+    if output_dir is None:
+        output_dir = os.path.dirname(archive_path)
+    return os.path.join(output_dir, os.path.splitext(os.path.basename(archive_path))[0])
+
+
+def open_docx(docx_path: str) -> IO[bytes]:
+    archive_member = split_archive_path(docx_path)
+    if archive_member is None:
+        return open(docx_path, "rb")
+
+    import zipfile
+
+    archive_path, member_name = archive_member
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            return archive.open(member_name)
+    except KeyError as exc:
+        raise FileNotFoundError(f"{member_name} is not in {archive_path}") from exc
+    except zipfile.BadZipFile as exc:
+        raise RuntimeError(f"{archive_path} is not a valid zip archive: {exc}") from exc
+
+
+def read_docx_bytes(docx_path: str) -> bytes:
+    try:
+        with open_docx(docx_path) as f:
+            return f.read()
+    except FileNotFoundError as exc:
+        raise RuntimeError(f"{docx_path} does not exist") from exc
+    except OSError as exc:
+        raise RuntimeError(f"Cannot read {docx_path}: {exc.strerror or exc}") from exc
+
+
+def stat_docx(docx_path: str) -> Tuple[int, int]:
+    archive_member = split_archive_path(docx_path)
+    if archive_member is None:
+        stat = os.stat(docx_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    import zipfile
+
+    archive_path, member_name = archive_member
+    try:
+        with zipfile.ZipFile(archive_path) as archive:
+            info = archive.getinfo(member_name)
+    except (KeyError, zipfile.BadZipFile) as exc:
+        raise FileNotFoundError(f"{member_name} is not in {archive_path}") from exc
+    return info.file_size, os.stat(archive_path).st_mtime_ns
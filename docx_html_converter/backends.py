@@ -0,0 +1,213 @@
+import atexit
+import os
+import subprocess
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .constants import (
+    BACKEND_ENV_VAR,
+    CANCEL_POLL_INTERVAL_S,
+    HTML_EXTENSION,
+    PYPANDOC_BACKEND,
+    SERVER_BACKEND,
+)
+
+
+class ConversionTimeout(RuntimeError):
+    pass
+
+
+class ConversionCancelled(RuntimeError):
+    pass
+
+
+def run_process(
+    args: List[str],
+    data: bytes,
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Tuple[int, bytes, bytes]:
+    process = subprocess.Popen(
+        args,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        creationflags=getattr(subprocess, "CREATE_NO_WINDOW", 0),
+    )
+    deadline = None if timeout is None else time.monotonic() + timeout
+    input_data: Optional[bytes] = data
+    while True:
+        wait_timeout = None if cancel_event is None else CANCEL_POLL_INTERVAL_S
+        if deadline is not None:
+            remaining = max(deadline - time.monotonic(), 0.0)
+            wait_timeout = remaining if wait_timeout is None else min(wait_timeout, remaining)
+        try:
+            stdout, stderr = process.communicate(input_data, timeout=wait_timeout)
+            return process.returncode, stdout, stderr
+        except subprocess.TimeoutExpired:
+            input_data = None
+        except BaseException:
+            process.kill()
+            process.wait()
+            raise
+
+        program_name = os.path.basename(args[0])
+        if cancel_event is not None and cancel_event.is_set():
+            error: RuntimeError = ConversionCancelled(f"{program_name} was cancelled")
+        elif deadline is not None and time.monotonic() >= deadline:
+            error = ConversionTimeout(f"{program_name} did not finish within {timeout:g} s")
+        else:
+            continue
+        process.kill()
+        process.communicate()
+        raise error
+
+
+def get_pandoc_args(pandoc_path: str, input_format: str, output_format: str) -> List[str]:
+    return [pandoc_path, f"--from={input_format}", f"--to={output_format}"]
+
+
+def get_pandoc_output(returncode: int, stdout: bytes, stderr: bytes) -> str:
+    if returncode != 0:
+        raise RuntimeError(
+            f'Pandoc died with exitcode "{returncode}" during conversion: '
+            f'{stderr.decode("utf-8", errors="replace")}'
+        )
+    return stdout.decode("utf-8", errors="replace")
+
+
+class PandocBackend(ABC):
+    name = ""
+
+    def convert_file(
+        self,
+        docx_path: str,
+        input_format: str,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> str:
+        with open(docx_path, "rb") as f:
+            return self.convert_bytes(
+                f.read(), input_format, timeout=timeout, cancel_event=cancel_event
+            )
+
+    @abstractmethod
+    def convert_bytes(
+        self,
+        data: bytes,
+        input_format: str,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+        output_format: str = HTML_EXTENSION,
+    ) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def version(self) -> str:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class PypandocBackend(PandocBackend):
+    name = PYPANDOC_BACKEND
+
+    def convert_file(
+        self,
+        docx_path: str,
+        input_format: str,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> str:
+        if timeout is not None or cancel_event is not None:
+            return super().convert_file(
+                docx_path, input_format, timeout=timeout, cancel_event=cancel_event
+            )
+
+        import pypandoc
+
+        return pypandoc.convert_file(docx_path, HTML_EXTENSION, format=input_format)
+
+    def convert_bytes(
+        self,
+        data: bytes,
+        input_format: str,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+        output_format: str = HTML_EXTENSION,
+    ) -> str:
+        import pypandoc
+
+        returncode, stdout, stderr = run_process(
+            get_pandoc_args(pypandoc.get_pandoc_path(), input_format, output_format),
+            data,
+            timeout=timeout,
+            cancel_event=cancel_event,
+        )
+        return get_pandoc_output(returncode, stdout, stderr)
+
+    def version(self) -> str:
+        import pypandoc
+
+        return pypandoc.get_pandoc_version()
+
+
+def _create_server_backend() -> PandocBackend:
+    from .pandoc_server import PandocServerBackend
+
+    return PandocServerBackend()
+
+
+BACKENDS: Dict[str, Callable[[], PandocBackend]] = {
+    PYPANDOC_BACKEND: PypandocBackend,
+    SERVER_BACKEND: _create_server_backend,
+}
+
+_backend: Optional[PandocBackend] = None
+_backend_lock = threading.Lock()
+
+
+def create_backend(name: str) -> PandocBackend:
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(
+            f"Unknown pandoc backend {name!r}, expected one of: {', '.join(BACKENDS)}"
+        ) from None
+
+
+def get_backend() -> PandocBackend:
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            _backend = create_backend(os.environ.get(BACKEND_ENV_VAR, PYPANDOC_BACKEND))
+        return _backend
+
+
+def set_backend(backend: PandocBackend) -> None:
+    global _backend
+    with _backend_lock:
+        previous_backend, _backend = _backend, backend
+    if previous_backend is not None and previous_backend is not backend:
+        previous_backend.close()
+
+
+def swap_backend(backend: Optional[PandocBackend]) -> Optional[PandocBackend]:
+    global _backend
+    with _backend_lock:
+        previous_backend, _backend = _backend, backend
+    return previous_backend
+
+
+def close_backend() -> None:
+    global _backend
+    with _backend_lock:
+        backend, _backend = _backend, None
+    if backend is not None:
+        backend.close()
+
+
+atexit.register(close_backend)
@@ -0,0 +1,283 @@
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ThreadPoolExecutor, wait
+from functools import partial
+from itertools import chain
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .archives import get_archive_output_dir
+from .constants import BATCH_PENDING_PER_WORKER, CANCEL_POLL_INTERVAL_S, POSTPROCESS_VERSION
+from .convertor import (
+    SKIPPED_MESSAGE_SUFFIX,
+    cancelled_result,
+    convert,
+    failure_result,
+    get_cache_version,
+    get_engine,
+)
+from .file_processor import is_zip_file, set_html_ext
+from .journal import BatchJournal
+from .results import SKIPPED_STATUS, ConversionResult
+from .sinks import DirectorySink, OutputSink
+from .telemetry import ConversionTelemetry
+
+
+def get_output_path(input_path: str, base_dir: Optional[str], output_dir: Optional[str]) -> str:
+    if base_dir is not None and is_zip_file(base_dir):
+        return set_html_ext(
+            os.path.join(
+                get_archive_output_dir(base_dir, output_dir), os.path.relpath(input_path, base_dir)
+            )
+        )
+    if output_dir is None:
+        return set_html_ext(input_path)
+    if base_dir is None:
+        return set_html_ext(os.path.join(output_dir, os.path.basename(input_path)))
+    return set_html_ext(
+        os.path.join(
+            output_dir,
+            os.path.basename(os.path.normpath(base_dir)),
+            os.path.relpath(input_path, base_dir),
+        )
+    )
+
+
+class ConversionBatch:
+    def __init__(self) -> None:
+        self.output_dir: Optional[str] = None
+        self._output_paths: "OrderedDict[str, str]" = OrderedDict()
+        self._input_paths: List[str] = []
+        self._base_dirs: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._input_paths)
+
+    def __contains__(self, input_path: str) -> bool:
+        return input_path in self._output_paths
+
+    def add(self, input_paths: Iterable[str], base_dir: Optional[str] = None) -> int:
+        added = 0
+        with self._lock:
+            for input_path in input_paths:
+                if input_path in self._output_paths:
+                    continue
+                if base_dir is not None:
+                    self._base_dirs[input_path] = base_dir
+                self._output_paths[input_path] = self.get_output_path(input_path)
+                self._input_paths.append(input_path)
+                added += 1
+        return added
+
+    def get_output_path(self, input_path: str) -> str:
+        return get_output_path(input_path, self._base_dirs.get(input_path), self.output_dir)
+
+    def set_output_dir(self, dir_path: str) -> None:
+        with self._lock:
+            self.output_dir = dir_path
+            for input_path in self._input_paths:
+                self._output_paths[input_path] = self.get_output_path(input_path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.output_dir = None
+            self._output_paths.clear()
+            self._input_paths.clear()
+            self._base_dirs.clear()
+
+    def input_path(self, index: int) -> str:
+        return self._input_paths[index]
+
+    def output_path(self, index: int) -> str:
+        return self._output_paths[self._input_paths[index]]
+
+    def path_pair(self, index: int) -> Tuple[str, str]:
+        with self._lock:
+            input_path = self._input_paths[index]
+            return input_path, self._output_paths[input_path]
+
+    def path_pairs(self) -> List[Tuple[str, str]]:
+        with self._lock:
+            return list(self._output_paths.items())
+
+
+def get_default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def create_executor(max_workers: Optional[int] = None, use_processes: bool = False) -> Executor:
+    workers = max_workers if max_workers else get_default_workers()
+    if use_processes:
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers=workers)
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def skipped_message(docx_path: str) -> str:
+    return f"{os.path.basename(docx_path)}{SKIPPED_MESSAGE_SUFFIX}"
+
+
+def skipped_result(docx_path: str, html_path: str) -> ConversionResult:
+    return ConversionResult(docx_path, html_path, SKIPPED_STATUS, skipped_message(docx_path))
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    if hours:
+        return f"{hours:d}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+def format_progress(done: int, total: int, elapsed: float) -> str:
+    throughput = done / elapsed if elapsed > 0 else 0.0
+    if done and throughput:
+        eta = format_duration((total - done) / throughput)
+    else:
+        eta = "--:--"
+    return f"{done}/{total} files | {throughput:.1f} files/s | ETA {eta}"
+
+
+def convert_with_telemetry(
+    docx_path: str,
+    html_path: str,
+    remove_prefix: bool,
+    remove_strong: bool,
+    sink: Optional[OutputSink] = None,
+    cancel_event: Optional[threading.Event] = None,
+    assets_dir: Optional[str] = None,
+    minify: bool = False,
+) -> Tuple[ConversionResult, ConversionTelemetry]:
+    telemetry = ConversionTelemetry(docx_path, html_path)
+    result = convert(
+        docx_path,
+        html_path,
+        remove_prefix=remove_prefix,
+        remove_strong=remove_strong,
+        telemetry=telemetry,
+        sink=sink,
+        cancel_event=cancel_event,
+        assets_dir=assets_dir,
+        minify=minify,
+    )
+    return result, telemetry
+
+
+def get_journal_options(
+    minify: bool = False,
+    assets_dir: Optional[str] = None,
+    sink: Optional[OutputSink] = None,
+) -> str:
+    options = [
+        get_cache_version(get_engine(), minify=minify),
+        POSTPROCESS_VERSION,
+        sink.cache_key if sink is not None else DirectorySink.name,
+    ]
+    if assets_dir is not None:
+        options.append(os.path.abspath(assets_dir))
+    return "\0".join(options)
+
+
+def convert_batch(
+    path_pairs: Iterable[Tuple[str, str]],
+    remove_prefix: bool,
+    remove_strong: bool,
+    max_workers: Optional[int] = None,
+    use_processes: bool = False,
+    on_result: Optional[Callable[[int, ConversionResult], None]] = None,
+    cancel_event: Optional[threading.Event] = None,
+    on_telemetry: Optional[Callable[[ConversionTelemetry], None]] = None,
+    sink: Optional[OutputSink] = None,
+    journal: Optional[BatchJournal] = None,
+    assets_dir: Optional[str] = None,
+    minify: bool = False,
+) -> List[ConversionResult]:
+    path_pairs = iter(path_pairs)
+    first_pair = next(path_pairs, None)
+    if first_pair is None:
+        return []
+    if use_processes and sink is not None and not sink.process_safe:
+        raise ValueError(f"The {sink.name} output sink cannot be used with worker processes")
+
+    results: List[Optional[ConversionResult]] = []
+    task = convert_with_telemetry if on_telemetry else convert
+    if sink is not None:
+        task = partial(task, sink=sink)
+    if cancel_event is not None and not use_processes:
+        task = partial(task, cancel_event=cancel_event)
+    if assets_dir is not None:
+        task = partial(task, assets_dir=assets_dir)
+    if minify:
+        task = partial(task, minify=minify)
+    workers = max_workers if max_workers else get_default_workers()
+    max_pending = workers * BATCH_PENDING_PER_WORKER
+    futures: Dict[Future, Tuple[int, str, str]] = {}
+    journal_options = get_journal_options(minify, assets_dir, sink) if journal is not None else ""
+
+    def set_result(index: int, result: ConversionResult) -> None:
+        results[index] = result
+        if on_result:
+            on_result(index, result)
+
+    def collect(pending: Set[Future]) -> Set[Future]:
+        done, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL_S, return_when=FIRST_COMPLETED)
+        for future in done:
+            index, input_path, output_path = futures.pop(future)
+            if future.cancelled():
+                set_result(index, cancelled_result(input_path, output_path))
+                continue
+            try:
+                if on_telemetry:
+                    result, telemetry = future.result()
+                    on_telemetry(telemetry)
+                else:
+                    result = future.result()
+            except Exception as exc:
+                result = failure_result(input_path, output_path, exc)
+            if journal is not None:
+                journal.finish(
+                    input_path,
+                    output_path,
+                    remove_prefix,
+                    remove_strong,
+                    success=result.success,
+                    options=journal_options,
+                )
+            set_result(index, result)
+
+        if cancel_event is not None and cancel_event.is_set():
+            for future in pending:
+                future.cancel()
+        return pending
+
+    with create_executor(workers, use_processes) as executor:
+        pending: Set[Future] = set()
+        for index, (input_path, output_path) in enumerate(chain([first_pair], path_pairs)):
+            results.append(None)
+            if cancel_event is not None and cancel_event.is_set():
+                set_result(index, cancelled_result(input_path, output_path))
+                continue
+            if journal is not None:
+                if journal.is_done(
+                    input_path, output_path, remove_prefix, remove_strong, journal_options
+                ):
+                    set_result(index, skipped_result(input_path, output_path))
+                    continue
+                journal.plan(input_path, output_path, remove_prefix, remove_strong, journal_options)
+            while len(pending) >= max_pending:
+                pending = collect(pending)
+            future = executor.submit(
+                task,
+                input_path,
+                output_path,
+                remove_prefix=remove_prefix,
+                remove_strong=remove_strong,
+            )
+            futures[future] = (index, input_path, output_path)
+            pending.add(future)
+        while pending:
+            pending = collect(pending)
+
+    return [result for result in results if result is not None]
@@ -0,0 +1,205 @@
+import hashlib
+import os
+import string
+import sys
+import threading
+from typing import List, Optional, Tuple
+
+from .constants import (
+    AST_FORMAT,
+    CACHE_DIR_ENV_VAR,
+    CACHE_DIR_NAME,
+    CACHE_EVICTION_TARGET_RATIO,
+    DEFAULT_CACHE_MAX_SIZE_BYTES,
+    DEFAULT_ENCODING,
+    HTML_EXTENSION,
+    POSTPROCESS_VERSION,
+)
+
+
+SHARD_NAME_LENGTH = 2
+KEY_LENGTH = hashlib.sha256().digest_size * 2
+
+
+def get_default_cache_dir() -> str:
+    base_dir = (
+        os.environ.get("LOCALAPPDATA")
+        or os.environ.get("XDG_CACHE_HOME")
+        or os.path.join(os.path.expanduser("~"), ".cache")
+    )
+    return os.path.join(base_dir, CACHE_DIR_NAME)
+
+
+class ConversionCache:
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        max_size_bytes: int = DEFAULT_CACHE_MAX_SIZE_BYTES,
+    ) -> None:
+        self.cache_dir = cache_dir if cache_dir else get_default_cache_dir()
+        self.max_size_bytes = max_size_bytes
+        self._lock = threading.Lock()
+        self._size_bytes: Optional[int] = None
+
+    @staticmethod
+    def make_key(
+        docx_content: bytes,
+        remove_prefix: bool,
+        remove_strong: bool,
+        pandoc_version: str,
+    ) -> str:
+        digest = hashlib.sha256(docx_content)
+        digest.update(
+            "\0".join(
+                (
+                    str(int(remove_prefix)),
+                    str(int(remove_strong)),
+                    pandoc_version,
+                    POSTPROCESS_VERSION,
+                    sys.platform,
+                )
+            ).encode(DEFAULT_ENCODING)
+        )
+        return digest.hexdigest()
+
+    @staticmethod
+    def make_ast_key(docx_content: bytes, input_format: str, pandoc_version: str) -> str:
+        digest = hashlib.sha256(docx_content)
+        digest.update(
+            "\0".join((AST_FORMAT, input_format, pandoc_version, sys.platform)).encode(
+                DEFAULT_ENCODING
+            )
+        )
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r", encoding=DEFAULT_ENCODING, newline="") as f:
+                content = f.read()
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        return content
+
+    def put(self, key: str, html_content: str) -> None:
+        import tempfile
+
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(entry_path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding=DEFAULT_ENCODING, newline="") as f:
+                f.write(html_content)
+            entry_size = os.path.getsize(temp_path)
+            with self._lock:
+                size_bytes = self._current_size() - _get_size(entry_path)
+                os.replace(temp_path, entry_path)
+                self._size_bytes = size_bytes + entry_size
+                if self._size_bytes > self.max_size_bytes:
+                    self._evict()
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def clear(self) -> None:
+        with self._lock:
+            shard_paths = set()
+            for _, entry_path, _ in self._entries():
+                shard_paths.add(os.path.dirname(entry_path))
+                try:
+                    os.remove(entry_path)
+                except FileNotFoundError:
+                    pass
+            for shard_path in shard_paths:
+                try:
+                    os.rmdir(shard_path)
+                except OSError:
+                    pass
+            self._size_bytes = 0
+
+    def size(self) -> int:
+        with self._lock:
+            return self._current_size()
+
+    def _current_size(self) -> int:
+        if self._size_bytes is None:
+            self._size_bytes = sum(size for _, _, size in self._entries())
+        return self._size_bytes
+
+    def _evict(self) -> None:
+        target_size = self.max_size_bytes * CACHE_EVICTION_TARGET_RATIO
+        for _, entry_path, entry_size in sorted(self._entries()):
+            if self._size_bytes <= target_size:
+                break
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                continue
+            self._size_bytes -= entry_size
+
+    def _entries(self) -> List[Tuple[float, str, int]]:
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for shard in os.scandir(self.cache_dir):
+            if len(shard.name) != SHARD_NAME_LENGTH or not shard.is_dir():
+                continue
+            for entry in os.scandir(shard.path):
+                if _is_entry_name(entry.name, shard.name) and entry.is_file():
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, entry.path, stat.st_size))
+        return entries
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:SHARD_NAME_LENGTH], f"{key}.{HTML_EXTENSION}")
+
+
+def _is_entry_name(file_name: str, shard_name: str) -> bool:
+    key, extension = os.path.splitext(file_name)
+    return (
+        extension == f".{HTML_EXTENSION}"
+        and len(key) == KEY_LENGTH
+        and key.startswith(shard_name)
+        and all(char in string.hexdigits for char in key)
+    )
+
+
+def _get_size(file_path: str) -> int:
+    try:
+        return os.path.getsize(file_path)
+    except FileNotFoundError:
+        return 0
+
+
+_cache: Optional[ConversionCache] = None
+_cache_lock = threading.Lock()
+_cache_configured = False
+
+
+def get_cache() -> Optional[ConversionCache]:
+    global _cache, _cache_configured
+    with _cache_lock:
+        if not _cache_configured:
+            cache_dir = os.environ.get(CACHE_DIR_ENV_VAR)
+            _cache = ConversionCache(cache_dir) if cache_dir else None
+            _cache_configured = True
+        return _cache
+
+
+def swap_cache(
+    cache: Optional[ConversionCache], configured: bool = True
+) -> Tuple[Optional[ConversionCache], bool]:
+    global _cache, _cache_configured
+    with _cache_lock:
+        previous_state = (_cache, _cache_configured)
+        _cache, _cache_configured = cache, configured
+    return previous_state
+
+
+def set_cache(cache: Optional[ConversionCache]) -> None:
+    global _cache, _cache_configured
+    with _cache_lock:
+        _cache = cache
+        _cache_configured = True
@@ -0,0 +1,450 @@
+import argparse
+import contextlib
+import glob
+import os
+import sys
+from itertools import chain
+from typing import Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .archives import scan_archive
+from .backends import BACKENDS, create_backend, swap_backend
+from .batch import convert_batch, get_output_path
+from .cache import ConversionCache, get_default_cache_dir, swap_cache
+from .constants import (
+    AST_ENGINE,
+    BACKEND_ENV_VAR,
+    BROTLI_SIDECAR,
+    CACHE_DIR_ENV_VAR,
+    DEFAULT_TIMEOUT_S,
+    ENGINE_ENV_VAR,
+    EXIT_CONVERSION_FAILED,
+    EXIT_NO_INPUT,
+    EXIT_OK,
+    EXIT_USAGE_ERROR,
+    GZIP_SIDECAR,
+    NATIVE_ENGINE,
+    PANDOC_ENGINE,
+    PYPANDOC_BACKEND,
+    SERVICE_HOST,
+    SERVICE_MAX_QUEUE,
+    SERVICE_PORT,
+    TIMEOUT_ENV_VAR,
+)
+from .file_processor import is_zip_file, scan_docx_files
+from .journal import BatchJournal, get_default_journal_path
+from .results import ConversionResult, write_report
+from .sinks import (
+    DirectorySink,
+    NullSink,
+    OutputSink,
+    StreamSink,
+    ZipSink,
+    get_compressor,
+)
+from .telemetry import (
+    ConversionTelemetry,
+    TelemetryLog,
+    format_peak_memory,
+    format_summary,
+    summarize_telemetry,
+)
+from .watcher import FolderWatcher
+
+GLOB_CHARS = "*?["
+
+
+def create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="docx_html_converter",
+        description="Convert DOCX files to HTML without starting the GUI.",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        help="DOCX files, directories (searched recursively), zip archives or glob patterns",
+    )
+    output_group = parser.add_mutually_exclusive_group()
+    output_group.add_argument(
+        "-o",
+        "--output-dir",
+        help="directory for the HTML files (default: next to each input file)",
+    )
+    output_group.add_argument(
+        "--stdout",
+        action="store_true",
+        help="write the HTML to standard output instead of files, in the order conversions finish",
+    )
+    output_group.add_argument(
+        "--zip",
+        metavar="ZIP_FILE",
+        help="write all HTML files into one zip archive",
+    )
+    output_group.add_argument(
+        "--discard",
+        action="store_true",
+        help="convert without writing the HTML anywhere (for benchmarking)",
+    )
+    parser.add_argument(
+        "--assets-dir",
+        metavar="DIR",
+        help="extract the images into DIR, storing identical images once, and link them",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="remove insignificant whitespace and comments from the HTML",
+    )
+    parser.add_argument(
+        "--compress",
+        action="append",
+        choices=(GZIP_SIDECAR, BROTLI_SIDECAR),
+        default=[],
+        help="also write a compressed copy next to every HTML file, can be repeated",
+    )
+    parser.add_argument(
+        "--remove-prefix",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="remove everything up to and including the first list (default: on)",
+    )
+    parser.add_argument(
+        "--remove-strong",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="remove <strong> tags but keep their content (default: on)",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of files converted in parallel (default: CPU count)",
+    )
+    parser.add_argument(
+        "--processes",
+        action="store_true",
+        help="use worker processes instead of threads",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default=os.environ.get(BACKEND_ENV_VAR, PYPANDOC_BACKEND),
+        help="pandoc backend used for the conversion",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=(PANDOC_ENGINE, NATIVE_ENGINE, AST_ENGINE),
+        default=os.environ.get(ENGINE_ENV_VAR, PANDOC_ENGINE),
+        help=(
+            "read simple documents natively and fall back to pandoc for the rest, "
+            "or cache pandoc's document tree and apply the removals to it"
+        ),
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=float(os.environ.get(TIMEOUT_ENV_VAR) or DEFAULT_TIMEOUT_S),
+        metavar="SECONDS",
+        help=f"stop converting a file after this many seconds, 0 to wait forever "
+        f"(default: {DEFAULT_TIMEOUT_S:g})",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        nargs="?",
+        const=get_default_cache_dir(),
+        default=os.environ.get(CACHE_DIR_ENV_VAR),
+        help="reuse converted HTML from this cache directory",
+    )
+    parser.add_argument(
+        "--clear-cache",
+        action="store_true",
+        help="remove the cached HTML from the cache directory before converting",
+    )
+    parser.add_argument(
+        "--journal",
+        nargs="?",
+        const=get_default_journal_path(),
+        metavar="FILE",
+        help="record the batch in this journal and skip files it lists as converted",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="keep watching the input directories and convert new or changed files",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="run a local HTTP conversion service instead of converting files",
+    )
+    parser.add_argument(
+        "--host",
+        default=SERVICE_HOST,
+        help=f"address the conversion service listens on (default: {SERVICE_HOST}); "
+        "non-loopback addresses expose the unauthenticated service to the network",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=SERVICE_PORT,
+        help=f"port the conversion service listens on (default: {SERVICE_PORT})",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=SERVICE_MAX_QUEUE,
+        help="requests waiting for a worker before the service answers 503 "
+        f"(default: {SERVICE_MAX_QUEUE})",
+    )
+    parser.add_argument(
+        "--telemetry-log",
+        help="append per-file stage times and sizes to this JSON-lines file",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="FILE",
+        help="write the result of every file to this JSON or CSV file (chosen by extension)",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="print p50/p95 times per conversion stage after the batch",
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="record the peak Python memory of files converted alone (with --stats or "
+        "--telemetry-log) instead of stage times, which tracemalloc would slow down",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="do not print status messages",
+    )
+    return parser
+
+
+def iter_inputs(patterns: Sequence[str]) -> Iterator[Tuple[str, Optional[str]]]:
+    seen_paths: Set[str] = set()
+    for pattern in patterns:
+        if any(char in pattern for char in GLOB_CHARS):
+            paths = sorted(glob.glob(pattern, recursive=True))
+        else:
+            paths = [pattern]
+
+        for path in paths:
+            if os.path.isdir(path):
+                docx_paths: Iterable[str] = scan_docx_files(path)
+                base_dir: Optional[str] = path
+            elif is_zip_file(path) and os.path.isfile(path):
+                docx_paths, base_dir = scan_archive(path), path
+            else:
+                docx_paths, base_dir = [path], None
+            for docx_path in docx_paths:
+                if docx_path not in seen_paths:
+                    seen_paths.add(docx_path)
+                    yield docx_path, base_dir
+
+
+def collect_inputs(patterns: Sequence[str]) -> List[Tuple[str, Optional[str]]]:
+    return list(iter_inputs(patterns))
+
+
+def run_watch(args: argparse.Namespace) -> int:
+    if not args.inputs or not all(os.path.isdir(path) for path in args.inputs):
+        print("--watch needs one or more input directories", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+    if args.output_dir is None:
+        print("--watch needs --output-dir", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+
+    folder_watcher = FolderWatcher(
+        args.inputs,
+        args.output_dir,
+        remove_prefix=args.remove_prefix,
+        remove_strong=args.remove_strong,
+    )
+    try:
+        folder_watcher.run(
+            on_scan=None if args.quiet else print_messages
+        )
+    except KeyboardInterrupt:
+        pass
+    return EXIT_OK
+
+
+def run_serve(args: argparse.Namespace) -> int:
+    if args.inputs:
+        print("--serve does not take inputs", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+    if args.queue_size < 0:
+        print("--queue-size must not be negative", file=sys.stderr)
+        return EXIT_USAGE_ERROR
+
+    from .service import run_service
+
+    run_service(args.host, args.port, max_workers=args.jobs, max_queue=args.queue_size)
+    return EXIT_OK
+
+
+def create_sink(args: argparse.Namespace) -> Optional[OutputSink]:
+    if args.stdout:
+        return StreamSink()
+    if args.zip:
+        return ZipSink(args.zip)
+    if args.discard:
+        return NullSink()
+    if args.compress:
+        return DirectorySink(sidecars=args.compress)
+    return None
+
+
+def run_convert(args: argparse.Namespace) -> int:
+    inputs = iter_inputs(args.inputs)
+    first_input = next(inputs, None)
+    if first_input is None:
+        print("No DOCX files found", file=sys.stderr)
+        return EXIT_NO_INPUT
+
+    telemetry_records: List[ConversionTelemetry] = []
+    telemetry_log = TelemetryLog(args.telemetry_log) if args.telemetry_log else None
+    collect_telemetry = args.stats or telemetry_log is not None
+
+    def record_telemetry(telemetry: ConversionTelemetry) -> None:
+        if args.trace_memory:
+            telemetry.stages.clear()
+        telemetry_records.append(telemetry)
+        if telemetry_log is not None:
+            telemetry_log.write(telemetry)
+
+    trace_memory = collect_telemetry and args.trace_memory
+    if trace_memory:
+        import tracemalloc
+
+        tracemalloc.start()
+
+    sink = create_sink(args)
+    journal = BatchJournal(args.journal) if args.journal else None
+
+    def iter_path_pairs() -> Iterator[Tuple[str, str]]:
+        for docx_path, base_dir in chain([first_input], inputs):
+            if args.zip or args.stdout:
+                output_path = get_output_path(docx_path, base_dir, "")
+            else:
+                output_path = get_output_path(docx_path, base_dir, args.output_dir)
+                if sink is None:
+                    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+            yield docx_path, output_path
+
+    try:
+        results = convert_batch(
+            iter_path_pairs(),
+            remove_prefix=args.remove_prefix,
+            remove_strong=args.remove_strong,
+            max_workers=args.jobs,
+            use_processes=args.processes,
+            on_telemetry=record_telemetry if collect_telemetry else None,
+            sink=sink,
+            journal=journal,
+            assets_dir=os.path.abspath(args.assets_dir) if args.assets_dir else None,
+            minify=args.minify,
+        )
+        if sink is not None:
+            sink.close()
+    finally:
+        if sink is not None:
+            sink.abort()
+        if telemetry_log is not None:
+            telemetry_log.close()
+        if journal is not None:
+            journal.close()
+        if trace_memory:
+            import tracemalloc
+
+            tracemalloc.stop()
+
+    if not args.quiet:
+        print_messages(results)
+    if args.report:
+        write_report(results, args.report)
+    if args.stats:
+        for line in format_summary(summarize_telemetry(telemetry_records)):
+            print(line, file=sys.stderr)
+        if trace_memory:
+            print(format_peak_memory(telemetry_records), file=sys.stderr)
+    if all(result.success for result in results):
+        if journal is not None:
+            journal.remove()
+        return EXIT_OK
+    return EXIT_CONVERSION_FAILED
+
+
+def print_messages(results: Sequence[ConversionResult]) -> None:
+    for index, result in enumerate(results, 1):
+        print(f"{index}. {result.message.rstrip()}", file=sys.stderr)
+
+
+@contextlib.contextmanager
+def configure(args: argparse.Namespace) -> Iterator[None]:
+    env_values = {
+        BACKEND_ENV_VAR: args.backend,
+        ENGINE_ENV_VAR: args.engine,
+        CACHE_DIR_ENV_VAR: args.cache_dir or "",
+        TIMEOUT_ENV_VAR: f"{args.timeout:g}",
+    }
+    previous_env_values = {name: os.environ.get(name) for name in env_values}
+    os.environ.update(env_values)
+    previous_backend = swap_backend(create_backend(args.backend))
+    previous_cache = swap_cache(ConversionCache(args.cache_dir) if args.cache_dir else None)
+    try:
+        yield
+    finally:
+        for name, value in previous_env_values.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        backend = swap_backend(previous_backend)
+        if backend is not None:
+            backend.close()
+        swap_cache(*previous_cache)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = create_parser()
+    args = parser.parse_args(argv)
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.timeout < 0:
+        parser.error("--timeout must not be negative")
+    if args.zip and args.processes:
+        parser.error("--zip cannot be combined with --processes")
+    if args.stdout and args.processes:
+        parser.error("--stdout cannot be combined with --processes")
+    if args.journal and (args.stdout or args.zip or args.discard):
+        parser.error("--journal needs HTML files written to disk")
+    if args.assets_dir and (args.stdout or args.zip or args.discard):
+        parser.error("--assets-dir needs HTML files written to disk")
+    if args.compress and (args.stdout or args.zip or args.discard):
+        parser.error("--compress needs HTML files written to disk")
+    for sidecar in args.compress:
+        try:
+            get_compressor(sidecar)
+        except RuntimeError as exc:
+            parser.error(str(exc))
+
+    if not args.inputs and not (args.clear_cache or args.serve or args.watch):
+        parser.error("no inputs given")
+
+    with configure(args):
+        if args.clear_cache:
+            ConversionCache(args.cache_dir).clear()
+            if not args.inputs:
+                return EXIT_OK
+
+        if args.serve:
+            return run_serve(args)
+        if args.watch:
+            return run_watch(args)
+        return run_convert(args)
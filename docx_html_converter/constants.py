@@ -1,9 +1,58 @@
-WINDOWS_OS = "Windows"
+WINDOWS_PLATFORM = "win32"
 DEFAULT_ENCODING = "utf-8"
 HTML_EXTENSION = "html"
 DOCX_EXTENSION = "docx"
+ZIP_EXTENSION = "zip"
 APP_WIDTH = 640
 APP_HEIGHT = 480
 APP_TITLE = "DOCX-HTML CONVERTER"
 MESSAGEBOX_TITLE = "Value changed"
 MESSAGEBOX_DESTROY_TIME_MS = 2000
+PROGRESS_POLL_INTERVAL_MS = 100
+CANCEL_POLL_INTERVAL_S = 0.1
+BATCH_PENDING_PER_WORKER = 2
+SCAN_CHUNK_SIZE = 256
+BACKEND_ENV_VAR = "DOCX_HTML_CONVERTER_BACKEND"
+PYPANDOC_BACKEND = "pypandoc"
+SERVER_BACKEND = "server"
+ENGINE_ENV_VAR = "DOCX_HTML_CONVERTER_ENGINE"
+TIMEOUT_ENV_VAR = "DOCX_HTML_CONVERTER_TIMEOUT"
+DEFAULT_TIMEOUT_S = 600.0
+PANDOC_ENGINE = "pandoc"
+NATIVE_ENGINE = "native"
+AST_ENGINE = "ast"
+AST_FORMAT = "json"
+MINIFY_CACHE_KEY = "minify"
+GZIP_SIDECAR = "gz"
+BROTLI_SIDECAR = "br"
+JSON_REPORT_FORMAT = "json"
+CSV_REPORT_FORMAT = "csv"
+REPORT_FORMATS = (JSON_REPORT_FORMAT, CSV_REPORT_FORMAT)
+DOCX_READER_VERSION = "1"
+PANDOC_SERVER_HOST = "127.0.0.1"
+PANDOC_SERVER_STARTUP_TIMEOUT_S = 5
+PANDOC_SERVER_REQUEST_TIMEOUT_S = 60
+CACHE_DIR_ENV_VAR = "DOCX_HTML_CONVERTER_CACHE_DIR"
+CACHE_DIR_NAME = "docx_html_converter"
+DEFAULT_CACHE_MAX_SIZE_BYTES = 256 * 1024 * 1024
+CACHE_EVICTION_TARGET_RATIO = 0.9
+POSTPROCESS_VERSION = "3"
+TEMP_FILE_SUFFIX = ".tmp"
+HASH_CHUNK_SIZE = 1024 * 1024
+WATCH_POLL_INTERVAL_S = 2.0
+WATCH_DEBOUNCE_S = 0.5
+MANIFEST_FILE_NAME = ".docx_html_converter_manifest.json"
+JOURNAL_FILE_NAME = "batch_journal.jsonl"
+ASSETS_DIR_NAME = "assets"
+WATCH_INOTIFY_RESCAN_S = 60.0
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+SERVICE_MAX_QUEUE = 32
+SERVICE_MAX_UPLOAD_BYTES = 64 * 1024 * 1024
+SERVICE_READ_TIMEOUT_S = 30
+SERVICE_RETRY_AFTER_S = 1
+TELEMETRY_PERCENTILES = (0.5, 0.95)
+EXIT_OK = 0
+EXIT_CONVERSION_FAILED = 1
+EXIT_USAGE_ERROR = 2
+EXIT_NO_INPUT = 3
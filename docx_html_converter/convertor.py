@@ -1,11 +1,57 @@
+import contextlib
 import os
-import platform
 import re
-import pypandoc
-from bs4 import BeautifulSoup
+import sys
+import threading
+from typing import Callable, Dict, List, Optional, Tuple
 
-from .constants import WINDOWS_OS, HTML_EXTENSION
-from .file_processor import save_file, read_file
+from .archives import read_docx_bytes
+from .backends import ConversionCancelled, ConversionTimeout, get_backend
+from .cache import get_cache
+from .constants import (
+    AST_ENGINE,
+    DEFAULT_TIMEOUT_S,
+    DOCX_EXTENSION,
+    DOCX_READER_VERSION,
+    ENGINE_ENV_VAR,
+    MINIFY_CACHE_KEY,
+    NATIVE_ENGINE,
+    PANDOC_ENGINE,
+    TIMEOUT_ENV_VAR,
+    WINDOWS_PLATFORM,
+)
+from .images import ImageExtractor, get_assets_url
+from .postprocessor import postprocess_html, strip_prefix_list
+from .results import (
+    CANCELLED_STATUS,
+    FAILED_STATUS,
+    SUCCESS_STATUS,
+    TIMEOUT_STATUS,
+    ConversionResult,
+)
+from .sinks import DirectorySink, OutputSink
+from .telemetry import (
+    CONVERT_STAGE,
+    POSTPROCESS_STAGE,
+    READ_STAGE,
+    TOTAL_STAGE,
+    WRITE_STAGE,
+    ConversionTelemetry,
+    MemoryTracker,
+)
+
+SUCCESS_MESSAGE_SUFFIX = " converted to HTML successfully!\n"
+SKIPPED_MESSAGE_SUFFIX = " already converted to HTML, skipped!\n"
+
+
+def get_timeout(timeout: Optional[float] = None) -> Optional[float]:
+    if timeout is None:
+        timeout = float(os.environ.get(TIMEOUT_ENV_VAR) or DEFAULT_TIMEOUT_S)
+    return timeout if timeout > 0 else None
+
+
+def cancelled_message(docx_path: str) -> str:
+    return f"Conversion of {os.path.basename(docx_path)} to HTML cancelled!"
 
 
 def windows_fix(html_content: str) -> str:
@@ -13,16 +59,7 @@ def windows_fix(html_content: str) -> str:
 
 
 def remove_html_prefix(html_content: str) -> str:
-    ul_pattern = re.compile(r"<ul>.*?</ul>", flags=re.DOTALL)
-    ul_match = ul_pattern.search(html_content)
-
-    if ul_match:
-        ul_index = ul_match.start()
-        html_content = html_content[ul_index:]
-        html_content = ul_pattern.sub("", html_content, count=1)
-        html_content = re.sub(r"^\s*", "", html_content, flags=re.MULTILINE)
-
-    return html_content
+    return strip_prefix_list(html_content)
 
 
 def remove_strong_tags(html_content: str) -> str:
@@ -32,38 +69,360 @@ def remove_strong_tags(html_content: str) -> str:
     return modified_content
 
 
-def docx_to_html(docx_path: str, html_path: str, remove_prefix: bool, remove_strong: bool) -> None:
-    convert_file_extension = os.path.splitext(docx_path)[1][1:]
+def get_engine(engine: Optional[str] = None) -> str:
+    return engine if engine is not None else os.environ.get(ENGINE_ENV_VAR, PANDOC_ENGINE)
+
+
+def read_native_html(data: bytes, input_format: str, engine: str) -> Optional[str]:
+    if engine == NATIVE_ENGINE and input_format == DOCX_EXTENSION:
+        from .docx_reader import UnsupportedDocxError, read_docx_html
+
+        try:
+            return read_docx_html(data)
+        except UnsupportedDocxError:
+            return None
+    if engine not in (NATIVE_ENGINE, PANDOC_ENGINE, AST_ENGINE):
+        raise ValueError(f"Unknown conversion engine {engine!r}")
+    return None
+
+
+def read_html(
+    data: bytes,
+    input_format: str,
+    engine: str,
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> str:
+    native_html = read_native_html(data, input_format, engine)
+    if native_html is not None:
+        return native_html
+    return get_backend().convert_bytes(
+        data, input_format, timeout=timeout, cancel_event=cancel_event
+    )
+
+
+def get_cache_version(
+    engine: str, images: Optional[ImageExtractor] = None, minify: bool = False
+) -> str:
+    if engine == NATIVE_ENGINE:
+        version = f"{NATIVE_ENGINE}-{DOCX_READER_VERSION}"
+    elif engine == AST_ENGINE:
+        version = f"{AST_ENGINE}-{get_backend().version()}"
+    else:
+        version = get_backend().version()
+    if images is not None:
+        version = f"{version}-{images.cache_key}"
+    if minify:
+        version = f"{version}-{MINIFY_CACHE_KEY}"
+    return version
+
+
+def get_cached_html(
+    data: bytes,
+    remove_prefix: bool,
+    remove_strong: bool,
+    engine: str,
+    images: Optional[ImageExtractor] = None,
+    minify: bool = False,
+) -> Tuple[Optional[str], Optional[str]]:
+    cache = get_cache()
+    if cache is None:
+        return None, None
+    cache_key = cache.make_key(
+        data, remove_prefix, remove_strong, get_cache_version(engine, images, minify)
+    )
+    return cache_key, cache.get(cache_key)
+
+
+def store_html(cache_key: Optional[str], html_content: str) -> None:
+    cache = get_cache()
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, html_content)
+
+
+def write_html(
+    raw_html: str,
+    write: Callable[[str], object],
+    remove_prefix: bool,
+    remove_strong: bool,
+    engine: str,
+    image_sources: Optional[Dict[str, str]] = None,
+    minify: bool = False,
+) -> None:
+    postprocess_html(
+        raw_html,
+        write,
+        remove_prefix=remove_prefix and engine != AST_ENGINE,
+        remove_strong=remove_strong and engine != AST_ENGINE,
+        fix_newlines=sys.platform == WINDOWS_PLATFORM,
+        image_sources=image_sources,
+        minify=minify,
+    )
+
+
+def finish_html(
+    raw_html: str,
+    remove_prefix: bool,
+    remove_strong: bool,
+    engine: str,
+    image_sources: Optional[Dict[str, str]] = None,
+    minify: bool = False,
+) -> str:
+    chunks: List[str] = []
+    write_html(raw_html, chunks.append, remove_prefix, remove_strong, engine, image_sources, minify)
+    return "".join(chunks)
+
+
+def stream_html(
+    raw_html: str,
+    html_path: str,
+    sink: OutputSink,
+    telemetry: ConversionTelemetry,
+    remove_prefix: bool,
+    remove_strong: bool,
+    engine: str,
+    image_sources: Optional[Dict[str, str]] = None,
+    minify: bool = False,
+) -> None:
+    with contextlib.ExitStack() as stack:
+        with telemetry.stage(POSTPROCESS_STAGE):
+            writer = stack.enter_context(sink.open(html_path))
+            write_html(
+                raw_html, writer.write, remove_prefix, remove_strong, engine, image_sources, minify
+            )
+        with telemetry.stage(WRITE_STAGE):
+            stack.close()
+    telemetry.output_bytes = writer.size
 
-    html_content = pypandoc.convert_file(
-        docx_path, HTML_EXTENSION, format=convert_file_extension
+
+def convert_raw_html(
+    data: bytes,
+    input_format: str,
+    remove_prefix: bool,
+    remove_strong: bool,
+    engine: str,
+    telemetry: ConversionTelemetry,
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> str:
+    with telemetry.stage(CONVERT_STAGE):
+        if engine == AST_ENGINE:
+            from .pandoc_ast import convert_ast_html
+
+            return convert_ast_html(
+                data,
+                input_format,
+                remove_prefix,
+                remove_strong,
+                timeout=get_timeout(timeout),
+                cancel_event=cancel_event,
+            )
+        return read_html(
+            data, input_format, engine, timeout=get_timeout(timeout), cancel_event=cancel_event
+        )
+
+
+def convert_bytes(
+    data: bytes,
+    *,
+    remove_prefix: bool,
+    remove_strong: bool,
+    input_format: str = DOCX_EXTENSION,
+    engine: Optional[str] = None,
+    telemetry: Optional[ConversionTelemetry] = None,
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+    images: Optional[ImageExtractor] = None,
+    minify: bool = False,
+) -> str:
+    engine = get_engine(engine)
+    cache_key, cached_html = get_cached_html(
+        data, remove_prefix, remove_strong, engine, images=images, minify=minify
+    )
+    if cached_html is not None:
+        if telemetry is not None:
+            telemetry.cached = True
+        return cached_html
+
+    if telemetry is None:
+        telemetry = ConversionTelemetry("", "")
+    raw_html = convert_raw_html(
+        data, input_format, remove_prefix, remove_strong, engine, telemetry, timeout, cancel_event
     )
-    if remove_prefix:
-        html_content = remove_html_prefix(html_content)
+    with telemetry.stage(POSTPROCESS_STAGE):
+        html_content = finish_html(
+            raw_html,
+            remove_prefix,
+            remove_strong,
+            engine,
+            image_sources=images.sources() if images is not None else None,
+            minify=minify,
+        )
 
-    if remove_strong:
-        html_content = remove_strong_tags(html_content)
+    store_html(cache_key, html_content)
+    return html_content
 
-    soup = BeautifulSoup(html_content, f"{HTML_EXTENSION}.parser")
-    for tag in soup.find_all(True):
-        tag.attrs.pop("id", None)
-    modified_html = str(soup)
 
-    save_file(html_path, modified_html)
-    if platform.system() == WINDOWS_OS:
-        html_content = read_file(html_path)
-        html_content = windows_fix(html_content)
-        save_file(html_path, html_content)
+def start_image_extractor(
+    docx_path: str, html_path: str, sink: OutputSink, assets_dir: Optional[str]
+) -> Optional[ImageExtractor]:
+    if assets_dir is None:
+        return None
+    output_path = sink.get_path(html_path) if isinstance(sink, DirectorySink) else html_path
+    assets_dir = os.path.join(os.path.dirname(output_path), assets_dir)
+    return ImageExtractor(docx_path, assets_dir, get_assets_url(assets_dir, output_path)).start()
 
 
-def convert(docx_path: str, html_path: str, remove_prefix: bool, remove_strong: bool) -> str:
+def docx_to_html(
+    docx_path: str,
+    html_path: str,
+    remove_prefix: bool,
+    remove_strong: bool,
+    engine: Optional[str] = None,
+    telemetry: Optional[ConversionTelemetry] = None,
+    sink: Optional[OutputSink] = None,
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+    assets_dir: Optional[str] = None,
+    minify: bool = False,
+) -> None:
+    if sink is None:
+        sink = DirectorySink()
+    if telemetry is None:
+        telemetry = ConversionTelemetry(docx_path, html_path)
+    images = start_image_extractor(docx_path, html_path, sink, assets_dir)
     try:
-        docx_to_html(docx_path, html_path, remove_prefix=remove_prefix, remove_strong=remove_strong)
-        status_message = (
-            f"{os.path.basename(docx_path)} converted to HTML successfully!\n"
+        with telemetry.stage(READ_STAGE):
+            docx_content = read_docx_bytes(docx_path)
+        telemetry.input_bytes = len(docx_content)
+        input_format = os.path.splitext(docx_path)[1][1:]
+        engine = get_engine(engine)
+
+        if get_cache() is None:
+            raw_html = convert_raw_html(
+                docx_content,
+                input_format,
+                remove_prefix,
+                remove_strong,
+                engine,
+                telemetry,
+                timeout=timeout,
+                cancel_event=cancel_event,
+            )
+            stream_html(
+                raw_html,
+                html_path,
+                sink,
+                telemetry,
+                remove_prefix,
+                remove_strong,
+                engine,
+                image_sources=images.sources() if images is not None else None,
+                minify=minify,
+            )
+            return None
+
+        html_content = convert_bytes(
+            docx_content,
+            remove_prefix=remove_prefix,
+            remove_strong=remove_strong,
+            input_format=input_format,
+            engine=engine,
+            telemetry=telemetry,
+            timeout=timeout,
+            cancel_event=cancel_event,
+            images=images,
+            minify=minify,
         )
-    except (RuntimeError, FileNotFoundError) as msg:
-        status_message = (
-            f"Error converting {os.path.basename(docx_path)} to HTML: {msg}"
+        if images is not None:
+            images.sources()
+    finally:
+        if images is not None:
+            images.stop()
+    with telemetry.stage(WRITE_STAGE):
+        telemetry.output_bytes = sink.write(html_path, html_content)
+
+
+def convert(
+    docx_path: str,
+    html_path: str,
+    remove_prefix: bool,
+    remove_strong: bool,
+    engine: Optional[str] = None,
+    telemetry: Optional[ConversionTelemetry] = None,
+    sink: Optional[OutputSink] = None,
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+    assets_dir: Optional[str] = None,
+    minify: bool = False,
+) -> ConversionResult:
+    if telemetry is None:
+        telemetry = ConversionTelemetry(docx_path, html_path)
+    try:
+        with telemetry.stage(TOTAL_STAGE), MemoryTracker(telemetry):
+            docx_to_html(
+                docx_path,
+                html_path,
+                remove_prefix=remove_prefix,
+                remove_strong=remove_strong,
+                engine=engine,
+                telemetry=telemetry,
+                sink=sink,
+                timeout=timeout,
+                cancel_event=cancel_event,
+                assets_dir=assets_dir,
+                minify=minify,
+            )
+    except (RuntimeError, OSError) as msg:
+        return conversion_result(telemetry, msg)
+    return conversion_result(telemetry)
+
+
+def conversion_result(
+    telemetry: ConversionTelemetry, error: Optional[Exception] = None
+) -> ConversionResult:
+    if error is not None:
+        telemetry.error = str(error)
+        return ConversionResult.from_telemetry(
+            telemetry, failure_status(error), failure_message(telemetry.docx_path, error)
         )
-    return status_message
+    telemetry.success = True
+    return ConversionResult.from_telemetry(
+        telemetry,
+        SUCCESS_STATUS,
+        f"{os.path.basename(telemetry.docx_path)}{SUCCESS_MESSAGE_SUFFIX}",
+    )
+
+
+def cancelled_result(docx_path: str, html_path: str) -> ConversionResult:
+    return ConversionResult(docx_path, html_path, CANCELLED_STATUS, cancelled_message(docx_path))
+
+
+def failure_result(docx_path: str, html_path: str, error: Exception) -> ConversionResult:
+    return ConversionResult(
+        docx_path,
+        html_path,
+        failure_status(error),
+        failure_message(docx_path, error),
+        error=str(error),
+    )
+
+
+def failure_status(error: Exception) -> str:
+    if isinstance(error, ConversionCancelled):
+        return CANCELLED_STATUS
+    if isinstance(error, ConversionTimeout):
+        return TIMEOUT_STATUS
+    return FAILED_STATUS
+
+
+def failure_message(docx_path: str, error: Exception) -> str:
+    if isinstance(error, ConversionCancelled):
+        return cancelled_message(docx_path)
+    if isinstance(error, ConversionTimeout):
+        return f"Timeout converting {os.path.basename(docx_path)} to HTML: {error}"
+    return f"Error converting {os.path.basename(docx_path)} to HTML: {error}"
+
+
+def is_success_message(status_message: str) -> bool:
+    return status_message.endswith((SUCCESS_MESSAGE_SUFFIX, SKIPPED_MESSAGE_SUFFIX))
@@ -0,0 +1,895 @@
+import io
+import re
+import unicodedata
+import zipfile
+from typing import IO, Callable, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+from xml.etree.ElementTree import Element, ParseError, iterparse, parse
+
+WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+PACKAGE_RELATIONSHIPS_NAMESPACE = (
+    "http://schemas.openxmlformats.org/package/2006/relationships"
+)
+OFFICE_DOCUMENT_RELATIONSHIP = f"{RELATIONSHIPS_NAMESPACE}/officeDocument"
+HYPERLINK_RELATIONSHIP = f"{RELATIONSHIPS_NAMESPACE}/hyperlink"
+PACKAGE_RELATIONSHIPS_PART = "_rels/.rels"
+DOCUMENT_PART = "word/document.xml"
+DOCUMENT_RELATIONSHIPS_PART = "word/_rels/document.xml.rels"
+STYLES_PART = "word/styles.xml"
+NUMBERING_PART = "word/numbering.xml"
+LINE_WIDTH = 72
+
+STR = "str"
+SPACE = ("space",)
+LINE_BREAK = ("linebreak",)
+STRONG = "strong"
+EMPH = "emph"
+LINK = "link"
+ANCHOR = "anchor"
+CONTAINERS = frozenset((STRONG, EMPH, LINK, ANCHOR))
+MELDED_CONTAINERS = frozenset((STRONG, EMPH))
+
+IGNORED_BOOKMARKS = frozenset(("_GoBack",))
+DEFAULT_PARAGRAPH_STYLES = frozenset(("normal", "list paragraph"))
+HEADING_STYLE_RE = re.compile(r"heading ([1-6])")
+HYPERLINK_STYLE = "hyperlink"
+BULLET_FORMAT = "bullet"
+LIST_TYPES = {
+    "decimal": "1",
+    "lowerLetter": "a",
+    "upperLetter": "A",
+    "lowerRoman": "i",
+    "upperRoman": "I",
+}
+TEXT_PIECE_RE = re.compile(r"[ \t\r\n]+|[^ \t\r\n]+")
+ON_VALUES = frozenset(("1", "true", "on"))
+OFF_VALUES = frozenset(("0", "false", "off"))
+
+Inline = tuple
+ListLevel = Tuple[str, Optional[str], int]
+Modifier = Tuple[str, Optional[str]]
+
+
+def _w(name: str) -> str:
+    return f"{{{WORD_NAMESPACE}}}{name}"
+
+
+VAL = _w("val")
+BODY = _w("body")
+PARAGRAPH = _w("p")
+PARAGRAPH_PROPERTIES = _w("pPr")
+RUN = _w("r")
+RUN_PROPERTIES = _w("rPr")
+HYPERLINK = _w("hyperlink")
+BOOKMARK_START = _w("bookmarkStart")
+TEXT = _w("t")
+TAB = _w("tab")
+BREAK = _w("br")
+BOLD = _w("b")
+ITALIC = _w("i")
+RUN_STYLE = _w("rStyle")
+PARAGRAPH_STYLE = _w("pStyle")
+NUMBERING_PROPERTIES = _w("numPr")
+INDENTATION = _w("ind")
+BODY_CHILDREN = frozenset((PARAGRAPH, _w("sectPr")))
+IGNORED_PARAGRAPH_CHILDREN = frozenset(
+    (PARAGRAPH_PROPERTIES, _w("bookmarkEnd"), _w("proofErr"))
+)
+IGNORED_RUN_CHILDREN = frozenset((RUN_PROPERTIES, _w("lastRenderedPageBreak")))
+NEUTRAL_PARAGRAPH_PROPERTIES = frozenset(
+    _w(name)
+    for name in (
+        "pStyle", "numPr", "spacing", "jc", "ind", "rPr", "keepNext", "keepLines",
+        "widowControl", "pBdr", "shd", "contextualSpacing", "tabs", "snapToGrid",
+        "suppressAutoHyphens", "adjustRightInd", "autoSpaceDE", "autoSpaceDN",
+        "textAlignment", "wordWrap", "overflowPunct", "kinsoku", "topLinePunct",
+        "mirrorIndents", "suppressLineNumbers", "pageBreakBefore", "outlineLvl",
+        "sectPr",
+    )
+)
+NEUTRAL_RUN_PROPERTIES = frozenset(
+    _w(name)
+    for name in (
+        "bCs", "iCs", "rFonts", "sz", "szCs", "color", "lang", "noProof", "kern",
+        "spacing", "w", "caps", "vanish", "webHidden", "specVanish",
+    )
+)
+RUN_PROPERTIES_OFF_ONLY = frozenset((_w("rtl"),))
+RUN_PROPERTIES_NONE_ONLY = frozenset((_w("highlight"), _w("u")))
+TRACKED_CHANGES = frozenset(
+    _w(name) for name in ("ins", "del", "moveFrom", "moveTo", "rPrChange")
+)
+NUMBERING_CHILDREN = frozenset((_w("ilvl"), _w("numId")))
+PASSTHROUGH_BREAKS = frozenset((None, "textWrapping"))
+
+
+class UnsupportedDocxError(ValueError):
+    pass
+
+
+def read_docx_html(data: bytes) -> str:
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            chunks: List[str] = []
+            DocxReader(archive).read(chunks.append)
+    except (zipfile.BadZipFile, ParseError, KeyError, ValueError) as exc:
+        if isinstance(exc, UnsupportedDocxError):
+            raise
+        raise UnsupportedDocxError(str(exc)) from exc
+    return "".join(chunks)
+
+
+def make_identifier(text: str, used_identifiers: Set[str]) -> str:
+    text = "".join(
+        char
+        for char in text.lower()
+        if char.isspace() or char.isalnum() or char in "_-."
+    )
+    text = "-".join(text.split())
+    base_identifier = ""
+    for index, char in enumerate(text):
+        if char.isalpha():
+            base_identifier = text[index:]
+            break
+    if not base_identifier:
+        base_identifier = "section"
+    if base_identifier not in used_identifiers:
+        return base_identifier
+
+    number = 1
+    while f"{base_identifier}-{number}" in used_identifiers:
+        number += 1
+    return f"{base_identifier}-{number}"
+
+
+def text_width(text: str) -> int:
+    if text.isascii():
+        return len(text)
+    width = 0
+    for char in text:
+        if unicodedata.combining(char):
+            continue
+        width += 2 if unicodedata.east_asian_width(char) in "WF" else 1
+    return width
+
+
+def escape_html(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def escape_attribute(value: str) -> str:
+    return escape_html(value).replace('"', "&quot;").replace("'", "&#39;")
+
+
+def _concat(left: Sequence[Inline], right: Sequence[Inline]) -> List[Inline]:
+    if not left:
+        return list(right)
+    if not right:
+        return list(left)
+
+    last, first = left[-1], right[0]
+    if last[0] == STR and first[0] == STR:
+        melded = [(STR, last[1] + first[1])]
+    elif last[0] == first[0] and last[0] in MELDED_CONTAINERS:
+        melded = [(last[0], list(last[1]) + list(first[1]), None)]
+    elif last is SPACE and first is SPACE:
+        melded = [SPACE]
+    elif (last is SPACE and first is LINE_BREAK) or (
+        last is LINE_BREAK and first is SPACE
+    ):
+        melded = [LINE_BREAK]
+    else:
+        melded = [last, first]
+    return [*left[:-1], *melded, *right[1:]]
+
+
+def _unstack(inlines: Sequence[Inline]) -> Tuple[List[Modifier], Sequence[Inline]]:
+    modifiers: List[Modifier] = []
+    while len(inlines) == 1 and inlines[0][0] in CONTAINERS:
+        kind, children, attribute = inlines[0]
+        modifiers.append((kind, attribute))
+        inlines = children
+    return modifiers, inlines
+
+
+def _stack(modifiers: Sequence[Modifier], inlines: Sequence[Inline]) -> List[Inline]:
+    is_empty = not inlines
+    inlines = list(inlines)
+    for kind, attribute in reversed(modifiers):
+        if kind == ANCHOR or not is_empty:
+            inlines = [(kind, inlines, attribute)]
+    return inlines
+
+
+def _without(modifiers: Sequence[Modifier], removed: Sequence[Modifier]) -> List[Modifier]:
+    remaining = list(modifiers)
+    for modifier in removed:
+        if modifier in remaining:
+            remaining.remove(modifier)
+    return remaining
+
+
+def _trim_spaces(inlines: Sequence[Inline], trimmed: Tuple[Inline, ...] = (SPACE,)) -> List[Inline]:
+    start, end = 0, len(inlines)
+    while start < end and inlines[start] in trimmed:
+        start += 1
+    while end > start and inlines[end - 1] in trimmed:
+        end -= 1
+    return list(inlines[start:end])
+
+
+def _space_out(
+    inlines: Sequence[Inline],
+) -> Tuple[List[Inline], List[Modifier], Sequence[Inline], List[Inline]]:
+    modifiers, contents = _unstack(inlines)
+    left = [SPACE] if contents and contents[0] is SPACE else []
+    right = [SPACE] if contents and contents[-1] is SPACE else []
+    middle: Sequence[Inline] = _trim_spaces(contents)
+    if not middle:
+        modifiers, middle = _unstack(_stack(modifiers, middle))
+    return left, modifiers, middle, right
+
+
+def _space_out_left(inlines: Sequence[Inline]) -> Tuple[List[Inline], List[Inline]]:
+    left, modifiers, middle, right = _space_out(inlines)
+    return left, _stack(modifiers, _concat(middle, right))
+
+
+def _space_out_right(inlines: Sequence[Inline]) -> Tuple[List[Inline], List[Inline]]:
+    left, modifiers, middle, right = _space_out(inlines)
+    return _stack(modifiers, _concat(left, middle)), right
+
+
+def _combine_singletons(left: Sequence[Inline], right: Sequence[Inline]) -> List[Inline]:
+    left_modifiers, left_contents = _unstack(left)
+    right_modifiers, right_contents = _unstack(right)
+    shared = [modifier for modifier in left_modifiers if modifier in right_modifiers]
+    left_remaining = _without(left_modifiers, shared)
+    right_remaining = _without(right_modifiers, shared)
+    if shared:
+        return _stack(
+            shared,
+            _combine(
+                _stack(left_remaining, left_contents),
+                _stack(right_remaining, right_contents),
+            ),
+        )
+
+    left_anchors = [modifier for modifier in left_remaining if modifier[0] == ANCHOR]
+    right_anchors = [modifier for modifier in right_remaining if modifier[0] == ANCHOR]
+    if not left_contents and not right_contents:
+        return _stack(left_anchors + right_anchors, [])
+    if not left_contents:
+        space, right_rest = _space_out_left(right)
+        return _concat(_stack(left_anchors, []), _concat(space, right_rest))
+    if not right_contents:
+        left_rest, space = _space_out_right(left)
+        return _concat(left_rest, _concat(space, _stack(right_anchors, [])))
+
+    left_rest, left_space = _space_out_right(left)
+    right_space, right_rest = _space_out_left(right)
+    return _concat(left_rest, _concat(left_space, _concat(right_space, right_rest)))
+
+
+def _extend(inlines: List[Inline], right: Sequence[Inline]) -> None:
+    if inlines and right:
+        inlines[-1:] = _concat(inlines[-1:], right[:1])
+        inlines.extend(right[1:])
+    else:
+        inlines.extend(right)
+
+
+def _combine_into(inlines: List[Inline], right: Sequence[Inline]) -> None:
+    if (not inlines or inlines[-1][0] not in CONTAINERS) and (
+        not right or right[0][0] not in CONTAINERS
+    ):
+        _extend(inlines, right)
+        return None
+    last = inlines[-1:]
+    del inlines[-1:]
+    _extend(inlines, _combine_singletons(last, right[:1]))
+    _extend(inlines, right[1:])
+
+
+def _combine(left: Sequence[Inline], right: Sequence[Inline]) -> List[Inline]:
+    inlines = list(left)
+    _combine_into(inlines, right)
+    return inlines
+
+
+def smush_inlines(parts: Sequence[Sequence[Inline]]) -> List[Inline]:
+    inlines: List[Inline] = []
+    for part in parts:
+        _combine_into(inlines, part)
+    _combine_into(inlines, [])
+    return inlines
+
+
+def text_to_inlines(text: str) -> List[Inline]:
+    inlines: List[Inline] = []
+    for piece in TEXT_PIECE_RE.findall(text):
+        if piece[0] not in " \t\r\n":
+            inlines.append((STR, piece))
+        elif "\n" in piece or "\r" in piece:
+            raise UnsupportedDocxError("line break inside text")
+        else:
+            inlines.append(SPACE)
+    return inlines
+
+
+def is_blank(inlines: Sequence[Inline]) -> bool:
+    return all(
+        node is SPACE
+        or node is LINE_BREAK
+        or (node[0] in MELDED_CONTAINERS and is_blank(node[1]))
+        for node in inlines
+    )
+
+
+def stringify(inlines: Sequence[Inline]) -> str:
+    pieces = []
+    for node in inlines:
+        if node[0] == STR:
+            pieces.append(node[1])
+        elif node is SPACE or node is LINE_BREAK:
+            pieces.append(" ")
+        else:
+            pieces.append(stringify(node[1]))
+    return "".join(pieces)
+
+
+def _render_inlines(inlines: Sequence[Inline], tokens: List[Optional[str]]) -> None:
+    for node in inlines:
+        kind = node[0]
+        if kind == STR:
+            tokens.append(escape_html(node[1]))
+        elif node is SPACE:
+            tokens.append(None)
+        elif node is LINE_BREAK:
+            tokens.append("<br />")
+            tokens.append("\n")
+        elif kind == STRONG:
+            tokens.append("<strong>")
+            _render_inlines(node[1], tokens)
+            tokens.append("</strong>")
+        elif kind == EMPH:
+            tokens.append("<em>")
+            _render_inlines(node[1], tokens)
+            tokens.append("</em>")
+        elif kind == LINK:
+            tokens.extend(("<a", None, f'href="{escape_attribute(node[2])}">'))
+            _render_inlines(node[1], tokens)
+            tokens.append("</a>")
+
+
+def wrap_tokens(tokens: Sequence[Optional[str]], write: Callable[[str], object]) -> None:
+    column = 0
+    index, count = 0, len(tokens)
+    while index < count:
+        token = tokens[index]
+        if token is None:
+            while index < count and tokens[index] is None:
+                index += 1
+            next_width = 0
+            next_index = index
+            while next_index < count and tokens[next_index] not in (None, "\n"):
+                next_width += text_width(tokens[next_index])
+                next_index += 1
+            if column + 1 + next_width > LINE_WIDTH:
+                write("\n")
+                column = 0
+            elif column > 0:
+                write(" ")
+                column += 1
+            continue
+
+        if token == "\n":
+            if column > 0:
+                write("\n")
+                column = 0
+        else:
+            write(token)
+            column += text_width(token)
+        index += 1
+
+
+def _on_off(element: Element) -> Optional[bool]:
+    value = element.get(VAL)
+    if value is None or value in ON_VALUES:
+        return True
+    if value in OFF_VALUES:
+        return False
+    return None
+
+
+def _read_xml(archive: zipfile.ZipFile, part: str) -> Optional[Element]:
+    try:
+        with archive.open(part) as f:
+            return parse(f).getroot()
+    except KeyError:
+        return None
+
+
+class _ListItem:
+    def __init__(self, num_id: str, level: int, start_tag: str, end_tag: str) -> None:
+        self.num_id = num_id
+        self.level = level
+        self.start_tag = start_tag
+        self.end_tag = end_tag
+
+
+class HtmlBlockWriter:
+    def __init__(self, write: Callable[[str], object]) -> None:
+        self._write = write
+        self._has_blocks = False
+        self._lists: List[_ListItem] = []
+        self._pending_item: Optional[List[Inline]] = None
+        self._item_started = False
+
+    def add_block(
+        self, start_tag: Sequence[Optional[str]], inlines: Sequence[Inline], end_tag: str
+    ) -> None:
+        self._close_lists(0)
+        tokens: List[Optional[str]] = []
+        _render_inlines(inlines, tokens)
+        if not tokens and end_tag == "</p>":
+            return None
+        self._separate()
+        wrap_tokens([*start_tag, *tokens, end_tag], self._write)
+
+    def add_list_item(self, item: _ListItem, inlines: Sequence[Inline]) -> None:
+        while self._lists and not self._continues(self._lists[-1], item):
+            self._close_list()
+
+        if self._lists and self._lists[-1].level == item.level:
+            self._close_item()
+            self._write("\n")
+        elif self._lists:
+            self._open_item_content()
+            self._write(f"{item.start_tag}\n")
+            self._lists.append(item)
+        else:
+            self._separate()
+            self._write(f"{item.start_tag}\n")
+            self._lists.append(item)
+
+        tokens: List[Optional[str]] = []
+        _render_inlines(inlines, tokens)
+        self._pending_item = tokens
+        self._item_started = False
+
+    @property
+    def has_blocks(self) -> bool:
+        return self._has_blocks
+
+    def close(self) -> None:
+        self._close_lists(0)
+        self._write("\n")
+
+    def _separate(self) -> None:
+        if self._has_blocks:
+            self._write("\n")
+        self._has_blocks = True
+
+    @staticmethod
+    def _continues(current: _ListItem, item: _ListItem) -> bool:
+        return item.level > current.level or (
+            item.level == current.level and item.num_id == current.num_id
+        )
+
+    def _open_item_content(self) -> None:
+        if self._item_started:
+            self._write("\n")
+            return None
+        tokens = self._pending_item
+        self._pending_item = None
+        self._item_started = True
+        if tokens:
+            wrap_tokens(["<li><p>", *tokens, "</p>"], self._write)
+            self._write("\n")
+        else:
+            self._write("<li>")
+
+    def _close_item(self) -> None:
+        if self._item_started:
+            self._write("</li>")
+        elif self._pending_item:
+            wrap_tokens(["<li><p>", *self._pending_item, "</p></li>"], self._write)
+        else:
+            self._write("<li></li>")
+        self._pending_item = None
+        self._item_started = True
+
+    def _close_list(self) -> None:
+        self._close_item()
+        self._write(f"\n{self._lists.pop().end_tag}")
+
+    def _close_lists(self, depth: int) -> None:
+        while len(self._lists) > depth:
+            self._close_list()
+
+
+class DocxReader:
+    def __init__(self, archive: zipfile.ZipFile) -> None:
+        self.archive = archive
+        self._check_main_document()
+        self._hyperlinks = self._read_hyperlinks()
+        self._paragraph_styles: Dict[str, Element] = {}
+        self._character_styles: Dict[str, Element] = {}
+        self._default_paragraph_style: Optional[str] = None
+        self._read_styles()
+        self._abstract_numbering: Dict[str, Dict[int, ListLevel]] = {}
+        self._numbering: Dict[str, str] = {}
+        self._read_numbering()
+        self._list_counters: Dict[Tuple[str, int], int] = {}
+        self._used_identifiers: Set[str] = set()
+        self._trailing_bookmark = False
+        self._after_heading = False
+        self._empty_after_heading = False
+
+    def read(self, write: Callable[[str], object]) -> None:
+        writer = HtmlBlockWriter(write)
+        with self.archive.open(DOCUMENT_PART) as f:
+            for paragraph in self._iter_paragraphs(f):
+                self._read_paragraph(paragraph, writer)
+        writer.close()
+
+    def _check_main_document(self) -> None:
+        relationships = _read_xml(self.archive, PACKAGE_RELATIONSHIPS_PART)
+        if relationships is None:
+            raise UnsupportedDocxError("missing package relationships")
+        for relationship in relationships:
+            if relationship.get("Type") == OFFICE_DOCUMENT_RELATIONSHIP:
+                if relationship.get("Target", "").lstrip("/") != DOCUMENT_PART:
+                    raise UnsupportedDocxError("unexpected main document part")
+                return None
+        raise UnsupportedDocxError("missing main document")
+
+    def _read_hyperlinks(self) -> Dict[str, str]:
+        hyperlinks: Dict[str, str] = {}
+        relationships = _read_xml(self.archive, DOCUMENT_RELATIONSHIPS_PART)
+        if relationships is None:
+            return hyperlinks
+        for relationship in relationships:
+            if (
+                relationship.get("Type") == HYPERLINK_RELATIONSHIP
+                and relationship.get("TargetMode") == "External"
+            ):
+                hyperlinks[relationship.get("Id", "")] = relationship.get("Target", "")
+        return hyperlinks
+
+    def _read_styles(self) -> None:
+        styles = _read_xml(self.archive, STYLES_PART)
+        if styles is None:
+            return None
+        for style in styles.iter(_w("style")):
+            style_id = style.get(_w("styleId"), "")
+            style_type = style.get(_w("type"))
+            if style_type == "paragraph":
+                self._paragraph_styles[style_id] = style
+                if _on_off_attribute(style.get(_w("default"))):
+                    self._default_paragraph_style = style_id
+            elif style_type == "character":
+                self._character_styles[style_id] = style
+
+    def _read_numbering(self) -> None:
+        numbering = _read_xml(self.archive, NUMBERING_PART)
+        if numbering is None:
+            return None
+        for abstract_num in numbering.iter(_w("abstractNum")):
+            levels: Dict[int, ListLevel] = {}
+            if (
+                abstract_num.find(_w("numStyleLink")) is None
+                and abstract_num.find(_w("styleLink")) is None
+            ):
+                for level in abstract_num.iter(_w("lvl")):
+                    num_format = level.find(_w("numFmt"))
+                    level_text = level.find(_w("lvlText"))
+                    start = level.find(_w("start"))
+                    if num_format is None:
+                        continue
+                    levels[int(level.get(_w("ilvl"), "0"))] = (
+                        num_format.get(VAL, ""),
+                        None if level_text is None else level_text.get(VAL),
+                        1 if start is None else int(start.get(VAL, "1")),
+                    )
+            self._abstract_numbering[abstract_num.get(_w("abstractNumId"), "")] = levels
+        for num in numbering.iter(_w("num")):
+            abstract_num_id = num.find(_w("abstractNumId"))
+            if abstract_num_id is not None and num.find(_w("lvlOverride")) is None:
+                self._numbering[num.get(_w("numId"), "")] = abstract_num_id.get(VAL, "")
+
+    @staticmethod
+    def _iter_paragraphs(stream: IO[bytes]) -> Iterator[Element]:
+        depth = 0
+        body: Optional[Element] = None
+        for event, element in iterparse(stream, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if depth == 2:
+                    if element.tag != BODY:
+                        raise UnsupportedDocxError(f"unsupported element {element.tag}")
+                    body = element
+                elif depth == 3 and element.tag not in BODY_CHILDREN:
+                    raise UnsupportedDocxError(f"unsupported element {element.tag}")
+                continue
+
+            depth -= 1
+            if depth == 2 and body is not None:
+                if element.tag == PARAGRAPH:
+                    yield element
+                body.clear()
+        if body is None:
+            raise UnsupportedDocxError("missing document body")
+
+    def _read_paragraph(self, paragraph: Element, writer: HtmlBlockWriter) -> None:
+        properties = paragraph.find(PARAGRAPH_PROPERTIES)
+        heading_level, list_item = self._read_paragraph_properties(properties)
+        in_heading = heading_level is not None
+
+        parts: List[List[Inline]] = []
+        content_tags: List[str] = []
+        trailing_bookmark = False
+        for child in paragraph:
+            if child.tag == RUN:
+                parts.append(self._read_run(child, in_hyperlink=False))
+            elif child.tag == HYPERLINK:
+                parts.append(self._read_hyperlink(child))
+            elif child.tag == BOOKMARK_START:
+                parts.append(self._read_bookmark(child, in_heading))
+            elif child.tag in IGNORED_PARAGRAPH_CHILDREN:
+                continue
+            else:
+                raise UnsupportedDocxError(f"unsupported element {child.tag}")
+            content_tags.append(child.tag)
+            trailing_bookmark = child.tag == BOOKMARK_START and bool(parts[-1])
+        inlines = smush_inlines(parts)
+
+        if content_tags:
+            starts_with_bookmark = content_tags[0] == BOOKMARK_START
+            if self._trailing_bookmark and starts_with_bookmark and not in_heading:
+                raise UnsupportedDocxError("bookmark between paragraphs")
+            self._trailing_bookmark = trailing_bookmark and not in_heading
+
+        if heading_level is not None:
+            if self._empty_after_heading:
+                raise UnsupportedDocxError("empty paragraph between headings")
+            inlines = [node for node in inlines if node[0] != ANCHOR]
+            identifier = make_identifier(stringify(inlines), self._used_identifiers)
+            self._used_identifiers.add(identifier)
+            writer.add_block(
+                (f"<h{heading_level}", None, f'id="{identifier}">'),
+                inlines,
+                f"</h{heading_level}>",
+            )
+            self._after_heading = True
+            return None
+
+        only_runs = all(tag == RUN for tag in content_tags)
+        if list_item is None:
+            if only_runs and not writer.has_blocks and is_blank(inlines):
+                return None
+            inlines = _trim_spaces(inlines, (SPACE, LINE_BREAK))
+            if not inlines:
+                return None
+            writer.add_block(("<p>",), inlines, "</p>")
+            if all(node[0] == ANCHOR for node in inlines):
+                self._empty_after_heading = self._after_heading
+                return None
+        else:
+            writer.add_list_item(list_item, _trim_spaces(inlines, (SPACE, LINE_BREAK)))
+        self._after_heading = False
+        self._empty_after_heading = False
+
+    def _read_paragraph_properties(
+        self, properties: Optional[Element]
+    ) -> Tuple[Optional[int], Optional[_ListItem]]:
+        style_id = self._default_paragraph_style
+        numbering: Optional[Element] = None
+        indentation: Optional[Element] = None
+        if properties is not None:
+            for child in properties:
+                if not child.tag.startswith(f"{{{WORD_NAMESPACE}}}"):
+                    continue
+                if child.tag not in NEUTRAL_PARAGRAPH_PROPERTIES:
+                    raise UnsupportedDocxError(f"unsupported paragraph property {child.tag}")
+                if child.tag == PARAGRAPH_STYLE:
+                    style_id = child.get(VAL)
+                elif child.tag == NUMBERING_PROPERTIES:
+                    numbering = child
+                elif child.tag == INDENTATION:
+                    indentation = child
+                elif child.tag == RUN_PROPERTIES:
+                    for mark_property in child:
+                        if mark_property.tag in TRACKED_CHANGES:
+                            raise UnsupportedDocxError("tracked paragraph mark")
+
+        heading_level = self._get_heading_level(style_id)
+        list_item = self._get_list_item(numbering) if numbering is not None else None
+        if heading_level is not None and list_item is not None:
+            raise UnsupportedDocxError("numbered heading")
+        if (
+            heading_level is None
+            and list_item is None
+            and indentation is not None
+            and _get_indent(indentation) > 0
+        ):
+            raise UnsupportedDocxError("indented paragraph")
+        return heading_level, list_item
+
+    def _get_heading_level(self, style_id: Optional[str]) -> Optional[int]:
+        if style_id is None:
+            return None
+        style = self._paragraph_styles.get(style_id)
+        if style is None:
+            raise UnsupportedDocxError(f"unknown paragraph style {style_id}")
+
+        name_element = style.find(_w("name"))
+        name = "" if name_element is None else name_element.get(VAL, "").lower()
+        heading_match = HEADING_STYLE_RE.fullmatch(name)
+        if not (
+            heading_match
+            or name in DEFAULT_PARAGRAPH_STYLES
+            or style_id == self._default_paragraph_style
+        ):
+            raise UnsupportedDocxError(f"unsupported paragraph style {name}")
+
+        seen_styles = set()
+        while style is not None and style_id not in seen_styles:
+            seen_styles.add(style_id)
+            style_properties = style.find(PARAGRAPH_PROPERTIES)
+            if (
+                style_properties is not None
+                and style_properties.find(NUMBERING_PROPERTIES) is not None
+            ):
+                raise UnsupportedDocxError("numbered paragraph style")
+            based_on = style.find(_w("basedOn"))
+            style_id = None if based_on is None else based_on.get(VAL)
+            style = self._paragraph_styles.get(style_id) if style_id else None
+        return int(heading_match.group(1)) if heading_match else None
+
+    def _get_list_item(self, numbering: Element) -> Optional[_ListItem]:
+        level_element = numbering.find(_w("ilvl"))
+        num_id_element = numbering.find(_w("numId"))
+        if any(child.tag not in NUMBERING_CHILDREN for child in numbering):
+            raise UnsupportedDocxError("unsupported numbering properties")
+        if num_id_element is None or level_element is None:
+            raise UnsupportedDocxError("incomplete numbering properties")
+        num_id = num_id_element.get(VAL, "")
+        if num_id == "0":
+            return None
+
+        level = int(level_element.get(VAL, ""))
+        abstract_num_id = self._numbering.get(num_id)
+        levels = self._abstract_numbering.get(abstract_num_id or "", {})
+        if level not in levels:
+            raise UnsupportedDocxError(f"unsupported numbering {num_id}")
+        num_format, level_text, level_start = levels[level]
+
+        start = self._list_counters.get((num_id, level))
+        start = level_start if start is None else start + 1
+        self._list_counters = {
+            key: value
+            for key, value in self._list_counters.items()
+            if key[1] <= level
+        }
+        self._list_counters[(num_id, level)] = start
+
+        if num_format == BULLET_FORMAT:
+            return _ListItem(num_id, level, "<ul>", "</ul>")
+        if level_text is None:
+            raise UnsupportedDocxError(f"unsupported numbering {num_id}")
+        attributes = ""
+        if start != 1:
+            attributes += f' start="{start}"'
+        if num_format in LIST_TYPES:
+            attributes += f' type="{LIST_TYPES[num_format]}"'
+        return _ListItem(num_id, level, f"<ol{attributes}>", "</ol>")
+
+    def _read_hyperlink(self, hyperlink: Element) -> List[Inline]:
+        relationship_id = hyperlink.get(f"{{{RELATIONSHIPS_NAMESPACE}}}id")
+        if hyperlink.get(_w("anchor")) is not None or relationship_id not in self._hyperlinks:
+            raise UnsupportedDocxError("unsupported hyperlink")
+
+        parts: List[List[Inline]] = []
+        for child in hyperlink:
+            if child.tag == RUN:
+                parts.append(self._read_run(child, in_hyperlink=True))
+            elif child.tag != _w("proofErr"):
+                raise UnsupportedDocxError(f"unsupported element {child.tag}")
+        return [(LINK, smush_inlines(parts), self._hyperlinks[relationship_id])]
+
+    def _read_bookmark(self, bookmark: Element, in_heading: bool) -> List[Inline]:
+        name = bookmark.get(_w("name"), "")
+        if name in IGNORED_BOOKMARKS:
+            return []
+        if not in_heading:
+            if name in self._used_identifiers:
+                raise UnsupportedDocxError(f"duplicate bookmark {name}")
+            self._used_identifiers.add(name)
+        return [(ANCHOR, [], name)]
+
+    def _read_run(self, run: Element, in_hyperlink: bool) -> List[Inline]:
+        bold, italic = self._read_run_properties(run.find(RUN_PROPERTIES))
+        parts: List[List[Inline]] = []
+        for child in run:
+            if child.tag == TEXT:
+                parts.append(text_to_inlines(child.text or ""))
+            elif child.tag == TAB:
+                parts.append([SPACE])
+            elif child.tag == BREAK and child.get(_w("type")) in PASSTHROUGH_BREAKS:
+                parts.append([LINE_BREAK])
+            elif child.tag not in IGNORED_RUN_CHILDREN:
+                raise UnsupportedDocxError(f"unsupported element {child.tag}")
+
+        inlines = smush_inlines(parts)
+        if bold:
+            inlines = [(STRONG, inlines, None)]
+        if italic:
+            inlines = [(EMPH, inlines, None)]
+        return inlines
+
+    def _read_run_properties(self, properties: Optional[Element]) -> Tuple[bool, bool]:
+        bold: Optional[bool] = None
+        italic: Optional[bool] = None
+        style_id: Optional[str] = None
+        if properties is not None:
+            bold, italic = _read_formatting(properties)
+            style = properties.find(RUN_STYLE)
+            style_id = None if style is None else style.get(VAL)
+
+        seen_styles = set()
+        while style_id is not None and style_id not in seen_styles:
+            seen_styles.add(style_id)
+            style = self._character_styles.get(style_id)
+            if style is None:
+                raise UnsupportedDocxError(f"unknown character style {style_id}")
+            name_element = style.find(_w("name"))
+            name = "" if name_element is None else name_element.get(VAL, "").lower()
+            style_properties = style.find(RUN_PROPERTIES)
+            if style_properties is not None:
+                style_bold, style_italic = _read_formatting(
+                    style_properties, ignore_underline=name == HYPERLINK_STYLE
+                )
+                if name == HYPERLINK_STYLE and (style_bold or style_italic):
+                    raise UnsupportedDocxError("formatted hyperlink style")
+                bold = style_bold if bold is None else bold
+                italic = style_italic if italic is None else italic
+            based_on = style.find(_w("basedOn"))
+            style_id = None if based_on is None else based_on.get(VAL)
+        return bool(bold), bool(italic)
+
+
+def _read_formatting(
+    properties: Element, ignore_underline: bool = False
+) -> Tuple[Optional[bool], Optional[bool]]:
+    bold: Optional[bool] = None
+    italic: Optional[bool] = None
+    for child in properties:
+        if child.tag == BOLD:
+            bold = _on_off(child)
+        elif child.tag == ITALIC:
+            italic = _on_off(child)
+        elif child.tag in NEUTRAL_RUN_PROPERTIES or child.tag == RUN_STYLE:
+            continue
+        elif child.tag in RUN_PROPERTIES_OFF_ONLY and _on_off(child) is False:
+            continue
+        elif child.tag in RUN_PROPERTIES_NONE_ONLY and (
+            child.get(VAL) == "none" or (ignore_underline and child.tag == _w("u"))
+        ):
+            continue
+        else:
+            raise UnsupportedDocxError(f"unsupported run property {child.tag}")
+    return bold, italic
+
+
+def _on_off_attribute(value: Optional[str]) -> bool:
+    return value is not None and value in ON_VALUES
+
+
+def _get_indent(indentation: Element) -> int:
+    left = indentation.get(_w("left"), indentation.get(_w("start"), "0"))
+    hanging = indentation.get(_w("hanging"), "0")
+    return int(left) - int(hanging)
@@ -1,4 +1,14 @@
-from .constants import DEFAULT_ENCODING
+import hashlib
+import os
+from typing import Iterator, List
+
+from .constants import (
+    DEFAULT_ENCODING,
+    DOCX_EXTENSION,
+    HASH_CHUNK_SIZE,
+    HTML_EXTENSION,
+    ZIP_EXTENSION,
+)
 
 
 def save_file(file_path: str, file_content: str) -> int:
@@ -11,3 +21,56 @@ def read_file(file_path: str) -> str:
     with open(file_path, "r", encoding=DEFAULT_ENCODING) as f:
         content = f.read()
     return content
+
+
+def set_html_ext(file_path: str) -> str:
+    return f"{os.path.splitext(file_path)[0]}.{HTML_EXTENSION}"
+
+
+def is_docx_file(file_name: str) -> bool:
+    return file_name.lower().endswith(f".{DOCX_EXTENSION}") and not file_name.startswith("~$")
+
+
+def is_zip_file(file_name: str) -> bool:
+    return file_name.lower().endswith(f".{ZIP_EXTENSION}")
+
+
+def scan_docx_files(dir_path: str) -> Iterator[str]:
+    dir_paths = [dir_path]
+    while dir_paths:
+        try:
+            with os.scandir(dir_paths.pop()) as scanner:
+                entries = sorted(scanner, key=lambda entry: entry.name)
+        except OSError:
+            continue
+
+        sub_dir_paths: List[str] = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    sub_dir_paths.append(entry.path)
+                elif is_docx_file(entry.name) and entry.is_file():
+                    yield entry.path
+            except OSError:
+                continue
+        dir_paths.extend(reversed(sub_dir_paths))
+
+
+def hash_file(file_path: str, chunk_size: int = HASH_CHUNK_SIZE) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def files_equal(first_path: str, second_path: str, chunk_size: int = HASH_CHUNK_SIZE) -> bool:
+    if os.path.getsize(first_path) != os.path.getsize(second_path):
+        return False
+    with open(first_path, "rb") as first, open(second_path, "rb") as second:
+        while True:
+            first_chunk = first.read(chunk_size)
+            if first_chunk != second.read(chunk_size):
+                return False
+            if not first_chunk:
+                return True
@@ -0,0 +1,106 @@
+import hashlib
+import os
+import threading
+from typing import IO, Dict, Optional
+
+from .archives import open_docx
+from .constants import HASH_CHUNK_SIZE
+from .sinks import get_temp_path
+
+DOCX_MEDIA_PREFIX = "word/media/"
+DOCX_PART_PREFIX = "word/"
+
+
+def get_assets_url(assets_dir: str, html_path: str) -> str:
+    from urllib.parse import quote
+
+    relative_dir = os.path.relpath(
+        os.path.abspath(assets_dir), os.path.dirname(os.path.abspath(html_path))
+    )
+    return quote(relative_dir.replace(os.sep, "/"))
+
+
+def store_asset(source: IO[bytes], assets_dir: str, extension: str) -> str:
+    digest = hashlib.sha256()
+    temp_path = get_temp_path(os.path.join(assets_dir, f"asset{extension}"))
+    try:
+        with open(temp_path, "wb") as target:
+            for chunk in iter(lambda: source.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+                target.write(chunk)
+        asset_name = f"{digest.hexdigest()}{extension}"
+        asset_path = os.path.join(assets_dir, asset_name)
+        if os.path.exists(asset_path):
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, asset_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    return asset_name
+
+
+def extract_images(
+    docx_path: str, assets_dir: str, stop_event: Optional[threading.Event] = None
+) -> Dict[str, str]:
+    import zipfile
+
+    asset_names: Dict[str, str] = {}
+    with open_docx(docx_path) as source, zipfile.ZipFile(source) as archive:
+        for info in archive.infolist():
+            if stop_event is not None and stop_event.is_set():
+                break
+            if not info.filename.startswith(DOCX_MEDIA_PREFIX) or info.is_dir():
+                continue
+            if not asset_names:
+                os.makedirs(assets_dir, exist_ok=True)
+            extension = os.path.splitext(info.filename)[1].lower()
+            with archive.open(info) as source:
+                asset_names[info.filename[len(DOCX_PART_PREFIX):]] = store_asset(
+                    source, assets_dir, extension
+                )
+    return asset_names
+
+
+class ImageExtractor:
+    def __init__(self, docx_path: str, assets_dir: str, assets_url: str) -> None:
+        self.docx_path = docx_path
+        self.assets_dir = assets_dir
+        self.assets_url = assets_url
+        self._asset_names: Dict[str, str] = {}
+        self._error: Optional[BaseException] = None
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    @property
+    def cache_key(self) -> str:
+        return f"images:{self.assets_url}"
+
+    def start(self) -> "ImageExtractor":
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def sources(self) -> Dict[str, str]:
+        self._thread.join()
+        if self._error is not None:
+            raise RuntimeError(
+                f"Cannot extract images from {self.docx_path}: {self._error}"
+            ) from self._error
+        return {
+            media_name: f"{self.assets_url}/{asset_name}"
+            for media_name, asset_name in self._asset_names.items()
+        }
+
+    def _run(self) -> None:
+        try:
+            self._asset_names = extract_images(self.docx_path, self.assets_dir, self._stop_event)
+        except Exception as exc:
+            self._error = exc
@@ -0,0 +1,162 @@
+import json
+import os
+import threading
+from typing import Dict, Optional, TextIO
+
+from .archives import stat_docx
+from .cache import get_default_cache_dir
+from .constants import DEFAULT_ENCODING, JOURNAL_FILE_NAME, TEMP_FILE_SUFFIX
+
+PLANNED_STATUS = "planned"
+DONE_STATUS = "done"
+FAILED_STATUS = "failed"
+
+
+def get_default_journal_path() -> str:
+    return os.path.join(get_default_cache_dir(), JOURNAL_FILE_NAME)
+
+
+class BatchJournal:
+    def __init__(self, journal_path: str) -> None:
+        self.journal_path = journal_path
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self._file: Optional[TextIO] = None
+        self.load()
+
+    def load(self) -> None:
+        self._entries = {}
+        line_count = 0
+        line = "\n"
+        try:
+            with open(self.journal_path, "r", encoding=DEFAULT_ENCODING) as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        entry = json.loads(line)
+                        self._entries[entry["docx_path"]] = entry
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue
+        except FileNotFoundError:
+            pass
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.journal_path)), exist_ok=True)
+        if line_count > 2 * len(self._entries):
+            self._compact()
+            line = "\n"
+        self._file = open(self.journal_path, "a", encoding=DEFAULT_ENCODING)
+        if not line.endswith("\n"):
+            self._file.write("\n")
+
+    def is_done(
+        self,
+        docx_path: str,
+        html_path: str,
+        remove_prefix: bool,
+        remove_strong: bool,
+        options: str = "",
+    ) -> bool:
+        entry = self._entries.get(docx_path)
+        if entry is None or entry["status"] != DONE_STATUS:
+            return False
+        if (
+            entry["html_path"],
+            entry["remove_prefix"],
+            entry["remove_strong"],
+            entry.get("options", ""),
+        ) != (html_path, remove_prefix, remove_strong, options):
+            return False
+        try:
+            size, mtime_ns = stat_docx(docx_path)
+        except OSError:
+            return False
+        return (
+            entry["size"] == size
+            and entry["mtime_ns"] == mtime_ns
+            and os.path.exists(html_path)
+        )
+
+    def plan(
+        self,
+        docx_path: str,
+        html_path: str,
+        remove_prefix: bool,
+        remove_strong: bool,
+        options: str = "",
+    ) -> None:
+        self._write(PLANNED_STATUS, docx_path, html_path, remove_prefix, remove_strong, options)
+
+    def finish(
+        self,
+        docx_path: str,
+        html_path: str,
+        remove_prefix: bool,
+        remove_strong: bool,
+        success: bool,
+        options: str = "",
+    ) -> None:
+        self._write(
+            DONE_STATUS if success else FAILED_STATUS,
+            docx_path,
+            html_path,
+            remove_prefix,
+            remove_strong,
+            options,
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def remove(self) -> None:
+        self.close()
+        try:
+            os.remove(self.journal_path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self) -> "BatchJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _write(
+        self,
+        status: str,
+        docx_path: str,
+        html_path: str,
+        remove_prefix: bool,
+        remove_strong: bool,
+        options: str,
+    ) -> None:
+        entry = {
+            "status": status,
+            "docx_path": docx_path,
+            "html_path": html_path,
+            "remove_prefix": remove_prefix,
+            "remove_strong": remove_strong,
+            "options": options,
+        }
+        if status == DONE_STATUS:
+            try:
+                entry["size"], entry["mtime_ns"] = stat_docx(docx_path)
+            except OSError:
+                entry["status"] = FAILED_STATUS
+
+        line = json.dumps(entry, sort_keys=True)
+        with self._lock:
+            if self._file is None:
+                raise RuntimeError(f"{self.journal_path} is already closed")
+            self._entries[docx_path] = entry
+            self._file.write(f"{line}\n")
+            self._file.flush()
+
+    def _compact(self) -> None:
+        temp_path = f"{self.journal_path}{TEMP_FILE_SUFFIX}"
+        with open(temp_path, "w", encoding=DEFAULT_ENCODING) as f:
+            for entry in self._entries.values():
+                f.write(f"{json.dumps(entry, sort_keys=True)}\n")
+        os.replace(temp_path, self.journal_path)
@@ -0,0 +1,129 @@
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from .backends import get_backend
+from .cache import get_cache
+from .constants import AST_FORMAT, DEFAULT_ENCODING, HTML_EXTENSION
+
+PREFIX_LIST_TYPE = "BulletList"
+STRONG_TYPE = "Strong"
+ATTR_INDEXES = {
+    "Header": 1,
+    "CodeBlock": 0,
+    "Div": 0,
+    "Table": 0,
+    "Figure": 0,
+    "Code": 0,
+    "Link": 0,
+    "Image": 0,
+    "Span": 0,
+}
+
+
+def get_cached_ast(
+    data: bytes, input_format: str
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+    cache = get_cache()
+    if cache is None:
+        return None, None
+    cache_key = cache.make_ast_key(data, input_format, get_backend().version())
+    cached_ast = cache.get(cache_key)
+    return cache_key, json.loads(cached_ast) if cached_ast is not None else None
+
+
+def store_ast(cache_key: Optional[str], ast_json: str) -> Dict[str, Any]:
+    cache = get_cache()
+    if cache is not None and cache_key is not None:
+        cache.put(cache_key, ast_json)
+    return json.loads(ast_json)
+
+
+def read_ast(
+    data: bytes,
+    input_format: str,
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> Dict[str, Any]:
+    cache_key, ast = get_cached_ast(data, input_format)
+    if ast is not None:
+        return ast
+    ast_json = get_backend().convert_bytes(
+        data,
+        input_format,
+        timeout=timeout,
+        cancel_event=cancel_event,
+        output_format=AST_FORMAT,
+    )
+    return store_ast(cache_key, ast_json)
+
+
+def remove_prefix_blocks(ast: Dict[str, Any]) -> None:
+    for index, block in enumerate(ast["blocks"]):
+        if block.get("t") == PREFIX_LIST_TYPE:
+            del ast["blocks"][: index + 1]
+            return None
+
+
+def transform_node(node: Any, remove_strong: bool) -> Any:
+    if isinstance(node, list):
+        transformed_nodes = []
+        for item in node:
+            if remove_strong and isinstance(item, dict) and item.get("t") == STRONG_TYPE:
+                transformed_nodes.extend(transform_node(item["c"], remove_strong))
+            else:
+                transformed_nodes.append(transform_node(item, remove_strong))
+        return transformed_nodes
+    if not isinstance(node, dict):
+        return node
+
+    transformed_node = {key: transform_node(value, remove_strong) for key, value in node.items()}
+    attr_index = ATTR_INDEXES.get(transformed_node.get("t"))
+    if attr_index is not None:
+        transformed_node["c"][attr_index][0] = ""
+    return transformed_node
+
+
+def transform_ast(ast: Dict[str, Any], remove_prefix: bool, remove_strong: bool) -> Dict[str, Any]:
+    if remove_prefix:
+        ast = dict(ast, blocks=list(ast["blocks"]))
+        remove_prefix_blocks(ast)
+    return transform_node(ast, remove_strong)
+
+
+def dump_ast(ast: Dict[str, Any]) -> bytes:
+    return json.dumps(ast, ensure_ascii=False).encode(DEFAULT_ENCODING)
+
+
+def prepare_ast(ast: Dict[str, Any], remove_prefix: bool, remove_strong: bool) -> bytes:
+    return dump_ast(transform_ast(ast, remove_prefix, remove_strong))
+
+
+def render_html(
+    ast: Dict[str, Any],
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> str:
+    return get_backend().convert_bytes(
+        dump_ast(ast),
+        AST_FORMAT,
+        timeout=timeout,
+        cancel_event=cancel_event,
+        output_format=HTML_EXTENSION,
+    )
+
+
+def convert_ast_html(
+    data: bytes,
+    input_format: str,
+    remove_prefix: bool,
+    remove_strong: bool,
+    timeout: Optional[float] = None,
+    cancel_event: Optional[threading.Event] = None,
+) -> str:
+    ast = read_ast(data, input_format, timeout=timeout, cancel_event=cancel_event)
+    return render_html(
+        transform_ast(ast, remove_prefix, remove_strong),
+        timeout=timeout,
+        cancel_event=cancel_event,
+    )
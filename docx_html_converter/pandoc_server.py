@@ -0,0 +1,267 @@
+import base64
+import http.client
+import json
+import socket
+import subprocess
+import threading
+import time
+import urllib.request
+from typing import Any, Dict, Optional
+
+from .backends import ConversionCancelled, ConversionTimeout, PandocBackend, PypandocBackend
+from .constants import (
+    CANCEL_POLL_INTERVAL_S,
+    HTML_EXTENSION,
+    PANDOC_SERVER_HOST,
+    PANDOC_SERVER_REQUEST_TIMEOUT_S,
+    PANDOC_SERVER_STARTUP_TIMEOUT_S,
+    SERVER_BACKEND,
+)
+
+TEXT_INPUT_FORMATS = ("markdown", "html", "rst", "latex", "org", "json")
+
+
+class PandocServerUnavailable(OSError):
+    pass
+
+
+def _is_timeout(exc: BaseException) -> bool:
+    return isinstance(exc, (socket.timeout, TimeoutError)) or isinstance(
+        getattr(exc, "reason", None), (socket.timeout, TimeoutError)
+    )
+
+
+class PandocServerBackend(PandocBackend):
+    name = SERVER_BACKEND
+
+    def __init__(
+        self,
+        pandoc_path: Optional[str] = None,
+        host: str = PANDOC_SERVER_HOST,
+        port: int = 0,
+        fallback: Optional[PandocBackend] = None,
+    ) -> None:
+        self._pandoc_path = pandoc_path
+        self._host = host
+        self._port = port
+        self._fallback = fallback if fallback is not None else PypandocBackend()
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+        self._failed = False
+        self._version: Optional[str] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self._host}:{self._port}"
+
+    def start(self) -> None:
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                return None
+
+            if not self._pandoc_path:
+                import pypandoc
+
+                self._pandoc_path = pypandoc.get_pandoc_path()
+            if not self._port:
+                self._port = _find_free_port(self._host)
+
+            self._process = subprocess.Popen(
+                [self._pandoc_path, "server", f"--port={self._port}"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+            deadline = time.monotonic() + PANDOC_SERVER_STARTUP_TIMEOUT_S
+            while time.monotonic() < deadline:
+                if self._process.poll() is not None:
+                    break
+                try:
+                    with urllib.request.urlopen(
+                        f"{self.url}/version", timeout=1
+                    ) as response:
+                        response.read()
+                    return None
+                except OSError:
+                    time.sleep(0.05)
+
+            self._stop_process()
+            raise PandocServerUnavailable(f"pandoc server did not start on {self.url}")
+
+    def convert_file(
+        self,
+        docx_path: str,
+        input_format: str,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> str:
+        with open(docx_path, "rb") as f:
+            data = f.read()
+
+        html_content = self._convert_on_server(data, input_format, timeout, cancel_event)
+        if html_content is None:
+            return self._fallback.convert_file(
+                docx_path, input_format, timeout=timeout, cancel_event=cancel_event
+            )
+        return html_content
+
+    def convert_bytes(
+        self,
+        data: bytes,
+        input_format: str,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+        output_format: str = HTML_EXTENSION,
+    ) -> str:
+        html_content = self._convert_on_server(
+            data, input_format, timeout, cancel_event, output_format
+        )
+        if html_content is None:
+            return self._fallback.convert_bytes(
+                data,
+                input_format,
+                timeout=timeout,
+                cancel_event=cancel_event,
+                output_format=output_format,
+            )
+        return html_content
+
+    def version(self) -> str:
+        if self._version is None and not self._failed:
+            try:
+                self.start()
+                with urllib.request.urlopen(f"{self.url}/version", timeout=1) as response:
+                    self._version = response.read().decode().strip()
+            except OSError:
+                self._failed = True
+                self._stop_process()
+        if self._version is None:
+            return self._fallback.version()
+        return self._version
+
+    def close(self) -> None:
+        with self._lock:
+            self._stop_process()
+        self._fallback.close()
+
+    def _convert_on_server(
+        self,
+        data: bytes,
+        input_format: str,
+        timeout: Optional[float] = None,
+        cancel_event: Optional[threading.Event] = None,
+        output_format: str = HTML_EXTENSION,
+    ) -> Optional[str]:
+        if self._failed:
+            return None
+        if cancel_event is not None and cancel_event.is_set():
+            raise ConversionCancelled("pandoc server request was cancelled")
+        deadline = None if timeout is None else time.monotonic() + timeout
+        request_timeout = PANDOC_SERVER_REQUEST_TIMEOUT_S
+        try:
+            self.start()
+            if deadline is not None:
+                request_timeout = min(deadline - time.monotonic(), request_timeout)
+            if request_timeout <= 0:
+                raise ConversionTimeout(f"pandoc server did not finish within {timeout:g} s")
+            return self._request(data, input_format, request_timeout, output_format, cancel_event)
+        except OSError as exc:
+            if _is_timeout(exc):
+                raise ConversionTimeout(
+                    f"pandoc server did not finish within {request_timeout:g} s"
+                ) from exc
+            if self._process is None or self._process.poll() is not None:
+                self._failed = True
+                self._stop_process()
+        return None
+
+    def _request(
+        self,
+        data: bytes,
+        input_format: str,
+        timeout: Optional[float] = None,
+        output_format: str = HTML_EXTENSION,
+        cancel_event: Optional[threading.Event] = None,
+    ) -> str:
+        if input_format in TEXT_INPUT_FORMATS:
+            text = data.decode("utf-8")
+        else:
+            text = base64.b64encode(data).decode("ascii")
+        body = json.dumps({"text": text, "from": input_format, "to": output_format}).encode("utf-8")
+        if timeout is None:
+            timeout = PANDOC_SERVER_REQUEST_TIMEOUT_S
+        if cancel_event is None:
+            cancel_event = threading.Event()
+        deadline = time.monotonic() + timeout
+        connection = http.client.HTTPConnection(self._host, self._port, timeout=timeout)
+        outcome: Dict[str, Any] = {}
+
+        def send() -> None:
+            try:
+                outcome["output"] = self._send(connection, body)
+            except BaseException as exc:
+                outcome["error"] = exc
+
+        sender = threading.Thread(target=send, daemon=True)
+        sender.start()
+        while sender.is_alive():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _abort_connection(connection)
+                raise socket.timeout(f"pandoc server did not answer within {timeout:g} s")
+            if cancel_event.wait(min(remaining, CANCEL_POLL_INTERVAL_S)) and sender.is_alive():
+                _abort_connection(connection)
+                raise ConversionCancelled("pandoc server request was cancelled")
+        if "error" in outcome:
+            raise outcome["error"]
+        return outcome["output"]
+
+    def _send(self, connection: http.client.HTTPConnection, body: bytes) -> str:
+        try:
+            connection.request(
+                "POST",
+                "/",
+                body=body,
+                headers={"Content-Type": "application/json", "Accept": "application/json"},
+            )
+            response = connection.getresponse()
+            content = response.read()
+        finally:
+            connection.close()
+        if response.status >= 400:
+            raise RuntimeError(content.decode(errors="replace"))
+        payload = json.loads(content)
+
+        if "error" in payload:
+            raise RuntimeError(payload["error"])
+        output = payload.get("output", "")
+        if payload.get("base64"):
+            output = base64.b64decode(output).decode("utf-8")
+        return output
+
+    def _stop_process(self) -> None:
+        if self._process is None:
+            return None
+        if self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=PANDOC_SERVER_STARTUP_TIMEOUT_S)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+
+
+def _abort_connection(connection: http.client.HTTPConnection) -> None:
+    sock = connection.sock
+    if sock is not None:
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+    connection.close()
+
+
+def _find_free_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
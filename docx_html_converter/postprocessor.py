@@ -0,0 +1,350 @@
+import re
+from functools import lru_cache
+from html.parser import HTMLParser
+from typing import Callable, Dict, List, Optional, Tuple
+
+PREFIX_LIST_TAG = "ul"
+STRONG_START_TAG = "<strong>"
+STRONG_END_TAG = "</strong>"
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+VOID_ELEMENTS = frozenset(
+    (
+        "area", "base", "br", "col", "embed", "hr", "img", "input", "keygen", "link",
+        "menuitem", "meta", "param", "source", "track", "wbr", "basefont", "bgsound",
+        "command", "frame", "image", "isindex", "nextid", "spacer",
+    )
+)
+BLOCK_ELEMENTS = frozenset(
+    (
+        "address", "article", "aside", "blockquote", "body", "br", "caption", "col",
+        "colgroup", "dd", "details", "div", "dl", "dt", "fieldset", "figcaption", "figure",
+        "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "head", "header", "hr", "html",
+        "li", "link", "main", "meta", "nav", "ol", "p", "pre", "section", "summary", "table",
+        "tbody", "td", "tfoot", "th", "thead", "title", "tr", "ul",
+    )
+)
+PRESERVE_WHITESPACE_ELEMENTS = frozenset(("pre", "textarea"))
+RAW_TEXT_ELEMENTS = frozenset(("script", "style"))
+MULTI_VALUED_ATTRIBUTES = {
+    "*": frozenset(("class", "accesskey", "dropzone")),
+    "a": frozenset(("rel", "rev")),
+    "link": frozenset(("rel", "rev")),
+    "td": frozenset(("headers",)),
+    "th": frozenset(("headers",)),
+    "form": frozenset(("accept-charset",)),
+    "object": frozenset(("archive",)),
+    "area": frozenset(("rel",)),
+    "icon": frozenset(("sizes",)),
+    "iframe": frozenset(("sandbox",)),
+    "output": frozenset(("for",)),
+}
+OUTPUT_ENCODING = "utf-8"
+OUTPUT_BUFFER_PIECES = 1024
+LIST_TAG_RE = re.compile(
+    r"<!--.*?-->|<(/?)(ul|ol)(?=[\s/>])[^>]*>", flags=re.DOTALL | re.IGNORECASE
+)
+NON_WHITESPACE_RE = re.compile(r"\S+")
+WHITESPACE_RUN_RE = re.compile(f"[{ASCII_SPACES}]+")
+CONDITIONAL_COMMENT_PREFIX = "[if"
+META_CHARSET_RE = re.compile(r"((^|;)\s*charset=)([^;]*)", re.M)
+NONCHARACTERS = frozenset(
+    [0xFFFE, 0xFFFF]
+    + [plane + offset for plane in range(0x1FFFE, 0x10FFFF, 0x10000) for offset in (0, 1)]
+)
+
+
+@lru_cache(maxsize=None)
+def get_entity_table() -> Dict[str, str]:
+    from html.entities import html5
+
+    entities: Dict[str, str] = {}
+    for name, character in sorted(html5.items()):
+        entities.setdefault(name[:-1] if name.endswith(";") else name, character)
+    return entities
+
+
+def decode_charref(name: str) -> str:
+    if name[0] in "xX":
+        code_point = int(name[1:], 16)
+    else:
+        code_point = int(name)
+
+    if code_point == 0 or code_point > 0x10FFFF or 0xD800 <= code_point <= 0xDFFF:
+        return "\ufffd"
+    if 0xFDD0 <= code_point <= 0xFDEF or code_point in NONCHARACTERS:
+        return chr(code_point)
+    if 0x80 <= code_point <= 0x9F:
+        try:
+            return bytes((code_point,)).decode("cp1252")
+        except UnicodeDecodeError:
+            pass
+    return chr(code_point)
+
+
+def escape_text(text: str) -> str:
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def quote_attribute(value: str) -> str:
+    value = escape_text(value)
+    if '"' not in value:
+        return f'"{value}"'
+    if "'" not in value:
+        return f"'{value}'"
+    return '"' + value.replace('"', "&quot;") + '"'
+
+
+class HtmlPostProcessor(HTMLParser):
+    def __init__(
+        self,
+        write: Callable[[str], object],
+        remove_strong: bool = False,
+        fix_newlines: bool = False,
+        image_sources: Optional[Dict[str, str]] = None,
+        minify: bool = False,
+    ) -> None:
+        super().__init__(convert_charrefs=False)
+        self._write = write
+        self.remove_strong = remove_strong
+        self.fix_newlines = fix_newlines
+        self.image_sources = image_sources
+        self.minify = minify
+        self._after_block = True
+        self._pending_newline = False
+        self._endtag_start = 0
+        self._output: List[str] = []
+        self._text: List[str] = []
+        self._open_tags: List[str] = []
+        self._closed_void_tags: List[str] = []
+        self._preserve_depth = 0
+
+    def close(self) -> None:
+        super().close()
+        self._flush_text(before_block=True)
+        while self._open_tags:
+            self._pop_tag()
+        self._flush_output()
+        if self._pending_newline:
+            self._write("\n")
+            self._pending_newline = False
+
+    def parse_endtag(self, i: int) -> int:
+        self._endtag_start = i
+        return super().parse_endtag(i)
+
+    def handle_starttag(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]], is_void: bool = True
+    ) -> None:
+        starttag_text = self.get_starttag_text()
+        if self.remove_strong and starttag_text == STRONG_START_TAG:
+            return None
+
+        self._flush_text(before_block=tag in BLOCK_ELEMENTS)
+        self._after_block = tag in BLOCK_ELEMENTS
+        if tag in VOID_ELEMENTS:
+            self._emit(self._format_starttag(tag, attrs, "/>"))
+            if is_void:
+                self._closed_void_tags.append(tag)
+            return None
+
+        self._emit(self._format_starttag(tag, attrs, ">"))
+        self._open_tags.append(tag)
+        if tag in PRESERVE_WHITESPACE_ELEMENTS:
+            self._preserve_depth += 1
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self.handle_starttag(tag, attrs, is_void=False)
+        if tag not in VOID_ELEMENTS:
+            self._pop_to_tag(tag)
+
+    def handle_endtag(self, tag: str) -> None:
+        if self.remove_strong and self.rawdata.startswith(STRONG_END_TAG, self._endtag_start):
+            return None
+        if tag in self._closed_void_tags:
+            self._closed_void_tags.remove(tag)
+            return None
+
+        self._flush_text(before_block=tag in BLOCK_ELEMENTS)
+        self._after_block = tag in BLOCK_ELEMENTS
+        self._pop_to_tag(tag)
+
+    def handle_data(self, data: str) -> None:
+        self._text.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        self._text.append(get_entity_table().get(name, f"&{name}"))
+
+    def handle_charref(self, name: str) -> None:
+        self._text.append(decode_charref(name))
+
+    def handle_comment(self, data: str) -> None:
+        if self.minify and not data.startswith(CONDITIONAL_COMMENT_PREFIX):
+            return None
+        self._handle_markup("<!--", data, "-->")
+
+    def handle_decl(self, decl: str) -> None:
+        self._handle_markup("<!DOCTYPE ", decl[len("DOCTYPE "):], ">\n")
+
+    def handle_pi(self, data: str) -> None:
+        self._handle_markup("<?", data, ">")
+
+    def unknown_decl(self, data: str) -> None:
+        if data.upper().startswith("CDATA["):
+            self._handle_markup("<![CDATA[", data[len("CDATA["):], "]]>")
+        else:
+            self._handle_markup("<?", data, "?>")
+
+    def _handle_markup(self, prefix: str, data: str, suffix: str) -> None:
+        self._flush_text()
+        self._emit(prefix + self._collapse_whitespace(data) + suffix)
+
+    def _collapse_whitespace(self, data: str) -> str:
+        if self._preserve_depth or data.strip(ASCII_SPACES):
+            return data
+        return "\n" if "\n" in data else " "
+
+    def _flush_text(self, before_block: bool = False) -> None:
+        if not self._text:
+            return None
+        text = "".join(self._text)
+        self._text.clear()
+        is_raw_text = bool(self._open_tags) and self._open_tags[-1] in RAW_TEXT_ELEMENTS
+        if self.minify and not self._preserve_depth and not is_raw_text:
+            text = self._minify_text(text, before_block)
+            if not text:
+                return None
+        else:
+            text = self._collapse_whitespace(text)
+        if not is_raw_text:
+            text = escape_text(text)
+        self._after_block = False
+        self._emit(text)
+        if len(self._output) >= OUTPUT_BUFFER_PIECES:
+            self._flush_output()
+
+    def _minify_text(self, text: str, before_block: bool) -> str:
+        text = WHITESPACE_RUN_RE.sub(" ", text)
+        if self._after_block:
+            text = text.lstrip(" ")
+        if before_block:
+            text = text.rstrip(" ")
+        return text
+
+    def _emit(self, piece: str) -> None:
+        self._output.append(piece)
+        if len(self._output) >= OUTPUT_BUFFER_PIECES:
+            self._flush_output()
+
+    def _flush_output(self) -> None:
+        if not self._output:
+            return None
+        content = "".join(self._output)
+        self._output.clear()
+        if self.fix_newlines:
+            content = content.replace("\r", "\n")
+            if self._pending_newline:
+                content = "\n" + content
+            content = content.replace("\n\n", " ")
+            self._pending_newline = content.endswith("\n")
+            if self._pending_newline:
+                content = content[:-1]
+        if content:
+            self._write(content)
+
+    def _pop_tag(self) -> None:
+        tag = self._open_tags.pop()
+        if tag in PRESERVE_WHITESPACE_ELEMENTS:
+            self._preserve_depth -= 1
+        self._emit(f"</{tag}>")
+
+    def _pop_to_tag(self, tag: str) -> None:
+        if tag not in self._open_tags:
+            return None
+        while self._open_tags[-1] != tag:
+            self._pop_tag()
+        self._pop_tag()
+
+    def _format_starttag(
+        self, tag: str, attrs: List[Tuple[str, Optional[str]]], end: str
+    ) -> str:
+        attr_values: Dict[str, str] = {}
+        for key, value in attrs:
+            attr_values[key] = "" if value is None else value
+        attr_values.pop("id", None)
+        if tag == "img" and self.image_sources and "src" in attr_values:
+            attr_values["src"] = self.image_sources.get(attr_values["src"], attr_values["src"])
+        if not attr_values:
+            return f"<{tag}{end}"
+
+        multi_valued = MULTI_VALUED_ATTRIBUTES["*"] | MULTI_VALUED_ATTRIBUTES.get(
+            tag, frozenset()
+        )
+        if tag == "meta":
+            self._set_meta_charset(attr_values)
+        formatted_attrs = []
+        for key in sorted(attr_values):
+            value = attr_values[key]
+            if key in multi_valued:
+                value = " ".join(NON_WHITESPACE_RE.findall(value))
+            formatted_attrs.append(f"{key}={quote_attribute(value)}")
+        return f"<{tag} {' '.join(formatted_attrs)}{end}"
+
+    @staticmethod
+    def _set_meta_charset(attr_values: Dict[str, str]) -> None:
+        if "charset" in attr_values:
+            attr_values["charset"] = OUTPUT_ENCODING
+        elif (
+            "content" in attr_values
+            and attr_values.get("http-equiv", "").lower() == "content-type"
+        ):
+            attr_values["content"] = META_CHARSET_RE.sub(
+                lambda match: match.group(1) + OUTPUT_ENCODING, attr_values["content"]
+            )
+
+
+def find_prefix_list(html_content: str) -> Optional[Tuple[int, int]]:
+    list_start = -1
+    depth = 0
+    for match in LIST_TAG_RE.finditer(html_content):
+        tag = match.group(2)
+        if tag is None:
+            continue
+        if not match.group(1):
+            if not depth and list_start < 0 and tag.lower() == PREFIX_LIST_TAG:
+                list_start = match.start()
+            depth += 1
+        elif depth:
+            depth -= 1
+            if not depth and list_start >= 0:
+                return list_start, match.end()
+    return None
+
+
+def strip_prefix_list(html_content: str) -> str:
+    prefix_list = find_prefix_list(html_content)
+    if prefix_list is None:
+        return html_content
+    return html_content[prefix_list[1]:].lstrip()
+
+
+def postprocess_html(
+    html_content: str,
+    write: Callable[[str], object],
+    remove_prefix: bool,
+    remove_strong: bool,
+    fix_newlines: bool = False,
+    image_sources: Optional[Dict[str, str]] = None,
+    minify: bool = False,
+) -> None:
+    if remove_prefix:
+        html_content = strip_prefix_list(html_content)
+
+    processor = HtmlPostProcessor(
+        write,
+        remove_strong=remove_strong,
+        fix_newlines=fix_newlines,
+        image_sources=image_sources,
+        minify=minify,
+    )
+    processor.feed(html_content)
+    processor.close()
@@ -0,0 +1,145 @@
+import os
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .constants import CSV_REPORT_FORMAT, JSON_REPORT_FORMAT, REPORT_FORMATS
+from .sinks import write_atomic
+from .telemetry import TOTAL_STAGE, ConversionTelemetry
+
+SUCCESS_STATUS = "success"
+SKIPPED_STATUS = "skipped"
+FAILED_STATUS = "failed"
+TIMEOUT_STATUS = "timeout"
+CANCELLED_STATUS = "cancelled"
+SUCCESS_STATUSES = frozenset((SUCCESS_STATUS, SKIPPED_STATUS))
+RESULT_FIELDS = (
+    "docx_path",
+    "html_path",
+    "status",
+    "duration_s",
+    "input_bytes",
+    "output_bytes",
+    "cached",
+    "error",
+    "message",
+)
+
+
+class ConversionResult:
+    def __init__(
+        self,
+        docx_path: str,
+        html_path: str,
+        status: str,
+        message: str,
+        error: Optional[str] = None,
+        duration_s: float = 0.0,
+        input_bytes: int = 0,
+        output_bytes: int = 0,
+        cached: bool = False,
+    ) -> None:
+        self.docx_path = docx_path
+        self.html_path = html_path
+        self.status = status
+        self.message = message
+        self.error = error
+        self.duration_s = duration_s
+        self.input_bytes = input_bytes
+        self.output_bytes = output_bytes
+        self.cached = cached
+
+    @classmethod
+    def from_telemetry(
+        cls, telemetry: ConversionTelemetry, status: str, message: str
+    ) -> "ConversionResult":
+        return cls(
+            telemetry.docx_path,
+            telemetry.html_path,
+            status,
+            message,
+            error=telemetry.error,
+            duration_s=telemetry.stages.get(TOTAL_STAGE, 0.0),
+            input_bytes=telemetry.input_bytes,
+            output_bytes=telemetry.output_bytes,
+            cached=telemetry.cached,
+        )
+
+    @property
+    def success(self) -> bool:
+        return self.status in SUCCESS_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "docx_path": self.docx_path,
+            "html_path": self.html_path,
+            "status": self.status,
+            "duration_s": round(self.duration_s, 6),
+            "input_bytes": self.input_bytes,
+            "output_bytes": self.output_bytes,
+            "cached": self.cached,
+            "error": self.error,
+            "message": self.message.rstrip(),
+        }
+
+    def __str__(self) -> str:
+        return self.message
+
+
+RESULT_SORT_KEYS: Dict[str, Callable[[ConversionResult], Any]] = {
+    "file": lambda result: result.docx_path,
+    "status": lambda result: (result.status, result.docx_path),
+    "duration": lambda result: result.duration_s,
+    "size": lambda result: result.output_bytes,
+}
+
+
+def sort_results(
+    results: Iterable[ConversionResult], key: str, reverse: bool = False
+) -> List[ConversionResult]:
+    return sorted(results, key=RESULT_SORT_KEYS[key], reverse=reverse)
+
+
+def filter_failures(results: Iterable[ConversionResult]) -> List[ConversionResult]:
+    return [result for result in results if not result.success]
+
+
+def get_report_format(report_path: str) -> str:
+    extension = os.path.splitext(report_path)[1][1:].lower()
+    return extension if extension in REPORT_FORMATS else JSON_REPORT_FORMAT
+
+
+def format_report(results: Iterable[ConversionResult], report_format: str) -> str:
+    records = [result.to_dict() for result in results]
+    if report_format == CSV_REPORT_FORMAT:
+        import csv
+        import io
+
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=RESULT_FIELDS, lineterminator="\n")
+        writer.writeheader()
+        writer.writerows(records)
+        return buffer.getvalue()
+    if report_format == JSON_REPORT_FORMAT:
+        import json
+
+        failed = sum(1 for record in records if record["status"] not in SUCCESS_STATUSES)
+        report = {
+            "total": len(records),
+            "succeeded": len(records) - failed,
+            "failed": failed,
+            "results": records,
+        }
+        return json.dumps(report, indent=2, ensure_ascii=False) + "\n"
+    raise ValueError(
+        f"Unknown report format {report_format!r}, expected one of: {', '.join(REPORT_FORMATS)}"
+    )
+
+
+def write_report(
+    results: Iterable[ConversionResult],
+    report_path: str,
+    report_format: Optional[str] = None,
+) -> None:
+    if report_format is None:
+        report_format = get_report_format(report_path)
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    write_atomic(report_path, format_report(results, report_format))
@@ -0,0 +1,302 @@
+import asyncio
+import ipaddress
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .batch import get_default_workers
+from .constants import (
+    DEFAULT_ENCODING,
+    SERVICE_HOST,
+    SERVICE_MAX_QUEUE,
+    SERVICE_MAX_UPLOAD_BYTES,
+    SERVICE_PORT,
+    SERVICE_READ_TIMEOUT_S,
+    SERVICE_RETRY_AFTER_S,
+)
+from .convertor import convert_bytes
+
+HTTP_REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    408: "Request Timeout",
+    411: "Length Required",
+    413: "Payload Too Large",
+    422: "Unprocessable Entity",
+    431: "Request Header Fields Too Large",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+FALSE_VALUES = frozenset(("0", "false", "no", "off"))
+MAX_HEADER_LINES = 100
+HTML_CONTENT_TYPE = f"text/html; charset={DEFAULT_ENCODING}"
+JSON_CONTENT_TYPE = "application/json"
+
+
+class HttpError(Exception):
+    def __init__(
+        self, status: int, message: str, headers: Optional[Dict[str, str]] = None
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+
+class ConversionService:
+    def __init__(
+        self,
+        host: str = SERVICE_HOST,
+        port: int = SERVICE_PORT,
+        max_workers: Optional[int] = None,
+        max_queue: int = SERVICE_MAX_QUEUE,
+        max_upload_bytes: int = SERVICE_MAX_UPLOAD_BYTES,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.workers = max_workers if max_workers else get_default_workers()
+        self.max_queue = max_queue
+        self.max_upload_bytes = max_upload_bytes
+        self.active = 0
+        self.queued = 0
+        self.rejected = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    @property
+    def capacity(self) -> int:
+        return self.workers + self.max_queue
+
+    async def start(self) -> None:
+        self._slots = asyncio.Semaphore(self.workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_queue_status(self) -> Dict[str, int]:
+        return {
+            "active": self.active,
+            "queued": self.queued,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "rejected": self.rejected,
+        }
+
+    def reserve(self) -> None:
+        if self.active + self.queued >= self.capacity:
+            self.rejected += 1
+            raise HttpError(
+                503,
+                "conversion queue is full",
+                {"Retry-After": str(SERVICE_RETRY_AFTER_S)},
+            )
+        self.queued += 1
+
+    async def convert(self, data: bytes, remove_prefix: bool, remove_strong: bool) -> str:
+        self.reserve()
+        return await self._convert_reserved(data, remove_prefix, remove_strong)
+
+    async def _convert_reserved(
+        self, data: bytes, remove_prefix: bool, remove_strong: bool
+    ) -> str:
+        try:
+            await self._slots.acquire()
+        finally:
+            self.queued -= 1
+        self.active += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor,
+                partial(
+                    convert_bytes,
+                    data,
+                    remove_prefix=remove_prefix,
+                    remove_strong=remove_strong,
+                ),
+            )
+        except RuntimeError as exc:
+            raise HttpError(422, str(exc)) from exc
+        finally:
+            self.active -= 1
+            self._slots.release()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            try:
+                status, content_type, body, headers = await self._handle_request(reader)
+            except HttpError as exc:
+                status, content_type, headers = exc.status, JSON_CONTENT_TYPE, exc.headers
+                body = json.dumps({"error": str(exc)}).encode(DEFAULT_ENCODING)
+            except asyncio.TimeoutError:
+                status, content_type, headers = 408, JSON_CONTENT_TYPE, {}
+                body = json.dumps({"error": "request timed out"}).encode(DEFAULT_ENCODING)
+            except Exception as exc:
+                status, content_type, headers = 500, JSON_CONTENT_TYPE, {}
+                body = json.dumps({"error": str(exc)}).encode(DEFAULT_ENCODING)
+            await _write_response(writer, status, content_type, body, headers)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_request(
+        self, reader: asyncio.StreamReader
+    ) -> Tuple[int, str, bytes, Dict[str, str]]:
+        method, target, headers = await asyncio.wait_for(
+            _read_head(reader), SERVICE_READ_TIMEOUT_S
+        )
+        url = urlsplit(target)
+        if url.path in ("/health", "/queue"):
+            if method != "GET":
+                raise HttpError(405, f"{method} is not allowed", {"Allow": "GET"})
+            payload = self.get_queue_status() if url.path == "/queue" else {"status": "ok"}
+            return 200, JSON_CONTENT_TYPE, json.dumps(payload).encode(DEFAULT_ENCODING), {}
+        if url.path != "/convert":
+            raise HttpError(404, f"{url.path} not found")
+        if method != "POST":
+            raise HttpError(405, f"{method} is not allowed", {"Allow": "POST"})
+
+        query = parse_qs(url.query)
+        remove_prefix = _get_flag(query, "remove_prefix")
+        remove_strong = _get_flag(query, "remove_strong")
+        if "chunked" in headers.get("transfer-encoding", "").lower():
+            raise HttpError(411, "chunked uploads are not supported")
+        try:
+            content_length = int(headers["content-length"])
+        except (KeyError, ValueError):
+            raise HttpError(411, "Content-Length is required") from None
+        if content_length < 0:
+            raise HttpError(400, "invalid Content-Length")
+        if content_length > self.max_upload_bytes:
+            raise HttpError(413, f"uploads are limited to {self.max_upload_bytes} bytes")
+
+        self.reserve()
+        try:
+            data = await asyncio.wait_for(
+                _read_body(reader, content_length), SERVICE_READ_TIMEOUT_S
+            )
+        except BaseException:
+            self.queued -= 1
+            raise
+
+        html_content = await self._convert_reserved(data, remove_prefix, remove_strong)
+        return 200, HTML_CONTENT_TYPE, html_content.encode(DEFAULT_ENCODING), {}
+
+
+async def _read_head(reader: asyncio.StreamReader) -> Tuple[str, str, Dict[str, str]]:
+    try:
+        request_line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+        method, target, _ = request_line.split(" ", 2)
+    except ValueError:
+        raise HttpError(400, "malformed request line") from None
+
+    headers: Dict[str, str] = {}
+    for _ in range(MAX_HEADER_LINES):
+        try:
+            line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+        except ValueError:
+            raise HttpError(431, "header line too long") from None
+        if not line:
+            return method, target, headers
+        name, separator, value = line.partition(":")
+        if not separator:
+            raise HttpError(400, "malformed header line")
+        headers[name.strip().lower()] = value.strip()
+    raise HttpError(431, "too many header lines")
+
+
+async def _read_body(reader: asyncio.StreamReader, content_length: int) -> bytes:
+    try:
+        return await reader.readexactly(content_length)
+    except asyncio.IncompleteReadError:
+        raise HttpError(400, "incomplete request body") from None
+
+
+def _get_flag(query: Dict[str, List[str]], name: str) -> bool:
+    value = query.get(name, ["1"])[-1].lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    raise HttpError(400, f"invalid value {value!r} for {name}")
+
+
+async def _write_response(
+    writer: asyncio.StreamWriter,
+    status: int,
+    content_type: str,
+    body: bytes,
+    headers: Dict[str, str],
+) -> None:
+    head = [
+        f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}",
+        f"Content-Type: {content_type}",
+        f"Content-Length: {len(body)}",
+        "Connection: close",
+        *(f"{name}: {value}" for name, value in headers.items()),
+    ]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+
+
+def is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+def run_service(
+    host: str = SERVICE_HOST,
+    port: int = SERVICE_PORT,
+    max_workers: Optional[int] = None,
+    max_queue: int = SERVICE_MAX_QUEUE,
+) -> None:
+    if not is_loopback(host):
+        print(
+            f"Warning: {host} is not a loopback address. The service has no authentication, "
+            "so anyone who can reach it can submit documents.",
+            file=sys.stderr,
+        )
+    service = ConversionService(host, port, max_workers=max_workers, max_queue=max_queue)
+
+    async def serve() -> None:
+        await service.start()
+        print(
+            f"Serving on http://{service.host}:{service.port} with {service.workers} workers",
+            file=sys.stderr,
+        )
+        try:
+            await service.serve_forever()
+        finally:
+            await service.close()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
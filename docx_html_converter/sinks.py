@@ -0,0 +1,240 @@
+import contextlib
+import os
+import sys
+import threading
+from abc import ABC, abstractmethod
+from typing import IO, Callable, Iterator, List, Optional, Sequence, Set, TextIO, Union
+
+from .constants import BROTLI_SIDECAR, DEFAULT_ENCODING, GZIP_SIDECAR, TEMP_FILE_SUFFIX
+
+
+def get_temp_path(file_path: str) -> str:
+    dir_path, file_name = os.path.split(file_path)
+    return os.path.join(
+        dir_path, f".{file_name}.{os.getpid()}.{threading.get_ident()}{TEMP_FILE_SUFFIX}"
+    )
+
+
+@contextlib.contextmanager
+def open_atomic(file_path: str, binary: bool = False) -> Iterator[IO]:
+    temp_path = get_temp_path(file_path)
+    try:
+        if binary:
+            f = open(temp_path, "wb")
+        else:
+            f = open(temp_path, "w", encoding=DEFAULT_ENCODING)
+        with f:
+            yield f
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_atomic(file_path: str, content: Union[str, bytes]) -> int:
+    with open_atomic(file_path, binary=isinstance(content, bytes)) as f:
+        f.write(content)
+        f.flush()
+        size = os.fstat(f.fileno()).st_size
+    return size
+
+
+def _compress_gzip(data: bytes) -> bytes:
+    import gzip
+
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def _compress_brotli(data: bytes) -> bytes:
+    return _import_brotli().compress(data)
+
+
+def _import_brotli():
+    try:
+        import brotli
+    except ImportError as exc:
+        raise RuntimeError("Writing .br files needs the brotli package") from exc
+    return brotli
+
+
+def get_compressor(sidecar: str) -> Callable[[bytes], bytes]:
+    if sidecar == GZIP_SIDECAR:
+        return _compress_gzip
+    if sidecar == BROTLI_SIDECAR:
+        _import_brotli()
+        return _compress_brotli
+    raise ValueError(
+        f"Unknown compressed file type {sidecar!r}, expected {GZIP_SIDECAR} or {BROTLI_SIDECAR}"
+    )
+
+
+class SinkWriter:
+    def __init__(self, write: Callable[[str], object]) -> None:
+        self.write = write
+        self.size = 0
+
+
+class OutputSink(ABC):
+    name = ""
+    process_safe = False
+
+    @property
+    def cache_key(self) -> str:
+        return self.name
+
+    @abstractmethod
+    def write(self, html_path: str, html_content: str) -> int:
+        raise NotImplementedError
+
+    @contextlib.contextmanager
+    def open(self, html_path: str) -> Iterator[SinkWriter]:
+        chunks: List[str] = []
+        writer = SinkWriter(chunks.append)
+        yield writer
+        writer.size = self.write(html_path, "".join(chunks))
+
+    def close(self) -> None:
+        pass
+
+    def abort(self) -> None:
+        self.close()
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class DirectorySink(OutputSink):
+    name = "directory"
+    process_safe = True
+
+    def __init__(self, output_dir: Optional[str] = None, sidecars: Sequence[str] = ()) -> None:
+        self.output_dir = output_dir
+        self.sidecars = tuple(sidecars)
+        for sidecar in self.sidecars:
+            get_compressor(sidecar)
+
+    @property
+    def cache_key(self) -> str:
+        return "-".join((self.name,) + self.sidecars)
+
+    def get_path(self, html_path: str) -> str:
+        if self.output_dir is None:
+            return html_path
+        return os.path.join(self.output_dir, html_path)
+
+    def write(self, html_path: str, html_content: str) -> int:
+        file_path = self.get_path(html_path)
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        size = write_atomic(file_path, html_content)
+        if self.sidecars:
+            data = html_content.replace("\n", os.linesep).encode(DEFAULT_ENCODING)
+            for sidecar in self.sidecars:
+                write_atomic(f"{file_path}.{sidecar}", get_compressor(sidecar)(data))
+        return size
+
+    @contextlib.contextmanager
+    def open(self, html_path: str) -> Iterator[SinkWriter]:
+        if self.sidecars:
+            with super().open(html_path) as writer:
+                yield writer
+            return
+        file_path = self.get_path(html_path)
+        os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+        with open_atomic(file_path) as f:
+            writer = SinkWriter(f.write)
+            yield writer
+            f.flush()
+            writer.size = os.fstat(f.fileno()).st_size
+
+
+class ZipSink(OutputSink):
+    name = "zip"
+
+    def __init__(self, zip_path: str, compression: Optional[int] = None) -> None:
+        import zipfile
+
+        self.zip_path = zip_path
+        os.makedirs(os.path.dirname(os.path.abspath(zip_path)), exist_ok=True)
+        self._temp_path = get_temp_path(zip_path)
+        self._file = open(self._temp_path, "wb")
+        self._archive = zipfile.ZipFile(
+            self._file,
+            "w",
+            zipfile.ZIP_DEFLATED if compression is None else compression,
+        )
+        self._names: Set[str] = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def get_name(self, html_path: str) -> str:
+        name = os.path.normpath(os.path.splitdrive(html_path)[1]).replace(os.sep, "/")
+        name = name.lstrip("/")
+        if name == ".." or name.startswith("../"):
+            raise RuntimeError(f"{html_path} is outside of the archive")
+        return name
+
+    def write(self, html_path: str, html_content: str) -> int:
+        name = self.get_name(html_path)
+        data = html_content.encode(DEFAULT_ENCODING)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"{self.zip_path} is already closed")
+            if name in self._names:
+                raise RuntimeError(f"{name} is already in {self.zip_path}")
+            self._names.add(name)
+            self._archive.writestr(name, data)
+        return len(data)
+
+    def close(self) -> None:
+        if self._finish():
+            os.replace(self._temp_path, self.zip_path)
+
+    def abort(self) -> None:
+        if self._finish():
+            os.remove(self._temp_path)
+
+    def _finish(self) -> bool:
+        with self._lock:
+            if self._closed:
+                return False
+            self._closed = True
+            try:
+                self._archive.close()
+            finally:
+                self._file.close()
+        return True
+
+
+class StreamSink(OutputSink):
+    name = "stdout"
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    def write(self, html_path: str, html_content: str) -> int:
+        stream = self.stream if self.stream is not None else sys.stdout
+        with self._lock:
+            stream.write(html_content)
+        return len(html_content.encode(DEFAULT_ENCODING))
+
+    def close(self) -> None:
+        stream = self.stream if self.stream is not None else sys.stdout
+        stream.flush()
+
+
+class NullSink(OutputSink):
+    name = "null"
+    process_safe = True
+
+    def write(self, html_path: str, html_content: str) -> int:
+        return len(html_content.encode(DEFAULT_ENCODING))
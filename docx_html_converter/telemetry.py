@@ -0,0 +1,159 @@
+import json
+import math
+import sys
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .constants import DEFAULT_ENCODING, TELEMETRY_PERCENTILES
+
+READ_STAGE = "read"
+CONVERT_STAGE = "convert"
+POSTPROCESS_STAGE = "postprocess"
+WRITE_STAGE = "write"
+TOTAL_STAGE = "total"
+
+
+class ConversionTelemetry:
+    def __init__(self, docx_path: str, html_path: str) -> None:
+        self.docx_path = docx_path
+        self.html_path = html_path
+        self.success = False
+        self.cached = False
+        self.error: Optional[str] = None
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.peak_memory_bytes: Optional[int] = None
+        self.stages: Dict[str, float] = {}
+
+    def stage(self, name: str) -> "StageTimer":
+        return StageTimer(self, name)
+
+    def add_stage_time(self, name: str, seconds: float) -> None:
+        self.stages[name] = self.stages.get(name, 0.0) + seconds
+
+    def to_dict(self) -> Dict:
+        return {
+            "docx_path": self.docx_path,
+            "html_path": self.html_path,
+            "success": self.success,
+            "cached": self.cached,
+            "error": self.error,
+            "input_bytes": self.input_bytes,
+            "output_bytes": self.output_bytes,
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "stages": {name: round(seconds, 6) for name, seconds in self.stages.items()},
+        }
+
+
+class StageTimer:
+    def __init__(self, telemetry: ConversionTelemetry, name: str) -> None:
+        self.telemetry = telemetry
+        self.name = name
+        self._started_at = 0.0
+
+    def __enter__(self) -> "StageTimer":
+        self._started_at = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.telemetry.add_stage_time(self.name, time.perf_counter() - self._started_at)
+
+
+class MemoryTracker:
+    _lock = threading.Lock()
+    _active = 0
+    _overlapped = False
+
+    def __init__(self, telemetry: ConversionTelemetry) -> None:
+        self.telemetry = telemetry
+
+    def __enter__(self) -> "MemoryTracker":
+        tracemalloc = sys.modules.get("tracemalloc")
+        with MemoryTracker._lock:
+            MemoryTracker._active += 1
+            if MemoryTracker._active > 1:
+                MemoryTracker._overlapped = True
+            else:
+                MemoryTracker._overlapped = False
+                if tracemalloc is not None and tracemalloc.is_tracing():
+                    tracemalloc.reset_peak()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        tracemalloc = sys.modules.get("tracemalloc")
+        with MemoryTracker._lock:
+            MemoryTracker._active -= 1
+            if (
+                not MemoryTracker._overlapped
+                and tracemalloc is not None
+                and tracemalloc.is_tracing()
+            ):
+                self.telemetry.peak_memory_bytes = tracemalloc.get_traced_memory()[1]
+
+
+class TelemetryLog:
+    def __init__(self, log_path: str) -> None:
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._file = open(log_path, "a", encoding=DEFAULT_ENCODING)
+
+    def write(self, telemetry: ConversionTelemetry) -> None:
+        line = json.dumps(telemetry.to_dict(), sort_keys=True)
+        with self._lock:
+            self._file.write(f"{line}\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+    def __enter__(self) -> "TelemetryLog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def percentile(values: Sequence[float], fraction: float) -> float:
+    ordered_values = sorted(values)
+    rank = max(math.ceil(fraction * len(ordered_values)), 1)
+    return ordered_values[rank - 1]
+
+
+def summarize_telemetry(
+    telemetry_records: Iterable[ConversionTelemetry],
+    percentiles: Sequence[float] = TELEMETRY_PERCENTILES,
+) -> Dict[str, Dict[str, float]]:
+    stage_times: Dict[str, List[float]] = {}
+    for telemetry in telemetry_records:
+        for name, seconds in telemetry.stages.items():
+            stage_times.setdefault(name, []).append(seconds)
+    return {
+        name: {
+            f"p{round(fraction * 100)}": percentile(seconds, fraction)
+            for fraction in percentiles
+        }
+        for name, seconds in stage_times.items()
+    }
+
+
+def format_peak_memory(telemetry_records: Iterable[ConversionTelemetry]) -> str:
+    peaks = [
+        telemetry.peak_memory_bytes
+        for telemetry in telemetry_records
+        if telemetry.peak_memory_bytes is not None
+    ]
+    if not peaks:
+        return "peak memory: not recorded, files converted in parallel share one peak (use -j 1)"
+    return f"peak memory: max {max(peaks) / 1024 / 1024:.1f} MiB per file (files converted alone)"
+
+
+def format_summary(summary: Dict[str, Dict[str, float]]) -> List[str]:
+    lines = []
+    for name, stage_percentiles in summary.items():
+        timings = " | ".join(
+            f"{label} {seconds * 1000:.1f} ms" for label, seconds in stage_percentiles.items()
+        )
+        lines.append(f"{name}: {timings}")
+    return lines
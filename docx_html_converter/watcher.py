@@ -0,0 +1,302 @@
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .constants import (
+    DEFAULT_ENCODING,
+    MANIFEST_FILE_NAME,
+    WATCH_DEBOUNCE_S,
+    WATCH_INOTIFY_RESCAN_S,
+    WATCH_POLL_INTERVAL_S,
+)
+from .batch import get_journal_options
+from .convertor import convert
+from .file_processor import files_equal, hash_file, is_docx_file, set_html_ext
+from .results import ConversionResult
+
+if TYPE_CHECKING:
+    import ctypes
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE_SELF = 0x00000400
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+INOTIFY_MASK = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE | IN_DELETE_SELF
+INOTIFY_EVENT = struct.Struct("iIII")
+
+
+class ConversionManifest:
+    def __init__(self, manifest_path: str) -> None:
+        self.manifest_path = manifest_path
+        self._entries: Dict[str, Dict] = {}
+        self._lock = threading.Lock()
+        self.dirty = False
+        self.load()
+
+    def load(self) -> None:
+        try:
+            with open(self.manifest_path, "r", encoding=DEFAULT_ENCODING) as f:
+                self._entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self._entries = {}
+
+    def save(self) -> None:
+        temp_path = f"{self.manifest_path}.tmp"
+        with self._lock:
+            os.makedirs(
+                os.path.dirname(os.path.abspath(self.manifest_path)), exist_ok=True
+            )
+            with open(temp_path, "w", encoding=DEFAULT_ENCODING) as f:
+                json.dump(self._entries, f, indent=1, sort_keys=True)
+            os.replace(temp_path, self.manifest_path)
+            self.dirty = False
+
+    def is_up_to_date(
+        self, docx_path: str, html_path: str, stat: os.stat_result, options: str = ""
+    ) -> bool:
+        entry = self._entries.get(docx_path)
+        if entry is None or entry.get("failed") or entry["output"] != html_path:
+            return False
+        if entry.get("options", "") != options:
+            return False
+        if not os.path.exists(html_path):
+            return False
+        if entry["mtime"] == stat.st_mtime and entry["size"] == stat.st_size:
+            return True
+        if entry["size"] != stat.st_size or entry["hash"] != hash_file(docx_path):
+            return False
+        self.update(docx_path, html_path, stat, entry["hash"], options)
+        return True
+
+    def has_failed(
+        self, docx_path: str, html_path: str, stat: os.stat_result, options: str = ""
+    ) -> bool:
+        entry = self._entries.get(docx_path)
+        return (
+            entry is not None
+            and entry.get("failed", False)
+            and entry["output"] == html_path
+            and entry.get("options", "") == options
+            and entry["mtime"] == stat.st_mtime
+            and entry["size"] == stat.st_size
+        )
+
+    def update(
+        self,
+        docx_path: str,
+        html_path: str,
+        stat: os.stat_result,
+        docx_hash: Optional[str] = None,
+        options: str = "",
+    ) -> None:
+        with self._lock:
+            self._entries[docx_path] = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "hash": docx_hash if docx_hash else hash_file(docx_path),
+                "output": html_path,
+                "options": options,
+            }
+            self.dirty = True
+
+    def record_failure(
+        self, docx_path: str, html_path: str, stat: os.stat_result, options: str = ""
+    ) -> None:
+        with self._lock:
+            self._entries[docx_path] = {
+                "mtime": stat.st_mtime,
+                "size": stat.st_size,
+                "output": html_path,
+                "options": options,
+                "failed": True,
+            }
+            self.dirty = True
+
+
+class FolderWatcher:
+    def __init__(
+        self,
+        input_dirs: Sequence[str],
+        output_dir: str,
+        remove_prefix: bool,
+        remove_strong: bool,
+        manifest_path: Optional[str] = None,
+        poll_interval: float = WATCH_POLL_INTERVAL_S,
+        use_inotify: bool = True,
+    ) -> None:
+        self.input_dirs = [os.path.abspath(input_dir) for input_dir in input_dirs]
+        self.output_dir = os.path.abspath(output_dir)
+        self.remove_prefix = remove_prefix
+        self.remove_strong = remove_strong
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self.manifest = ConversionManifest(
+            manifest_path
+            if manifest_path
+            else os.path.join(self.output_dir, MANIFEST_FILE_NAME)
+        )
+
+    def get_output_path(self, input_dir: str, docx_path: str) -> str:
+        relative_path = os.path.relpath(docx_path, input_dir)
+        if len(self.input_dirs) > 1:
+            relative_path = os.path.join(os.path.basename(input_dir), relative_path)
+        return set_html_ext(os.path.join(self.output_dir, relative_path))
+
+    def iter_docx_files(self) -> Iterator[Tuple[str, str]]:
+        for input_dir in self.input_dirs:
+            for dir_path, dir_names, file_names in os.walk(input_dir):
+                if os.path.abspath(dir_path) == self.output_dir:
+                    dir_names.clear()
+                    continue
+                for file_name in sorted(file_names):
+                    if is_docx_file(file_name):
+                        yield input_dir, os.path.join(dir_path, file_name)
+
+    def get_options(self) -> str:
+        return "\0".join(
+            (str(int(self.remove_prefix)), str(int(self.remove_strong)), get_journal_options())
+        )
+
+    def scan(self) -> List[ConversionResult]:
+        results = []
+        options = self.get_options()
+        for input_dir, docx_path in self.iter_docx_files():
+            html_path = self.get_output_path(input_dir, docx_path)
+            try:
+                stat = os.stat(docx_path)
+            except FileNotFoundError:
+                continue
+            if self.manifest.is_up_to_date(docx_path, html_path, stat, options):
+                continue
+            if self.manifest.has_failed(docx_path, html_path, stat, options):
+                continue
+            results.append(self.convert_file(docx_path, html_path, stat, options))
+
+        if self.manifest.dirty:
+            self.manifest.save()
+        return results
+
+    def convert_file(
+        self, docx_path: str, html_path: str, stat: os.stat_result, options: str = ""
+    ) -> ConversionResult:
+        os.makedirs(os.path.dirname(html_path), exist_ok=True)
+        temp_path = os.path.join(
+            os.path.dirname(html_path), f".{os.path.basename(html_path)}.tmp"
+        )
+        result = convert(
+            docx_path,
+            temp_path,
+            remove_prefix=self.remove_prefix,
+            remove_strong=self.remove_strong,
+        )
+        if not result.success or not os.path.exists(temp_path):
+            self.manifest.record_failure(docx_path, html_path, stat, options)
+            return result
+
+        if os.path.exists(html_path) and files_equal(temp_path, html_path):
+            os.remove(temp_path)
+        else:
+            os.replace(temp_path, html_path)
+        self.manifest.update(docx_path, html_path, stat, options=options)
+        result.html_path = html_path
+        return result
+
+    def run(
+        self,
+        stop_event: Optional[threading.Event] = None,
+        on_scan: Optional[Callable[[List[ConversionResult]], None]] = None,
+    ) -> None:
+        stop_event = stop_event if stop_event is not None else threading.Event()
+        inotify = _Inotify.create(self.input_dirs) if self.use_inotify else None
+        try:
+            while not stop_event.is_set():
+                results = self.scan()
+                if on_scan and results:
+                    on_scan(results)
+                if inotify is not None:
+                    inotify.wait(stop_event, WATCH_INOTIFY_RESCAN_S)
+                else:
+                    stop_event.wait(self.poll_interval)
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+
+class _Inotify:
+    def __init__(self, libc: "ctypes.CDLL", fd: int) -> None:
+        self._libc = libc
+        self._fd = fd
+        self._watched: Dict[int, str] = {}
+
+    @classmethod
+    def create(cls, input_dirs: Sequence[str]) -> Optional["_Inotify"]:
+        if not sys.platform.startswith("linux"):
+            return None
+        import ctypes
+        import ctypes.util
+
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            return None
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return None
+        if fd < 0:
+            return None
+
+        inotify = cls(libc, fd)
+        for input_dir in input_dirs:
+            for dir_path, _, _ in os.walk(input_dir):
+                inotify.add_watch(dir_path)
+        return inotify
+
+    def add_watch(self, dir_path: str) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(dir_path), INOTIFY_MASK)
+        if wd >= 0:
+            self._watched[wd] = dir_path
+
+    def wait(self, stop_event: threading.Event, timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        while not stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            readable, _, _ = select.select(
+                [self._fd], [], [], min(remaining, WATCH_DEBOUNCE_S)
+            )
+            if readable:
+                self._drain()
+                stop_event.wait(WATCH_DEBOUNCE_S)
+                self._drain()
+                return None
+
+    def _drain(self) -> None:
+        while True:
+            try:
+                buffer = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return None
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, name_length = INOTIFY_EVENT.unpack_from(buffer, offset)
+                offset += INOTIFY_EVENT.size
+                name = buffer[offset:offset + name_length].rstrip(b"\0")
+                offset += name_length
+                is_new_dir = mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO)
+                if is_new_dir and wd in self._watched:
+                    new_dir = os.path.join(self._watched[wd], os.fsdecode(name))
+                    for dir_path, _, _ in os.walk(new_dir):
+                        self.add_watch(dir_path)
+
+    def close(self) -> None:
+        os.close(self._fd)
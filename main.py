@@ -1,7 +1,10 @@
 from docx_html_converter import DocxHtmlConverter
+from docx_html_converter.cache import ConversionCache, get_cache, set_cache
 
 
 def main() -> None:
+    if get_cache() is None:
+        set_cache(ConversionCache())
     converter = DocxHtmlConverter()
     converter.start()
 
@@ -0,0 +1,17 @@
+import pytest
+from docx_html_converter.constants import (
+    BACKEND_ENV_VAR,
+    CACHE_DIR_ENV_VAR,
+    ENGINE_ENV_VAR,
+    PANDOC_ENGINE,
+    PYPANDOC_BACKEND,
+    TIMEOUT_ENV_VAR,
+)
+
+
+@pytest.fixture
+def conversion_env(monkeypatch):
+    monkeypatch.setenv(BACKEND_ENV_VAR, PYPANDOC_BACKEND)
+    monkeypatch.setenv(ENGINE_ENV_VAR, PANDOC_ENGINE)
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, "")
+    monkeypatch.delenv(TIMEOUT_ENV_VAR, raising=False)
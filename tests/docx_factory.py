@@ -0,0 +1,74 @@
+import io
+import zipfile
+
+NAMESPACES = (
+    'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"'
+)
+RELATIONSHIPS_START = (
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+)
+RELATIONSHIP_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+CONTENT_TYPES = (
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" '
+    'ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" ContentType="application/'
+    'vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    "</Types>"
+)
+
+
+def make_docx(body: str, compression: int = zipfile.ZIP_STORED) -> bytes:
+    heading_styles = "".join(
+        f'<w:style w:type="paragraph" w:styleId="Heading{level}">'
+        f'<w:name w:val="heading {level}"/></w:style>'
+        for level in range(1, 4)
+    )
+    abstract_numbering = "".join(
+        f'<w:abstractNum w:abstractNumId="{index}">'
+        + "".join(
+            f'<w:lvl w:ilvl="{level}"><w:start w:val="1"/><w:numFmt w:val="{num_format}"/>'
+            f'<w:lvlText w:val="%{level + 1}."/></w:lvl>'
+            for level in range(3)
+        )
+        + "</w:abstractNum>"
+        for index, num_format in enumerate(("bullet", "decimal"))
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", compression) as archive:
+        archive.writestr("[Content_Types].xml", CONTENT_TYPES)
+        archive.writestr(
+            "_rels/.rels",
+            f'{RELATIONSHIPS_START}<Relationship Id="rId1" '
+            f'Type="{RELATIONSHIP_TYPE}/officeDocument" Target="word/document.xml"/>'
+            "</Relationships>",
+        )
+        archive.writestr(
+            "word/_rels/document.xml.rels",
+            f'{RELATIONSHIPS_START}<Relationship Id="rId1" '
+            f'Type="{RELATIONSHIP_TYPE}/styles" Target="styles.xml"/>'
+            f'<Relationship Id="rId2" Type="{RELATIONSHIP_TYPE}/numbering" '
+            'Target="numbering.xml"/>'
+            f'<Relationship Id="rId3" Type="{RELATIONSHIP_TYPE}/hyperlink" '
+            'Target="https://example.com/?a=1&amp;b=2" TargetMode="External"/>'
+            "</Relationships>",
+        )
+        archive.writestr(
+            "word/styles.xml",
+            f"<w:styles {NAMESPACES}>"
+            '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+            f'<w:name w:val="Normal"/></w:style>{heading_styles}</w:styles>',
+        )
+        archive.writestr(
+            "word/numbering.xml",
+            f"<w:numbering {NAMESPACES}>{abstract_numbering}"
+            '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+            '<w:num w:numId="2"><w:abstractNumId w:val="1"/></w:num></w:numbering>',
+        )
+        archive.writestr(
+            "word/document.xml",
+            f"<w:document {NAMESPACES}><w:body>{body}</w:body></w:document>",
+        )
+    return buffer.getvalue()
@@ -0,0 +1,160 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+import pytest
+from docx_html_converter import aio
+from docx_html_converter.aio import AsyncConverter
+from docx_html_converter.convertor import convert_bytes
+from docx_html_converter.file_processor import read_file
+
+
+@pytest.fixture(autouse=True)
+def no_cache(monkeypatch):
+    monkeypatch.setattr("docx_html_converter.convertor.get_cache", lambda: None)
+
+
+@pytest.fixture
+def test_docx_path():
+    return os.path.join("test_data", "test_data.docx")
+
+
+@pytest.fixture
+def sleeping_pandoc(monkeypatch):
+    monkeypatch.setattr(
+        aio,
+        "get_pandoc_args",
+        lambda *args: [sys.executable, "-c", "import time; time.sleep(10)"],
+    )
+
+
+def test_docx_to_html(tmp_path, test_docx_path):
+    html_path = str(tmp_path / "nested" / "test_data.html")
+
+    async def run():
+        async with AsyncConverter(max_concurrency=2) as converter:
+            return await converter.convert(
+                test_docx_path, html_path, remove_prefix=True, remove_strong=True
+            )
+
+    result = asyncio.run(run())
+    assert result.message == "test_data.docx converted to HTML successfully!\n"
+    assert result.output_bytes == os.path.getsize(html_path)
+    with open(test_docx_path, "rb") as f:
+        expected_html = convert_bytes(f.read(), remove_prefix=True, remove_strong=True)
+    assert read_file(html_path) == expected_html
+
+
+def test_convert_missing_file(tmp_path):
+    async def run():
+        async with AsyncConverter() as converter:
+            return await converter.convert(
+                str(tmp_path / "missing.docx"),
+                str(tmp_path / "missing.html"),
+                remove_prefix=True,
+                remove_strong=True,
+            )
+
+    assert asyncio.run(run()).message.startswith("Error converting missing.docx to HTML:")
+
+
+def test_convert_timeout(tmp_path, test_docx_path, sleeping_pandoc):
+    async def run():
+        async with AsyncConverter() as converter:
+            return await converter.convert(
+                test_docx_path,
+                str(tmp_path / "test_data.html"),
+                remove_prefix=True,
+                remove_strong=True,
+                timeout=0.2,
+            )
+
+    started_at = time.monotonic()
+    result = asyncio.run(run())
+    assert result.status == "timeout"
+    assert result.message.startswith("Timeout converting test_data.docx to HTML:")
+    assert time.monotonic() - started_at < 5
+    assert not os.path.exists(tmp_path / "test_data.html")
+
+
+def test_convert_cancel(tmp_path, test_docx_path, sleeping_pandoc):
+    async def run():
+        async with AsyncConverter() as converter:
+            task = asyncio.ensure_future(
+                converter.convert(
+                    test_docx_path,
+                    str(tmp_path / "test_data.html"),
+                    remove_prefix=True,
+                    remove_strong=True,
+                )
+            )
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    started_at = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - started_at < 5
+
+
+def test_max_concurrency(monkeypatch):
+    running = []
+    peak_running = []
+
+    async def fake_run_pandoc_async(
+        pandoc_path, data, input_format, output_format="html", timeout=None
+    ):
+        running.append(data)
+        peak_running.append(len(running))
+        await asyncio.sleep(0.05)
+        running.remove(data)
+        return f"<p>{data.decode()}</p>"
+
+    monkeypatch.setattr(aio, "run_pandoc_async", fake_run_pandoc_async)
+
+    async def run():
+        async with AsyncConverter(max_concurrency=2) as converter:
+            return await asyncio.gather(
+                *(
+                    converter.convert_bytes(
+                        str(index).encode(), remove_prefix=False, remove_strong=False
+                    )
+                    for index in range(6)
+                )
+            )
+
+    assert asyncio.run(run()) == [f"<p>{index}</p>" for index in range(6)]
+    assert max(peak_running) == 2
+
+
+def test_custom_backend_runs_off_the_event_loop(monkeypatch):
+    loop_threads = []
+
+    class FakeBackend:
+        def convert_bytes(
+            self, data, input_format, timeout=None, cancel_event=None, output_format="html"
+        ):
+            loop_threads.append(threading.current_thread())
+            return f"<p>{data.decode()}</p>\n"
+
+        def version(self):
+            return "1.0"
+
+    def fake_finish_html(raw_html, *args, **kwargs):
+        loop_threads.append(threading.current_thread())
+        return raw_html
+
+    monkeypatch.setattr(aio, "get_backend", FakeBackend)
+    monkeypatch.setattr(aio, "finish_html", fake_finish_html)
+
+    async def run():
+        async with AsyncConverter() as converter:
+            return await converter.convert_bytes(
+                b"text", remove_prefix=False, remove_strong=False
+            )
+
+    assert asyncio.run(run()) == "<p>text</p>\n"
+    assert len(loop_threads) == 2
+    assert threading.main_thread() not in loop_threads
@@ -1,4 +1,5 @@
 import os
+import shutil
 import unittest
 import pytest
 import tkinter as tk
@@ -8,19 +9,21 @@ from tkinter import filedialog
 from tkinterdnd2.TkinterDnD import DnDEvent
 
 from docx_html_converter.app import (
-    extract_list_from_str,
     set_html_ext,
     ColoredButton,
+    PathListView,
+    ResultsView,
     ScrollableTextFrame,
     ToplevelMessagebox,
     DocxHtmlConverter,
 )
 from docx_html_converter.constants import HTML_EXTENSION, APP_WIDTH, APP_HEIGHT
-
-
-@pytest.fixture
-def test_extract_list_from_str_data():
-    return "example\ndata\nfor\ntesting\n"
+from docx_html_converter.results import (
+    FAILED_STATUS,
+    SKIPPED_STATUS,
+    SUCCESS_STATUS,
+    ConversionResult,
+)
 
 
 @pytest.fixture
@@ -28,12 +31,6 @@ def test_set_html_ext_data():
     return os.path.join("test", "path", "file.test")
 
 
-def test_extract_list_from_str(test_extract_list_from_str_data):
-    actual_result = extract_list_from_str(test_extract_list_from_str_data)
-    expected_result = ["example", "data", "for", "testing"]
-    assert actual_result == expected_result
-
-
 def test_set_html_ext(test_set_html_ext_data):
     actual_result = set_html_ext(test_set_html_ext_data)
     expected_result = os.path.join("test", "path", f"file.{HTML_EXTENSION}")
@@ -131,6 +128,89 @@ class TestScrollableTextFrame(unittest.TestCase):
         self.assertEqual(frame.cget("pady"), frame_padding[1])
 
 
+class TestPathListView(unittest.TestCase):
+    def setUp(self):
+        self.root = tk.Tk()
+        self.paths = [f"file{index}.docx" for index in range(10000)]
+        self.view = PathListView(
+            master=self.root,
+            get_path=self.paths.__getitem__,
+            get_count=lambda: len(self.paths),
+        )
+
+    def test_renders_visible_rows_only(self):
+        self.assertEqual(self.view.path_list.size(), PathListView.LIST_FIELD_HEIGHT)
+        self.assertEqual(self.view.path_list.get(0), "file0.docx")
+
+    def test_scroll(self):
+        self.view.on_scroll(tk.MOVETO, "1.0")
+        self.assertEqual(self.view.path_list.get(tk.END), "file9999.docx")
+        self.view.on_scroll(tk.SCROLL, "-1", tk.PAGES)
+        self.assertEqual(self.view.first_row, 10000 - 2 * PathListView.LIST_FIELD_HEIGHT)
+        self.view.on_scroll(tk.SCROLL, "-1", tk.UNITS)
+        self.assertEqual(self.view.first_row, 10000 - 2 * PathListView.LIST_FIELD_HEIGHT - 1)
+
+    def test_refresh_after_clear(self):
+        self.view.on_scroll(tk.MOVETO, "0.5")
+        self.paths.clear()
+        self.view.refresh()
+        self.assertEqual(self.view.first_row, 0)
+        self.assertEqual(self.view.path_list.size(), 0)
+
+
+class TestResultsView(unittest.TestCase):
+    def setUp(self):
+        self.root = tk.Tk()
+        self.view = ResultsView(bg_color="black")
+        self.view.add_result(
+            2, ConversionResult("c.docx", "c.html", SUCCESS_STATUS, "", duration_s=0.1)
+        )
+        self.view.add_result(
+            0, ConversionResult("a.docx", "a.html", FAILED_STATUS, "", duration_s=3.0)
+        )
+
+    def test_rows_in_batch_order(self):
+        self.assertEqual(self.view.table.get_children(), ("0", "2"))
+        self.assertEqual(self.view.table.set("0", "status"), FAILED_STATUS)
+
+    def test_sort_by_duration(self):
+        self.view.sort_by("duration")
+        self.view.add_result(
+            1, ConversionResult("b.docx", "b.html", SUCCESS_STATUS, "", duration_s=1.0)
+        )
+        self.assertEqual(self.view.table.get_children(), ("2", "1", "0"))
+        self.view.sort_by("duration")
+        self.view.add_result(
+            3, ConversionResult("d.docx", "d.html", SUCCESS_STATUS, "", duration_s=2.0)
+        )
+        self.assertEqual(self.view.table.get_children(), ("0", "3", "1", "2"))
+
+    def test_failures_only(self):
+        self.view.failures_only.set(True)
+        self.view.refresh()
+        self.assertEqual(self.view.table.get_children(), ("0",))
+        self.assertEqual(
+            [result.docx_path for result in self.view.visible_results()], ["a.docx"]
+        )
+
+    def test_summary_counts(self):
+        self.view.add_result(1, ConversionResult("b.docx", "b.html", SKIPPED_STATUS, ""))
+        self.assertEqual((self.view.succeeded, self.view.failed, self.view.skipped), (1, 1, 1))
+        self.assertEqual(
+            self.view.summary_label.cget("text"),
+            "3 files | 1 converted | 1 skipped | 1 failed",
+        )
+
+    def test_clear(self):
+        self.view.clear()
+        self.assertEqual(self.view.table.get_children(), ())
+        self.assertEqual((self.view.succeeded, self.view.failed, self.view.skipped), (0, 0, 0))
+        self.view.add_result(
+            1, ConversionResult("b.docx", "b.html", SUCCESS_STATUS, "", duration_s=1.0)
+        )
+        self.assertEqual(self.view.table.get_children(), ("1",))
+
+
 class TestToplevelMessagebox(unittest.TestCase):
     def test_default_values(self):
         bg_color = "#012840"
@@ -188,74 +268,112 @@ class TestDocxHtmlConverter(unittest.TestCase):
         )
 
     def test_on_left_input_double_click(self):
-        filedialog.askopenfiles = MagicMock(return_value=[open("test.docx", "w")])
-        self.converter.on_left_input_double_click(
-            tk.Event(),
-            self.converter.left_input_frame.input_text,
-            self.converter.right_input_frame.input_text,
-        )
+        filedialog.askopenfilenames = MagicMock(return_value=("test.docx", "test.docx"))
+        self.converter.on_left_input_double_click(tk.Event())
+        self.assertEqual(self.converter.left_input_frame.path_list.get(0, tk.END), ("test.docx",))
         self.assertEqual(
-            self.converter.left_input_frame.input_text.get(1.0, tk.END), "test.docx\n\n"
+            self.converter.right_input_frame.path_list.get(0, tk.END), ("test.html",)
         )
 
     def test_on_right_input_double_click(self):
         filedialog.askdirectory = MagicMock(return_value="/test/directory")
-        self.converter.right_input_frame.input_text.configure(state=tk.NORMAL)
-        self.converter.right_input_frame.input_text.insert(
-            tk.END, "/test/directory/test.docx\n"
-        )
-        self.converter.right_input_frame.input_text.configure(state=tk.DISABLED)
-        self.converter.on_right_input_double_click(
-            tk.Event(), self.converter.right_input_frame.input_text
-        )
-
-        expected_output = "/test/directory/test.docx\n\n"
+        self.converter.add_paths(["/input/test.docx"])
+        self.converter.on_right_input_double_click(tk.Event())
 
-        actual_output = self.converter.right_input_frame.input_text.get(1.0, tk.END)
+        expected_output = (os.path.join("/test/directory", "test.html"),)
+        actual_output = self.converter.right_input_frame.path_list.get(0, tk.END)
         self.assertEqual(actual_output, expected_output)
 
     def test_on_drop(self):
         event = DnDEvent()
-        event.data = "file1.docx file2.docx"
+        event.data = "file1.docx {file 2.docx} file1.docx"
 
-        self.converter.on_drop(
-            event,
-            self.converter.left_input_frame.input_text,
-            self.converter.right_input_frame.input_text,
-        )
+        self.converter.on_drop(event)
 
-        expected_input_output = "file1.html\nfile2.html\n\n"
-        self.assertNotEqual(
-            self.converter.left_input_frame.input_text.get(1.0, tk.END),
-            expected_input_output,
+        self.assertEqual(
+            self.converter.left_input_frame.path_list.get(0, tk.END),
+            ("file1.docx", "file 2.docx"),
         )
         self.assertEqual(
-            self.converter.right_input_frame.input_text.get(1.0, tk.END),
-            expected_input_output,
+            self.converter.right_input_frame.path_list.get(0, tk.END),
+            ("file1.html", "file 2.html"),
         )
 
-    def test_on_clear(self):
-        self.converter.left_input_frame.input_text.insert(tk.END, "file1.docx")
-        self.converter.right_input_frame.input_text.insert(tk.END, "file1.html")
-        self.converter.on_clear()
+    def test_on_drop_dir(self):
+        input_dir = os.path.join("test_data", "dropped")
+        os.makedirs(os.path.join(input_dir, "nested"), exist_ok=True)
+        for file_name in ("a.docx", os.path.join("nested", "b.docx")):
+            with open(os.path.join(input_dir, file_name), "wb"):
+                pass
+        self.addCleanup(shutil.rmtree, input_dir)
+        self.converter.batch.set_output_dir("out")
+        event = DnDEvent()
+        event.data = f"{{{input_dir}}}"
+
+        self.converter.on_drop(event)
+        for scan_thread in self.converter._scan_threads:
+            scan_thread.join()
+        self.converter._poll_scans()
+
         self.assertEqual(
-            self.converter.left_input_frame.input_text.get(1.0, tk.END), "\n"
+            self.converter.right_input_frame.path_list.get(0, tk.END),
+            (
+                os.path.join("out", "dropped", "a.html"),
+                os.path.join("out", "dropped", "nested", "b.html"),
+            ),
+        )
+
+    def test_on_drop_zip(self):
+        import zipfile
+
+        archive_path = os.path.join("test_data", "issue.zip")
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("a.docx", b"")
+            archive.writestr("nested/b.docx", b"")
+        self.addCleanup(os.remove, archive_path)
+        self.converter.batch.set_output_dir("out")
+        event = DnDEvent()
+        event.data = f"{{{archive_path}}}"
+
+        self.converter.on_drop(event)
+        for scan_thread in self.converter._scan_threads:
+            scan_thread.join()
+        self.converter._poll_scans()
+
+        self.assertEqual(
+            self.converter.left_input_frame.path_list.get(0, tk.END),
+            (
+                os.path.join(archive_path, "a.docx"),
+                os.path.join(archive_path, "nested", "b.docx"),
+            ),
         )
         self.assertEqual(
-            self.converter.right_input_frame.input_text.get(1.0, tk.END), "\n"
+            self.converter.right_input_frame.path_list.get(0, tk.END),
+            (
+                os.path.join("out", "issue", "a.html"),
+                os.path.join("out", "issue", "nested", "b.html"),
+            ),
         )
 
-    def test__insert_data(self):
-        text_input = tk.Text(self.converter)
-        file_paths = ["file1.docx", "file2.docx"]
+    def test_on_clear(self):
+        self.converter.add_paths(["file1.docx"])
+        self.converter.on_clear()
+        self.assertEqual(len(self.converter.batch), 0)
+        self.assertEqual(self.converter.left_input_frame.path_list.size(), 0)
+        self.assertEqual(self.converter.right_input_frame.path_list.size(), 0)
 
-        self.converter._insert_data(text_input, file_paths)
-        expected_output = "file1.docx\nfile2.docx\n\n"
-        self.assertEqual(text_input.get(1.0, tk.END), expected_output)
+    def test_on_convert_nothing_to_convert(self):
+        ToplevelMessagebox.destroy = MagicMock()
+        self.converter.on_convert()
+        self.assertIsNone(self.converter._convert_thread)
+        self.assertEqual(
+            str(self.converter.cancel_button.cget("state")), tk.DISABLED
+        )
 
-    def test__get_new_path(self):
-        initial_full_path = "path/file1.docx"
-        new_dir_path = "/new/directory"
-        result = self.converter._get_new_path(initial_full_path, new_dir_path)
-        expected_result = "/new/directory/file1.docx"
-        self.assertEqual(result, expected_result)
+    def test_on_cancel(self):
+        self.converter.cancel_button.configure(state=tk.NORMAL)
+        self.converter.on_cancel()
+        self.assertTrue(self.converter._cancel_event.is_set())
+        self.assertEqual(
+            str(self.converter.cancel_button.cget("state")), tk.DISABLED
+        )
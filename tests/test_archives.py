@@ -0,0 +1,79 @@
+import os
+import zipfile
+
+import pytest
+from docx_html_converter.archives import (
+    get_archive_output_dir,
+    read_docx_bytes,
+    scan_archive,
+    split_archive_path,
+    stat_docx,
+)
+from docx_html_converter.constants import ASSETS_DIR_NAME
+from docx_html_converter.convertor import convert
+
+
+@pytest.fixture
+def test_archive_path(tmp_path):
+    archive_path = tmp_path / "issue.zip"
+    with open(os.path.join("test_data", "test_images.docx"), "rb") as f:
+        docx_content = f.read()
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("b.docx", docx_content)
+        archive.writestr("nested/a.docx", docx_content)
+        archive.writestr("nested/~$a.docx", b"lock")
+        archive.writestr("../escaped.docx", docx_content)
+        archive.writestr("notes.txt", b"notes")
+        archive.writestr("folder.docx/", b"")
+    return str(archive_path)
+
+
+def test_scan_archive(tmp_path, test_archive_path):
+    assert list(scan_archive(test_archive_path)) == [
+        os.path.join(test_archive_path, "b.docx"),
+        os.path.join(test_archive_path, "nested", "a.docx"),
+    ]
+    broken_path = tmp_path / "broken.zip"
+    broken_path.write_bytes(b"not a zip")
+    assert list(scan_archive(str(broken_path))) == []
+
+
+def test_read_archive_member(test_archive_path):
+    member_path = os.path.join(test_archive_path, "nested", "a.docx")
+    assert split_archive_path(member_path) == (test_archive_path, "nested/a.docx")
+    assert split_archive_path(os.path.join("test_data", "test_images.docx")) is None
+
+    with zipfile.ZipFile(test_archive_path) as archive:
+        member_info = archive.getinfo("nested/a.docx")
+        assert read_docx_bytes(member_path) == archive.read(member_info)
+    assert stat_docx(member_path) == (
+        member_info.file_size,
+        os.stat(test_archive_path).st_mtime_ns,
+    )
+
+    with pytest.raises(RuntimeError):
+        read_docx_bytes(os.path.join(test_archive_path, "missing.docx"))
+    with pytest.raises(FileNotFoundError):
+        stat_docx(os.path.join(test_archive_path, "missing.docx"))
+
+
+def test_get_archive_output_dir():
+    archive_path = os.path.join("in", "issue.ZIP")
+    assert get_archive_output_dir(archive_path) == os.path.join("in", "issue")
+    assert get_archive_output_dir(archive_path, "out") == os.path.join("out", "issue")
+
+
+def test_convert_archive_member(tmp_path, test_archive_path):
+    html_path = tmp_path / "issue" / "nested" / "a.html"
+    os.makedirs(html_path.parent)
+    actual_result = convert(
+        os.path.join(test_archive_path, "nested", "a.docx"),
+        str(html_path),
+        remove_prefix=False,
+        remove_strong=False,
+        assets_dir=ASSETS_DIR_NAME,
+    )
+    assert actual_result.success
+    assert actual_result.input_bytes == stat_docx(actual_result.docx_path)[0]
+    assert f'src="{ASSETS_DIR_NAME}/' in html_path.read_text(encoding="utf-8")
+    assert os.listdir(html_path.parent / ASSETS_DIR_NAME)
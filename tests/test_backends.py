@@ -0,0 +1,212 @@
+import base64
+import json
+import os
+import socket
+import sys
+import threading
+import time
+import urllib.error
+from http.server import BaseHTTPRequestHandler, HTTPServer, ThreadingHTTPServer
+
+import pytest
+from docx_html_converter import backends
+from docx_html_converter.backends import (
+    ConversionCancelled,
+    ConversionTimeout,
+    PandocBackend,
+    PypandocBackend,
+    create_backend,
+    get_backend,
+    run_process,
+    set_backend,
+)
+from docx_html_converter.pandoc_server import PandocServerBackend
+from docx_html_converter.constants import PYPANDOC_BACKEND, SERVER_BACKEND
+
+
+class FakeBackend(PandocBackend):
+    def __init__(self):
+        self.closed = False
+
+    def convert_file(self, docx_path, input_format, timeout=None, cancel_event=None):
+        return f"<p>{os.path.basename(docx_path)}</p>"
+
+    def convert_bytes(
+        self, data, input_format, timeout=None, cancel_event=None, output_format="html"
+    ):
+        return f"<p>{len(data)}</p>"
+
+    def version(self):
+        return "0.0"
+
+    def close(self):
+        self.closed = True
+
+
+class FakePandocServerHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        text = base64.b64decode(payload["text"]).decode()
+        body = json.dumps({"output": f"<p>{text}</p>", "base64": False}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class SlowPandocServerHandler(FakePandocServerHandler):
+    release = threading.Event()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.release.wait(10)
+
+
+@pytest.fixture
+def test_docx_path():
+    return os.path.join("test_data", "test_data.docx")
+
+
+@pytest.fixture
+def fake_pandoc_server():
+    server = HTTPServer(("127.0.0.1", 0), FakePandocServerHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_create_backend():
+    assert isinstance(create_backend(PYPANDOC_BACKEND), PypandocBackend)
+    assert isinstance(create_backend(SERVER_BACKEND), PandocServerBackend)
+
+
+def test_create_backend_fail():
+    with pytest.raises(ValueError):
+        create_backend("unknown")
+
+
+def test_backend_is_abstract():
+    class IncompleteBackend(PandocBackend):
+        def version(self):
+            return "0.0"
+
+    with pytest.raises(TypeError):
+        PandocBackend()
+    with pytest.raises(TypeError):
+        IncompleteBackend()
+
+
+def test_set_backend(monkeypatch):
+    monkeypatch.setattr(backends, "_backend", None)
+    first_backend, second_backend = FakeBackend(), FakeBackend()
+    set_backend(first_backend)
+    set_backend(second_backend)
+    assert get_backend() is second_backend
+    assert first_backend.closed
+    set_backend(PypandocBackend())
+
+
+def test_server_backend_fallback(test_docx_path):
+    backend = PandocServerBackend(pandoc_path="missing-pandoc", fallback=FakeBackend())
+    actual_result = backend.convert_file(test_docx_path, "docx")
+    assert actual_result == "<p>test_data.docx</p>"
+    assert backend.version() == "0.0"
+
+
+def test_pypandoc_backend_convert_bytes(test_docx_path):
+    backend = PypandocBackend()
+    with open(test_docx_path, "rb") as f:
+        actual_result = backend.convert_bytes(f.read(), "docx")
+    assert actual_result == backend.convert_file(test_docx_path, "docx")
+
+
+def test_run_process():
+    echo_args = [sys.executable, "-c", "import sys; sys.stdout.write(sys.stdin.read())"]
+    assert run_process(echo_args, b"content") == (0, b"content", b"")
+    assert run_process(echo_args, b"content", timeout=10, cancel_event=threading.Event()) == (
+        0,
+        b"content",
+        b"",
+    )
+
+
+def test_run_process_timeout():
+    started_at = time.monotonic()
+    with pytest.raises(ConversionTimeout):
+        run_process([sys.executable, "-c", "import time; time.sleep(30)"], b"", timeout=0.2)
+    assert time.monotonic() - started_at < 10
+
+
+def test_run_process_cancel():
+    cancel_event = threading.Event()
+    threading.Timer(0.2, cancel_event.set).start()
+    started_at = time.monotonic()
+    with pytest.raises(ConversionCancelled):
+        run_process(
+            [sys.executable, "-c", "import time; time.sleep(30)"], b"", cancel_event=cancel_event
+        )
+    assert time.monotonic() - started_at < 10
+
+
+def test_server_backend_fallback_bytes():
+    backend = PandocServerBackend(pandoc_path="missing-pandoc", fallback=FakeBackend())
+    assert backend.convert_bytes(b"content", "docx") == "<p>7</p>"
+
+
+@pytest.fixture
+def slow_pandoc_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), SlowPandocServerHandler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    SlowPandocServerHandler.release.set()
+    server.shutdown()
+    server.server_close()
+    SlowPandocServerHandler.release.clear()
+
+
+def test_server_backend_timeout(monkeypatch, slow_pandoc_server):
+    fallback = FakeBackend()
+    backend = PandocServerBackend(port=slow_pandoc_server.server_port, fallback=fallback)
+    monkeypatch.setattr(backend, "start", lambda: None)
+    monkeypatch.setattr(fallback, "convert_bytes", pytest.fail)
+    started_at = time.monotonic()
+    with pytest.raises(ConversionTimeout):
+        backend.convert_bytes(b"content", "docx", timeout=0.3)
+    assert time.monotonic() - started_at < 5
+
+
+def test_server_backend_wrapped_timeout(monkeypatch):
+    def time_out(*args):
+        raise urllib.error.URLError(socket.timeout("timed out"))
+
+    backend = PandocServerBackend(fallback=FakeBackend())
+    monkeypatch.setattr(backend, "start", lambda: None)
+    monkeypatch.setattr(backend, "_request", time_out)
+    with pytest.raises(ConversionTimeout):
+        backend.convert_bytes(b"content", "docx", timeout=5)
+
+
+def test_server_backend_cancel(monkeypatch, slow_pandoc_server):
+    backend = PandocServerBackend(port=slow_pandoc_server.server_port, fallback=FakeBackend())
+    monkeypatch.setattr(backend, "start", lambda: None)
+    cancel_event = threading.Event()
+    threading.Timer(0.2, cancel_event.set).start()
+    started_at = time.monotonic()
+    with pytest.raises(ConversionCancelled):
+        backend.convert_bytes(b"content", "docx", cancel_event=cancel_event)
+    assert time.monotonic() - started_at < 5
+
+
+def test_server_backend_request(monkeypatch, fake_pandoc_server, test_docx_path):
+    backend = PandocServerBackend(port=fake_pandoc_server.server_port)
+    monkeypatch.setattr(backend, "start", lambda: None)
+    actual_result = backend._request(b"content", "docx")
+    assert actual_result == "<p>content</p>"
@@ -0,0 +1,230 @@
+import os
+import threading
+import time
+import pytest
+from docx_html_converter import batch
+from docx_html_converter.batch import (
+    ConversionBatch,
+    cancelled_result,
+    convert_batch,
+    create_executor,
+    format_duration,
+    format_progress,
+    get_default_workers,
+)
+from docx_html_converter.convertor import cancelled_message
+from docx_html_converter.results import FAILED_STATUS, SUCCESS_STATUS, ConversionResult
+
+
+@pytest.fixture
+def test_path_pairs():
+    return [(f"file{index}.docx", f"file{index}.html") for index in range(8)]
+
+
+@pytest.fixture
+def test_missing_docx_path():
+    return os.path.join("test_data", "missing.docx")
+
+
+def test_conversion_batch():
+    conversion_batch = ConversionBatch()
+    added = conversion_batch.add(
+        [os.path.join("in", f"file{index % 3}.docx") for index in range(9)]
+    )
+    assert added == 3
+    assert len(conversion_batch) == 3
+    assert os.path.join("in", "file2.docx") in conversion_batch
+    assert conversion_batch.input_path(1) == os.path.join("in", "file1.docx")
+    assert conversion_batch.output_path(1) == os.path.join("in", "file1.html")
+
+    conversion_batch.set_output_dir("out")
+    assert conversion_batch.path_pairs()[0] == (
+        os.path.join("in", "file0.docx"),
+        os.path.join("out", "file0.html"),
+    )
+    conversion_batch.clear()
+    assert len(conversion_batch) == 0
+    assert conversion_batch.path_pairs() == []
+    assert conversion_batch.output_dir is None
+
+
+def test_conversion_batch_mirrors_dirs():
+    input_dir = os.path.join("drop", "reports")
+    conversion_batch = ConversionBatch()
+    conversion_batch.add([os.path.join("in", "single.docx")])
+    conversion_batch.add(
+        [os.path.join(input_dir, "a.docx"), os.path.join(input_dir, "2023", "b.docx")],
+        base_dir=input_dir + os.sep,
+    )
+    assert conversion_batch.output_path(2) == os.path.join(input_dir, "2023", "b.html")
+
+    conversion_batch.set_output_dir("out")
+    conversion_batch.add([os.path.join(input_dir, "c.docx")], base_dir=input_dir)
+    assert [conversion_batch.output_path(index) for index in range(4)] == [
+        os.path.join("out", "single.html"),
+        os.path.join("out", "reports", "a.html"),
+        os.path.join("out", "reports", "2023", "b.html"),
+        os.path.join("out", "reports", "c.html"),
+    ]
+    assert conversion_batch.path_pair(3) == (
+        os.path.join(input_dir, "c.docx"),
+        os.path.join("out", "reports", "c.html"),
+    )
+
+
+def test_conversion_batch_names_archive_output_dirs():
+    archive_path = os.path.join("drop", "issue.zip")
+    member_path = os.path.join(archive_path, "nested", "a.docx")
+    conversion_batch = ConversionBatch()
+    conversion_batch.add([member_path], base_dir=archive_path)
+    assert conversion_batch.output_path(0) == os.path.join("drop", "issue", "nested", "a.html")
+
+    conversion_batch.set_output_dir("out")
+    assert conversion_batch.output_path(0) == os.path.join("out", "issue", "nested", "a.html")
+
+
+def test_get_default_workers():
+    assert get_default_workers() >= 1
+
+
+def test_create_executor():
+    with create_executor(max_workers=2) as executor:
+        assert executor._max_workers == 2
+
+
+def test_convert_batch_empty():
+    assert convert_batch([], remove_prefix=True, remove_strong=True) == []
+
+
+def test_convert_batch_keeps_input_order(monkeypatch, test_path_pairs):
+    def fake_convert(docx_path, html_path, remove_prefix, remove_strong):
+        time.sleep(0.01 * (len(test_path_pairs) - int(docx_path[4:-5])))
+        return f"{docx_path} -> {html_path}"
+
+    monkeypatch.setattr(batch, "convert", fake_convert)
+    actual_result = convert_batch(
+        test_path_pairs, remove_prefix=True, remove_strong=False, max_workers=4
+    )
+    expected_result = [f"{docx} -> {html}" for docx, html in test_path_pairs]
+    assert actual_result == expected_result
+
+
+def test_convert_batch_consumes_inputs_lazily(monkeypatch, test_path_pairs):
+    converted_paths = []
+
+    def fake_convert(docx_path, html_path, remove_prefix, remove_strong):
+        converted_paths.append(docx_path)
+        return docx_path
+
+    def iter_path_pairs():
+        for path_pair in test_path_pairs:
+            if len(converted_paths) == 0:
+                time.sleep(0.01)
+            yield path_pair
+        assert converted_paths
+
+    monkeypatch.setattr(batch, "convert", fake_convert)
+    actual_result = convert_batch(
+        iter_path_pairs(), remove_prefix=True, remove_strong=True, max_workers=1
+    )
+    assert actual_result == [docx for docx, _ in test_path_pairs]
+
+
+def test_convert_batch_processes(test_missing_docx_path):
+    test_html_path = f"{os.path.splitext(test_missing_docx_path)[0]}.html"
+    actual_result = convert_batch(
+        [(test_missing_docx_path, test_html_path)] * 2,
+        remove_prefix=True,
+        remove_strong=False,
+        max_workers=2,
+        use_processes=True,
+    )
+    expected_result = f"Error converting {os.path.basename(test_missing_docx_path)} to HTML: "
+    assert len(actual_result) == 2
+    assert all(result.message.startswith(expected_result) for result in actual_result)
+
+
+def test_convert_batch_worker_error(monkeypatch, test_path_pairs):
+    def fake_convert(docx_path, html_path, remove_prefix, remove_strong):
+        if docx_path == "file3.docx":
+            raise ValueError("unexpected")
+        return ConversionResult(docx_path, html_path, SUCCESS_STATUS, "converted")
+
+    monkeypatch.setattr(batch, "convert", fake_convert)
+    actual_result = convert_batch(
+        test_path_pairs, remove_prefix=True, remove_strong=True, max_workers=2
+    )
+    assert [result.status for result in actual_result] == [SUCCESS_STATUS] * 3 + [
+        FAILED_STATUS
+    ] + [SUCCESS_STATUS] * 4
+    assert actual_result[3].error == "unexpected"
+    assert actual_result[3].message == "Error converting file3.docx to HTML: unexpected"
+
+
+def test_convert_batch_on_result(monkeypatch, test_path_pairs):
+    monkeypatch.setattr(
+        batch, "convert", lambda docx_path, html_path, **kwargs: docx_path
+    )
+    reported_results = {}
+    convert_batch(
+        test_path_pairs,
+        remove_prefix=True,
+        remove_strong=True,
+        max_workers=2,
+        on_result=reported_results.__setitem__,
+    )
+    expected_result = {index: docx for index, (docx, _) in enumerate(test_path_pairs)}
+    assert reported_results == expected_result
+
+
+def test_convert_batch_cancel(monkeypatch, test_path_pairs):
+    cancel_event = threading.Event()
+
+    def fake_convert(docx_path, html_path, remove_prefix, remove_strong, cancel_event=None):
+        cancel_event.set()
+        time.sleep(0.2)
+        return docx_path
+
+    monkeypatch.setattr(batch, "convert", fake_convert)
+    actual_result = convert_batch(
+        test_path_pairs,
+        remove_prefix=True,
+        remove_strong=True,
+        max_workers=1,
+        cancel_event=cancel_event,
+    )
+    assert actual_result[0] == test_path_pairs[0][0]
+    assert actual_result[-1].message == cancelled_message(test_path_pairs[-1][0])
+
+
+def test_convert_batch_hard_cancel(monkeypatch, test_path_pairs):
+    cancel_event = threading.Event()
+
+    def fake_convert(docx_path, html_path, remove_prefix, remove_strong, cancel_event):
+        cancel_event.set()
+        cancel_event.wait(5)
+        return cancelled_result(docx_path, html_path)
+
+    monkeypatch.setattr(batch, "convert", fake_convert)
+    started_at = time.monotonic()
+    actual_result = convert_batch(
+        test_path_pairs,
+        remove_prefix=True,
+        remove_strong=True,
+        max_workers=2,
+        cancel_event=cancel_event,
+    )
+    assert time.monotonic() - started_at < 5
+    assert [result.message for result in actual_result] == [
+        cancelled_message(docx) for docx, _ in test_path_pairs
+    ]
+
+
+def test_format_duration():
+    assert format_duration(75) == "01:15"
+    assert format_duration(3725) == "1:02:05"
+
+
+def test_format_progress():
+    assert format_progress(0, 10, 0.0) == "0/10 files | 0.0 files/s | ETA --:--"
+    assert format_progress(5, 10, 2.5) == "5/10 files | 2.0 files/s | ETA 00:02"
@@ -0,0 +1,59 @@
+import json
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STAGES = (
+    "pandoc",
+    "remove_html_prefix",
+    "remove_strong_tags",
+    "strip_ids",
+    "postprocess_html",
+    "write",
+)
+
+
+def run_conversion_benchmark(*args):
+    return subprocess.run(
+        [
+            sys.executable,
+            os.path.join("benchmarks", "conversion.py"),
+            "-s",
+            "10",
+            "-n",
+            "1",
+            "-w",
+            "1",
+            "--batch-files",
+            "2",
+            "--batch-paragraphs",
+            "10",
+            "--nested-lists",
+            "100",
+            *args,
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+
+
+def test_conversion_benchmark(tmp_path):
+    report_path = tmp_path / "conversion.json"
+    result = run_conversion_benchmark("-o", str(report_path))
+    assert result.returncode == 0, result.stderr
+    report = json.loads(report_path.read_text())
+    assert set(report["stages"]["10"]["stages"]) == set(STAGES)
+    assert report["stages"]["10"]["html_chars"] > 0
+    assert report["batch"]["1"]["files_per_s"] > 0
+    assert set(report["prefix"]["100"]["stages"]) == {"remove_html_prefix", "postprocess_html"}
+
+    baseline = json.loads(report_path.read_text())
+    for timing in baseline["stages"]["10"]["stages"].values():
+        timing["min_ms"] = 0
+    baseline_path = tmp_path / "baseline.json"
+    baseline_path.write_text(json.dumps(baseline))
+    result = run_conversion_benchmark("--baseline", str(baseline_path))
+    assert result.returncode == 1
+    assert "pandoc (10 paragraphs)" in result.stderr
@@ -0,0 +1,132 @@
+import os
+import pytest
+from docx_html_converter import cache as cache_module, convertor
+from docx_html_converter.cache import ConversionCache, get_cache, set_cache
+from docx_html_converter.convertor import docx_to_html
+from docx_html_converter.file_processor import read_file
+
+
+class CountingBackend:
+    def __init__(self):
+        self.calls = 0
+
+    def convert_bytes(self, data, input_format, timeout=None, cancel_event=None):
+        self.calls += 1
+        return '<h1 id="title">Title</h1>\n<p><strong>Text</strong></p>\n'
+
+    def version(self):
+        return "1.0"
+
+
+@pytest.fixture
+def test_cache(tmp_path):
+    return ConversionCache(str(tmp_path / "cache"), max_size_bytes=1000)
+
+
+@pytest.fixture
+def test_docx_path(tmp_path):
+    docx_path = tmp_path / "document.docx"
+    docx_path.write_bytes(b"docx content")
+    return str(docx_path)
+
+
+def test_make_key():
+    key = ConversionCache.make_key(b"data", True, False, "3.1")
+    assert key == ConversionCache.make_key(b"data", True, False, "3.1")
+    assert key != ConversionCache.make_key(b"data", False, False, "3.1")
+    assert key != ConversionCache.make_key(b"data", True, True, "3.1")
+    assert key != ConversionCache.make_key(b"data", True, False, "3.2")
+    assert key != ConversionCache.make_key(b"other", True, False, "3.1")
+
+
+def test_make_key_depends_on_postprocess_version(monkeypatch):
+    key = ConversionCache.make_key(b"data", True, False, "3.1")
+    monkeypatch.setattr(cache_module, "POSTPROCESS_VERSION", "0")
+    assert key != ConversionCache.make_key(b"data", True, False, "3.1")
+
+
+def test_make_ast_key():
+    key = ConversionCache.make_ast_key(b"data", "docx", "3.1")
+    assert key == ConversionCache.make_ast_key(b"data", "docx", "3.1")
+    assert key != ConversionCache.make_ast_key(b"data", "docx", "3.2")
+    assert key != ConversionCache.make_ast_key(b"other", "docx", "3.1")
+    assert key != ConversionCache.make_key(b"data", True, True, "3.1")
+
+
+def test_get_missing(test_cache):
+    assert test_cache.get("0" * 64) is None
+
+
+def test_put_and_get(test_cache):
+    test_cache.put("a" * 64, "<p>Text\r\n</p>")
+    assert test_cache.get("a" * 64) == "<p>Text\r\n</p>"
+    assert test_cache.size() == len("<p>Text\r\n</p>")
+
+
+def test_lru_eviction(test_cache):
+    test_cache.put("a" * 64, "a" * 400)
+    test_cache.put("b" * 64, "b" * 400)
+    os.utime(test_cache._entry_path("a" * 64), (1, 1))
+    os.utime(test_cache._entry_path("b" * 64), (2, 2))
+    test_cache.get("a" * 64)
+    test_cache.put("c" * 64, "c" * 400)
+    assert test_cache.get("a" * 64) == "a" * 400
+    assert test_cache.get("b" * 64) is None
+    assert test_cache.size() <= test_cache.max_size_bytes
+
+
+def test_clear(test_cache):
+    test_cache.put("a" * 64, "content")
+    test_cache.clear()
+    assert test_cache.get("a" * 64) is None
+    assert test_cache.size() == 0
+
+
+def test_clear_keeps_other_files(tmp_path):
+    cache_dir = tmp_path / "cache"
+    (cache_dir / "precious").mkdir(parents=True)
+    (cache_dir / "precious" / "notes.txt").write_text("notes")
+    (cache_dir / "ab").mkdir()
+    (cache_dir / "ab" / "notes.html").write_text("notes")
+    (cache_dir / "batch_journal.jsonl").write_text("{}\n")
+    test_cache = ConversionCache(str(cache_dir))
+    test_cache.put("ab" + "c" * 62, "content")
+    test_cache.put("d" * 64, "content")
+    test_cache.clear()
+    assert test_cache.get("ab" + "c" * 62) is None
+    assert sorted(os.listdir(cache_dir)) == ["ab", "batch_journal.jsonl", "precious"]
+    assert os.listdir(cache_dir / "ab") == ["notes.html"]
+    assert (cache_dir / "precious" / "notes.txt").read_text() == "notes"
+
+
+def test_set_cache(monkeypatch, test_cache):
+    monkeypatch.setattr(cache_module, "_cache", None)
+    monkeypatch.setattr(cache_module, "_cache_configured", False)
+    set_cache(test_cache)
+    assert get_cache() is test_cache
+
+
+def test_docx_to_html_cache_hit(monkeypatch, tmp_path, test_cache, test_docx_path):
+    backend = CountingBackend()
+    monkeypatch.setattr(convertor, "get_backend", lambda: backend)
+    monkeypatch.setattr(convertor, "get_cache", lambda: test_cache)
+
+    first_html_path = str(tmp_path / "first.html")
+    second_html_path = str(tmp_path / "second.html")
+    docx_to_html(test_docx_path, first_html_path, remove_prefix=False, remove_strong=True)
+    docx_to_html(test_docx_path, second_html_path, remove_prefix=False, remove_strong=True)
+
+    assert backend.calls == 1
+    assert read_file(second_html_path) == read_file(first_html_path)
+    assert read_file(second_html_path) == "<h1>Title</h1>\n<p>Text</p>\n"
+
+
+def test_docx_to_html_without_cache_streams_same_html(monkeypatch, tmp_path, test_docx_path):
+    backend = CountingBackend()
+    monkeypatch.setattr(convertor, "get_backend", lambda: backend)
+    monkeypatch.setattr(convertor, "get_cache", lambda: None)
+
+    html_path = str(tmp_path / "streamed.html")
+    docx_to_html(test_docx_path, html_path, remove_prefix=False, remove_strong=True)
+    assert backend.calls == 1
+    assert read_file(html_path) == "<h1>Title</h1>\n<p>Text</p>\n"
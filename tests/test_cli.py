@@ -0,0 +1,242 @@
+import os
+import subprocess
+import sys
+import pytest
+from docx_html_converter import batch
+from docx_html_converter.batch import ConversionBatch
+from docx_html_converter.backends import PypandocBackend, get_backend, swap_backend
+from docx_html_converter.cache import ConversionCache, get_cache, swap_cache
+from docx_html_converter.cli import collect_inputs, get_output_path, main
+from docx_html_converter.constants import (
+    BACKEND_ENV_VAR,
+    CACHE_DIR_ENV_VAR,
+    EXIT_CONVERSION_FAILED,
+    EXIT_NO_INPUT,
+    EXIT_OK,
+    EXIT_USAGE_ERROR,
+    PYPANDOC_BACKEND,
+    TIMEOUT_ENV_VAR,
+)
+from docx_html_converter.results import FAILED_STATUS, SUCCESS_STATUS, ConversionResult
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def fake_convert(docx_path, html_path, remove_prefix, remove_strong, sink=None):
+    if "broken" in docx_path:
+        return ConversionResult(
+            docx_path,
+            html_path,
+            FAILED_STATUS,
+            f"Error converting {os.path.basename(docx_path)} to HTML: broken",
+        )
+    html_content = f"<p>{os.path.basename(docx_path)} {remove_prefix} {remove_strong}</p>\n"
+    if sink is not None:
+        sink.write(html_path, html_content)
+    else:
+        with open(html_path, "w") as f:
+            f.write(html_content)
+    return ConversionResult(
+        docx_path,
+        html_path,
+        SUCCESS_STATUS,
+        f"{os.path.basename(docx_path)} converted to HTML successfully!\n",
+    )
+
+
+@pytest.fixture
+def test_input_dir(tmp_path):
+    input_dir = tmp_path / "input"
+    (input_dir / "nested").mkdir(parents=True)
+    (input_dir / "first.docx").write_bytes(b"")
+    (input_dir / "nested" / "second.docx").write_bytes(b"")
+    (input_dir / "notes.txt").write_bytes(b"")
+    return str(input_dir)
+
+
+@pytest.fixture(autouse=True)
+def fake_batch_convert(monkeypatch, conversion_env):
+    monkeypatch.setattr(batch, "convert", fake_convert)
+
+
+def test_collect_inputs(test_input_dir):
+    first_path = os.path.join(test_input_dir, "first.docx")
+    second_path = os.path.join(test_input_dir, "nested", "second.docx")
+    actual_result = collect_inputs(
+        [first_path, test_input_dir, os.path.join(test_input_dir, "*.docx")]
+    )
+    expected_result = [(first_path, None), (second_path, test_input_dir)]
+    assert actual_result == expected_result
+
+
+def test_get_output_path():
+    assert get_output_path("in/a.docx", None, None) == os.path.join("in", "a.html")
+    assert get_output_path("in/a.docx", None, "out") == os.path.join("out", "a.html")
+    assert get_output_path(
+        os.path.join("in", "sub", "a.docx"), "in", "out"
+    ) == os.path.join("out", "in", "sub", "a.html")
+
+
+def test_get_output_path_matches_gui(test_input_dir):
+    first_path = os.path.join(test_input_dir, "first.docx")
+    second_path = os.path.join(test_input_dir, "nested", "second.docx")
+    conversion_batch = ConversionBatch()
+    conversion_batch.add([first_path])
+    conversion_batch.add([second_path], test_input_dir)
+    conversion_batch.set_output_dir("out")
+    assert conversion_batch.path_pairs() == [
+        (first_path, get_output_path(first_path, None, "out")),
+        (second_path, get_output_path(second_path, test_input_dir, "out")),
+    ]
+
+
+def test_main_output_dir(tmp_path, test_input_dir):
+    output_dir = tmp_path / "output"
+    actual_result = main([test_input_dir, "-o", str(output_dir), "-j", "2", "-q"])
+    assert actual_result == EXIT_OK
+    assert (output_dir / "input" / "first.html").read_text() == "<p>first.docx True True</p>\n"
+    assert (output_dir / "input" / "nested" / "second.html").exists()
+
+
+def test_main_zip_input(tmp_path):
+    import zipfile
+
+    archive_path = tmp_path / "issue.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("first.docx", b"")
+        archive.writestr("nested/second.docx", b"")
+    output_dir = tmp_path / "output"
+    assert main([str(archive_path), "-o", str(output_dir), "-q"]) == EXIT_OK
+    assert (output_dir / "issue" / "first.html").read_text() == "<p>first.docx True True</p>\n"
+    assert (output_dir / "issue" / "nested" / "second.html").exists()
+
+    assert main([str(archive_path), "-q"]) == EXIT_OK
+    assert (tmp_path / "issue" / "first.html").exists()
+
+
+def test_main_stdout(capsys, test_input_dir):
+    actual_result = main(
+        [os.path.join(test_input_dir, "first.docx"), "--stdout", "--no-remove-strong"]
+    )
+    captured = capsys.readouterr()
+    assert actual_result == EXIT_OK
+    assert captured.out == "<p>first.docx True False</p>\n"
+    assert captured.err == "1. first.docx converted to HTML successfully!\n"
+    assert not os.path.exists(os.path.join(test_input_dir, "first.html"))
+
+    with pytest.raises(SystemExit) as exc_info:
+        main([test_input_dir, "--stdout", "--processes"])
+    assert exc_info.value.code == EXIT_USAGE_ERROR
+
+
+def test_main_conversion_failed(tmp_path):
+    broken_path = tmp_path / "broken.docx"
+    broken_path.write_bytes(b"")
+    assert main([str(broken_path), "-q"]) == EXIT_CONVERSION_FAILED
+
+
+def test_main_report(tmp_path, test_input_dir):
+    import json
+
+    with open(os.path.join(test_input_dir, "broken.docx"), "wb"):
+        pass
+    report_path = tmp_path / "report.json"
+    args = [test_input_dir, "-o", str(tmp_path / "output"), "--report", str(report_path), "-q"]
+    assert main(args) == EXIT_CONVERSION_FAILED
+    report = json.loads(report_path.read_text())
+    assert (report["total"], report["succeeded"], report["failed"]) == (3, 2, 1)
+    assert [result["status"] for result in report["results"]] == [
+        FAILED_STATUS,
+        SUCCESS_STATUS,
+        SUCCESS_STATUS,
+    ]
+
+
+def test_main_journal(monkeypatch, tmp_path, test_input_dir):
+    journal_path = tmp_path / "journal.jsonl"
+    with open(os.path.join(test_input_dir, "broken.docx"), "wb"):
+        pass
+    args = [test_input_dir, "-o", str(tmp_path / "output"), "--journal", str(journal_path), "-q"]
+    assert main(args) == EXIT_CONVERSION_FAILED
+    assert journal_path.exists()
+
+    converted_paths = []
+
+    def fixed_convert(docx_path, html_path, remove_prefix, remove_strong):
+        converted_paths.append(os.path.basename(docx_path))
+        fixed_path = docx_path.replace("broken", "fixed")
+        return fake_convert(fixed_path, html_path, remove_prefix, remove_strong)
+
+    monkeypatch.setattr(batch, "convert", fixed_convert)
+    assert main(args) == EXIT_OK
+    assert converted_paths == ["broken.docx"]
+    assert not journal_path.exists()
+
+
+def test_main_no_input(tmp_path):
+    assert main([str(tmp_path / "*.docx"), "-q"]) == EXIT_NO_INPUT
+
+
+def test_main_watch_usage_error(test_input_dir):
+    assert main([test_input_dir, "--watch"]) == EXIT_USAGE_ERROR
+
+
+def test_main_invalid_jobs():
+    with pytest.raises(SystemExit) as exc_info:
+        main(["file.docx", "-j", "0"])
+    assert exc_info.value.code == EXIT_USAGE_ERROR
+
+
+def test_main_assets_dir_usage_error(tmp_path, test_input_dir):
+    with pytest.raises(SystemExit) as exc_info:
+        main([test_input_dir, "--assets-dir", str(tmp_path), "--stdout"])
+    assert exc_info.value.code == EXIT_USAGE_ERROR
+
+
+def test_main_timeout(monkeypatch, test_input_dir):
+    with pytest.raises(SystemExit) as exc_info:
+        main([test_input_dir, "--timeout", "-1"])
+    assert exc_info.value.code == EXIT_USAGE_ERROR
+
+    timeouts = []
+
+    def record_timeout(docx_path, html_path, remove_prefix, remove_strong):
+        timeouts.append(os.environ.get(TIMEOUT_ENV_VAR))
+        return fake_convert(docx_path, html_path, remove_prefix, remove_strong)
+
+    monkeypatch.setattr(batch, "convert", record_timeout)
+    assert main([test_input_dir, "--timeout", "0.5", "-q"]) == EXIT_OK
+    assert timeouts == ["0.5", "0.5"]
+    assert TIMEOUT_ENV_VAR not in os.environ
+
+
+def test_main_restores_configuration(test_input_dir):
+    backend = PypandocBackend()
+    cache = ConversionCache(os.path.join(test_input_dir, "cache"))
+    previous_backend = swap_backend(backend)
+    previous_cache = swap_cache(cache)
+    try:
+        assert main([test_input_dir, "--backend", PYPANDOC_BACKEND, "-q"]) == EXIT_OK
+        assert get_backend() is backend
+        assert get_cache() is cache
+        assert os.environ[BACKEND_ENV_VAR] == PYPANDOC_BACKEND
+        assert os.environ[CACHE_DIR_ENV_VAR] == ""
+    finally:
+        swap_backend(previous_backend)
+        swap_cache(*previous_cache)
+
+
+def test_cli_does_not_import_gui():
+    code = (
+        "import sys\n"
+        "from docx_html_converter.__main__ import main\n"
+        "print(any(name.startswith(('tkinter', 'tkinterdnd2')) for name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
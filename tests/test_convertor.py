@@ -1,11 +1,16 @@
 import os
 import pytest
-from docx_html_converter.constants import HTML_EXTENSION
+from docx_html_converter import convertor
+from docx_html_converter.backends import ConversionCancelled, ConversionTimeout
+from docx_html_converter.constants import DEFAULT_TIMEOUT_S, HTML_EXTENSION, TIMEOUT_ENV_VAR
 from docx_html_converter.convertor import (
     windows_fix,
     remove_html_prefix,
     docx_to_html,
     convert,
+    convert_bytes,
+    cancelled_message,
+    get_timeout,
 )
 
 
@@ -19,6 +24,12 @@ def test_parse_html_data():
     return "<h1>Title</h1><ul>\n<li>List content  <li>\n</ul><p>Paragraph</p><ul><li>List content<li></ul>"
 
 
+@pytest.fixture
+def test_docx_content():
+    with open(os.path.join("test_data", "test_data.docx"), "rb") as f:
+        return f.read()
+
+
 @pytest.fixture
 def test_docx_path():
     return os.path.join("test_data", "test_data/test_data.docx")
@@ -36,6 +47,17 @@ def test_remove_html_prefix(test_parse_html_data):
     assert actual_result == expected_result
 
 
+def test_remove_html_prefix_nested():
+    html_content = (
+        "<h1>Title</h1>\n<!-- <ul> -->\n<ul>\n<li>Task\n<UL class=\"sub\">\n<li>Step</li>\n</ul></li>"
+        "\n<li>Task</li>\n</ul>\n<p>Paragraph\n  indented</p>\n<ul>\n<li>Item</li>\n</ul>"
+    )
+    actual_result = remove_html_prefix(html_content)
+    expected_result = "<p>Paragraph\n  indented</p>\n<ul>\n<li>Item</li>\n</ul>"
+    assert actual_result == expected_result
+    assert remove_html_prefix("<p>Text</p><ul><li>Open") == "<p>Text</p><ul><li>Open"
+
+
 def test_docx_to_html_fail(test_docx_path):
     with pytest.raises(RuntimeError):
         test_html_path = f"{os.path.splitext(test_docx_path)[0]}.{HTML_EXTENSION}"
@@ -52,7 +74,24 @@ def test_convert_fail(test_docx_path):
     test_html_path = f"{os.path.splitext(test_docx_path)[0]}.{HTML_EXTENSION}"
     actual_result = convert(test_docx_path, test_html_path, remove_prefix=True, remove_strong=False)
     expected_result = f"Error converting {os.path.basename(test_docx_path)} to HTML: "
-    assert actual_result.startswith(expected_result)
+    assert actual_result.message.startswith(expected_result)
+    assert actual_result.status == "failed"
+    assert not actual_result.success
+
+
+def test_convert_unreadable_input(tmp_path):
+    docx_dir_path = tmp_path / "folder.docx"
+    docx_dir_path.mkdir()
+    broken_archive_path = tmp_path / "issue.zip"
+    broken_archive_path.write_bytes(b"not a zip")
+    for docx_path in (str(docx_dir_path), os.path.join(str(broken_archive_path), "a.docx")):
+        actual_result = convert(
+            docx_path, str(tmp_path / "out.html"), remove_prefix=True, remove_strong=False
+        )
+        assert actual_result.status == "failed"
+        assert actual_result.message.startswith(
+            f"Error converting {os.path.basename(docx_path)} to HTML: "
+        )
 
 
 def test_convert_success(test_docx_path):
@@ -61,5 +100,56 @@ def test_convert_success(test_docx_path):
     expected_result = (
         f"{os.path.basename(test_docx_path)} converted to HTML successfully!\n"
     )
-    assert actual_result == expected_result
+    assert actual_result.message == expected_result
+    assert actual_result.success
     assert os.path.exists(test_html_path)
+
+
+def test_convert_bytes(tmp_path, test_docx_content):
+    docx_path = tmp_path / "test_data.docx"
+    docx_path.write_bytes(test_docx_content)
+    html_path = tmp_path / "test_data.html"
+    docx_to_html(str(docx_path), str(html_path), remove_prefix=True, remove_strong=True)
+    actual_result = convert_bytes(test_docx_content, remove_prefix=True, remove_strong=True)
+    assert actual_result
+    assert actual_result == html_path.read_text(encoding="utf-8")
+
+
+def test_convert_bytes_fail():
+    with pytest.raises(RuntimeError):
+        convert_bytes(b"not a docx", remove_prefix=True, remove_strong=False)
+
+
+def test_get_timeout(monkeypatch):
+    monkeypatch.delenv(TIMEOUT_ENV_VAR, raising=False)
+    assert get_timeout() == DEFAULT_TIMEOUT_S
+    assert get_timeout(5) == 5
+    monkeypatch.setenv(TIMEOUT_ENV_VAR, "0")
+    assert get_timeout() is None
+    monkeypatch.setenv(TIMEOUT_ENV_VAR, "2.5")
+    assert get_timeout() == 2.5
+
+
+@pytest.mark.parametrize(
+    "error, expected_result",
+    [
+        (ConversionTimeout("pandoc timed out"), "Timeout converting test_data.docx to HTML: "),
+        (ConversionCancelled("pandoc was cancelled"), cancelled_message("test_data.docx")),
+    ],
+)
+def test_convert_timeout_and_cancel(
+    monkeypatch, tmp_path, test_docx_content, error, expected_result
+):
+    def fake_read_html(data, input_format, engine, timeout=None, cancel_event=None):
+        assert timeout == 1
+        raise error
+
+    docx_path = tmp_path / "test_data.docx"
+    docx_path.write_bytes(test_docx_content)
+    monkeypatch.setattr(convertor, "get_cache", lambda: None)
+    monkeypatch.setattr(convertor, "read_html", fake_read_html)
+    actual_result = convert(
+        str(docx_path), str(tmp_path / "test_data.html"), True, True, engine="pandoc", timeout=1
+    )
+    assert actual_result.message.startswith(expected_result)
+    assert not (tmp_path / "test_data.html").exists()
@@ -0,0 +1,135 @@
+import os
+
+import pytest
+from docx_html_converter.backends import PypandocBackend
+from docx_html_converter.constants import NATIVE_ENGINE, PANDOC_ENGINE
+from docx_html_converter.convertor import convert_bytes
+from docx_html_converter.docx_reader import (
+    UnsupportedDocxError,
+    make_identifier,
+    read_docx_html,
+)
+from tests.docx_factory import make_docx
+
+
+def run(text: str, properties: str = "") -> str:
+    return (
+        f"<w:r><w:rPr>{properties}</w:rPr>"
+        f'<w:t xml:space="preserve">{text}</w:t></w:r>'
+    )
+
+
+def paragraph(*runs: str, style: str = "", num_id: int = 0, level: int = 0) -> str:
+    properties = f'<w:pStyle w:val="{style}"/>' if style else ""
+    if num_id:
+        properties += (
+            f'<w:numPr><w:ilvl w:val="{level}"/><w:numId w:val="{num_id}"/></w:numPr>'
+        )
+    return f"<w:p><w:pPr>{properties}</w:pPr>{''.join(runs)}</w:p>"
+
+
+@pytest.fixture
+def test_blog_docx():
+    return make_docx(
+        paragraph(run("Blog &amp; post"), style="Heading1")
+        + paragraph(
+            run("Some "),
+            run("bold", "<w:b/>"),
+            run(" and "),
+            run("italic", "<w:i/>"),
+            run(" text with "),
+            f'<w:hyperlink r:id="rId3">{run("a link")}</w:hyperlink>',
+            run(". " + "A longer sentence that needs wrapping. " * 2),
+        )
+        + paragraph(run("First point"), num_id=1)
+        + paragraph(run("Nested step"), num_id=2, level=1)
+        + paragraph(run("Second point"), num_id=1)
+        + paragraph(run("Blog &amp; post"), style="Heading2")
+        + paragraph(run("Closing words", "<w:b/><w:i/>"))
+    )
+
+
+@pytest.fixture
+def test_table_docx():
+    return make_docx(
+        paragraph(run("Before"))
+        + f"<w:tbl><w:tr><w:tc>{paragraph(run('Cell'))}</w:tc></w:tr></w:tbl>"
+    )
+
+
+@pytest.fixture
+def test_docx_content():
+    with open(os.path.join("test_data", "test_data.docx"), "rb") as f:
+        return f.read()
+
+
+def test_read_docx_html(test_blog_docx):
+    actual_result = read_docx_html(test_blog_docx)
+    expected_result = (
+        '<h1 id="blog-post">Blog &amp; post</h1>\n'
+        "<p>Some <strong>bold</strong> and <em>italic</em> text with <a\n"
+        'href="https://example.com/?a=1&amp;b=2">a link</a>. A longer sentence\n'
+        "that needs wrapping. A longer sentence that needs wrapping.</p>\n"
+        '<ul>\n<li><p>First point</p>\n<ol type="1">\n<li><p>Nested step</p></li>\n</ol></li>\n'
+        "<li><p>Second point</p></li>\n</ul>\n"
+        '<h2 id="blog-post-1">Blog &amp; post</h2>\n'
+        "<p><em><strong>Closing words</strong></em></p>\n"
+    )
+    assert actual_result == expected_result
+
+
+def test_read_docx_html_matches_pandoc(test_blog_docx):
+    expected_result = PypandocBackend().convert_bytes(test_blog_docx, "docx")
+    assert read_docx_html(test_blog_docx) == expected_result
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"not a docx",
+        make_docx(paragraph(run("Text", '<w:highlight w:val="yellow"/>'))),
+        make_docx(paragraph(run("Text"), "<w:fldSimple/>")),
+    ],
+)
+def test_read_docx_html_unsupported(data):
+    with pytest.raises(UnsupportedDocxError):
+        read_docx_html(data)
+
+
+def test_read_docx_html_table(test_table_docx):
+    with pytest.raises(UnsupportedDocxError):
+        read_docx_html(test_table_docx)
+
+
+def test_make_identifier():
+    used_identifiers = {"title"}
+    assert make_identifier("Title", used_identifiers) == "title-1"
+    assert make_identifier("1. Straße & more", used_identifiers) == "straße-more"
+    assert make_identifier("123", used_identifiers) == "section"
+
+
+@pytest.mark.parametrize("remove_strong", [False, True])
+def test_convert_bytes_native_engine(test_blog_docx, remove_strong):
+    actual_result = convert_bytes(
+        test_blog_docx, remove_prefix=True, remove_strong=remove_strong, engine=NATIVE_ENGINE
+    )
+    expected_result = convert_bytes(
+        test_blog_docx, remove_prefix=True, remove_strong=remove_strong, engine=PANDOC_ENGINE
+    )
+    assert actual_result == expected_result
+
+
+def test_convert_bytes_native_engine_fallback(test_docx_content):
+    actual_result = convert_bytes(
+        test_docx_content, remove_prefix=True, remove_strong=True, engine=NATIVE_ENGINE
+    )
+    expected_result = convert_bytes(
+        test_docx_content, remove_prefix=True, remove_strong=True, engine=PANDOC_ENGINE
+    )
+    assert actual_result
+    assert actual_result == expected_result
+
+
+def test_convert_bytes_unknown_engine(test_blog_docx):
+    with pytest.raises(ValueError):
+        convert_bytes(test_blog_docx, remove_prefix=True, remove_strong=False, engine="word")
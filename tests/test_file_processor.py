@@ -1,6 +1,14 @@
+import hashlib
 import os
 import pytest
-from docx_html_converter.file_processor import save_file, read_file
+from docx_html_converter.file_processor import (
+    save_file,
+    read_file,
+    hash_file,
+    files_equal,
+    is_docx_file,
+    scan_docx_files,
+)
 
 
 @pytest.fixture
@@ -33,3 +41,43 @@ def test_read_file_success(test_read_path, test_data):
     actual_result = read_file(test_read_path)
     expected_result = test_data
     assert actual_result == expected_result
+
+
+def test_hash_file(tmp_path):
+    file_path = tmp_path / "file.bin"
+    file_path.write_bytes(b"content")
+    actual_result = hash_file(str(file_path), chunk_size=3)
+    expected_result = hashlib.sha256(b"content").hexdigest()
+    assert actual_result == expected_result
+
+
+def test_files_equal(tmp_path):
+    first_path, second_path, third_path = (tmp_path / name for name in "abc")
+    first_path.write_bytes(b"content")
+    second_path.write_bytes(b"content")
+    third_path.write_bytes(b"contenT")
+    assert files_equal(str(first_path), str(second_path), chunk_size=2)
+    assert not files_equal(str(first_path), str(third_path), chunk_size=2)
+
+
+def test_is_docx_file():
+    assert is_docx_file("file.docx")
+    assert not is_docx_file("~$file.docx")
+
+
+def test_scan_docx_files(tmp_path):
+    relative_paths = ["b.docx", "a.docx", "notes.txt", "~$a.docx", "sub/c.DOCX", "sub/deep/d.docx"]
+    for relative_path in relative_paths:
+        file_path = tmp_path / relative_path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(b"")
+    (tmp_path / "folder.docx").mkdir()
+
+    docx_paths = scan_docx_files(str(tmp_path))
+    assert next(docx_paths) == str(tmp_path / "a.docx")
+    assert list(docx_paths) == [
+        str(tmp_path / "b.docx"),
+        str(tmp_path / "sub" / "c.DOCX"),
+        str(tmp_path / "sub" / "deep" / "d.docx"),
+    ]
+    assert list(scan_docx_files(str(tmp_path / "missing"))) == []
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import threading
+import zipfile
+
+import pytest
+from docx_html_converter import convertor
+from docx_html_converter.convertor import convert, start_image_extractor
+from docx_html_converter.images import ImageExtractor, extract_images, get_assets_url
+
+
+@pytest.fixture
+def test_images_docx_path():
+    return os.path.join("test_data", "test_images.docx")
+
+
+@pytest.fixture
+def test_media_docx_path(tmp_path):
+    docx_path = tmp_path / "media.docx"
+    with zipfile.ZipFile(docx_path, "w") as archive:
+        archive.writestr("word/document.xml", "<document/>")
+        archive.writestr("word/media/image1.png", b"first image")
+        archive.writestr("word/media/image2.PNG", b"first image")
+        archive.writestr("word/media/image3.jpeg", b"second image")
+    return str(docx_path)
+
+
+def test_get_assets_url(tmp_path):
+    html_path = str(tmp_path / "out" / "nested" / "file.html")
+    assert get_assets_url(str(tmp_path / "out" / "my assets"), html_path) == "../my%20assets"
+    assert get_assets_url(str(tmp_path / "out" / "nested"), html_path) == "."
+
+
+def test_extract_images(tmp_path, test_media_docx_path):
+    assets_dir = tmp_path / "assets"
+    first_name = f"{hashlib.sha256(b'first image').hexdigest()}.png"
+    second_name = f"{hashlib.sha256(b'second image').hexdigest()}.jpeg"
+    actual_result = extract_images(test_media_docx_path, str(assets_dir))
+    assert actual_result == {
+        "media/image1.png": first_name,
+        "media/image2.PNG": first_name,
+        "media/image3.jpeg": second_name,
+    }
+    assert sorted(os.listdir(assets_dir)) == sorted([first_name, second_name])
+    assert (assets_dir / second_name).read_bytes() == b"second image"
+
+
+def test_image_extractor_error(tmp_path):
+    not_a_zip_path = tmp_path / "broken.docx"
+    not_a_zip_path.write_bytes(b"not a zip")
+    image_extractor = ImageExtractor(str(not_a_zip_path), str(tmp_path / "assets"), "assets")
+    with pytest.raises(RuntimeError):
+        image_extractor.start().sources()
+
+
+def test_convert_with_images(tmp_path, test_images_docx_path):
+    assets_dir = tmp_path / "assets"
+    for html_path in (tmp_path / "first.html", tmp_path / "nested" / "second.html"):
+        os.makedirs(html_path.parent, exist_ok=True)
+        actual_result = convert(
+            test_images_docx_path,
+            str(html_path),
+            remove_prefix=True,
+            remove_strong=True,
+            engine="pandoc",
+            assets_dir=str(assets_dir),
+        )
+        assert actual_result.message.endswith("converted to HTML successfully!\n")
+
+    asset_names = sorted(os.listdir(assets_dir))
+    assert len(asset_names) == 2
+    first_html = (tmp_path / "first.html").read_text(encoding="utf-8")
+    second_html = (tmp_path / "nested" / "second.html").read_text(encoding="utf-8")
+    for asset_name in asset_names:
+        assert f'src="assets/{asset_name}"' in first_html
+        assert f'src="../assets/{asset_name}"' in second_html
+    assert "media/" not in first_html
+
+
+def test_extract_images_stopped(tmp_path, test_media_docx_path):
+    stop_event = threading.Event()
+    stop_event.set()
+    assert extract_images(test_media_docx_path, str(tmp_path / "assets"), stop_event) == {}
+    assert not (tmp_path / "assets").exists()
+
+
+def test_convert_stops_image_extractor_on_failure(monkeypatch, tmp_path, test_media_docx_path):
+    extractors = []
+
+    def record_extractor(*args):
+        extractors.append(start_image_extractor(*args))
+        return extractors[-1]
+
+    def fail_conversion(*args, **kwargs):
+        raise RuntimeError("pandoc failed")
+
+    monkeypatch.setattr(convertor, "start_image_extractor", record_extractor)
+    monkeypatch.setattr(convertor, "convert_raw_html", fail_conversion)
+    actual_result = convert(
+        test_media_docx_path,
+        str(tmp_path / "media.html"),
+        remove_prefix=True,
+        remove_strong=True,
+        assets_dir="assets",
+    )
+    assert not actual_result.success
+    assert "pandoc failed" in actual_result.message
+    assert len(extractors) == 1
+    assert not extractors[0]._thread.is_alive()
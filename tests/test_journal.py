@@ -0,0 +1,129 @@
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+from docx_html_converter import convertor
+from docx_html_converter.batch import get_journal_options
+from docx_html_converter.constants import AST_ENGINE, ENGINE_ENV_VAR, GZIP_SIDECAR, NATIVE_ENGINE
+from docx_html_converter.journal import (
+    DONE_STATUS,
+    FAILED_STATUS,
+    PLANNED_STATUS,
+    BatchJournal,
+)
+from docx_html_converter.sinks import DirectorySink
+
+
+@pytest.fixture
+def test_paths(tmp_path):
+    docx_path = tmp_path / "file.docx"
+    html_path = tmp_path / "file.html"
+    docx_path.write_bytes(b"docx")
+    html_path.write_text("<p>html</p>")
+    return str(docx_path), str(html_path)
+
+
+def read_statuses(journal_path):
+    with open(journal_path) as f:
+        return [json.loads(line)["status"] for line in f]
+
+
+def test_batch_journal_resume(tmp_path, test_paths):
+    journal_path = str(tmp_path / "journal.jsonl")
+    docx_path, html_path = test_paths
+    with BatchJournal(journal_path) as journal:
+        journal.plan(docx_path, html_path, True, True)
+        assert not journal.is_done(docx_path, html_path, True, True)
+        journal.finish(docx_path, html_path, True, True, success=True)
+        journal.plan("other.docx", "other.html", True, True)
+        journal.finish("other.docx", "other.html", True, True, success=False)
+    assert read_statuses(journal_path) == [
+        PLANNED_STATUS,
+        DONE_STATUS,
+        PLANNED_STATUS,
+        FAILED_STATUS,
+    ]
+
+    with BatchJournal(journal_path) as journal:
+        assert journal.is_done(docx_path, html_path, True, True)
+        assert not journal.is_done(docx_path, html_path, False, True)
+        assert not journal.is_done(docx_path, "moved.html", True, True)
+        assert not journal.is_done("other.docx", "other.html", True, True)
+
+        with open(docx_path, "ab") as f:
+            f.write(b" changed")
+        assert not journal.is_done(docx_path, html_path, True, True)
+
+
+def test_batch_journal_options(tmp_path, test_paths):
+    journal_path = str(tmp_path / "journal.jsonl")
+    docx_path, html_path = test_paths
+    with BatchJournal(journal_path) as journal:
+        journal.finish(docx_path, html_path, True, True, success=True, options="minified")
+
+    with BatchJournal(journal_path) as journal:
+        assert journal.is_done(docx_path, html_path, True, True, "minified")
+        assert not journal.is_done(docx_path, html_path, True, True)
+        assert not journal.is_done(docx_path, html_path, True, True, "other")
+
+
+def test_get_journal_options(monkeypatch, tmp_path):
+    monkeypatch.setenv(ENGINE_ENV_VAR, NATIVE_ENGINE)
+    options = get_journal_options()
+    assert options == get_journal_options(sink=DirectorySink())
+    assert options != get_journal_options(minify=True)
+    assert options != get_journal_options(assets_dir=str(tmp_path))
+    assert options != get_journal_options(sink=DirectorySink(sidecars=[GZIP_SIDECAR]))
+    monkeypatch.setattr(convertor, "get_backend", lambda: SimpleNamespace(version=lambda: "3.1"))
+    monkeypatch.setenv(ENGINE_ENV_VAR, AST_ENGINE)
+    assert options != get_journal_options()
+
+
+def test_batch_journal_archive_member(tmp_path):
+    import zipfile
+
+    archive_path = tmp_path / "issue.zip"
+    with zipfile.ZipFile(archive_path, "w") as archive:
+        archive.writestr("file.docx", b"docx")
+    docx_path = os.path.join(str(archive_path), "file.docx")
+    html_path = tmp_path / "file.html"
+    html_path.write_text("<p>html</p>")
+    journal_path = str(tmp_path / "journal.jsonl")
+    with BatchJournal(journal_path) as journal:
+        journal.finish(docx_path, str(html_path), True, True, success=True)
+    assert read_statuses(journal_path) == [DONE_STATUS]
+
+    with BatchJournal(journal_path) as journal:
+        assert journal.is_done(docx_path, str(html_path), True, True)
+        with zipfile.ZipFile(archive_path, "w") as archive:
+            archive.writestr("file.docx", b"changed docx")
+        assert not journal.is_done(docx_path, str(html_path), True, True)
+
+
+def test_batch_journal_truncated_line(tmp_path, test_paths):
+    journal_path = tmp_path / "journal.jsonl"
+    docx_path, html_path = test_paths
+    with BatchJournal(str(journal_path)) as journal:
+        journal.finish(docx_path, html_path, True, True, success=True)
+    with open(journal_path, "a") as f:
+        f.write('{"status": "pla')
+
+    with BatchJournal(str(journal_path)) as journal:
+        assert journal.is_done(docx_path, html_path, True, True)
+        journal.plan("other.docx", "other.html", True, True)
+    with BatchJournal(str(journal_path)) as journal:
+        assert journal.is_done(docx_path, html_path, True, True)
+    lines = journal_path.read_text().splitlines()
+    assert lines[1] == '{"status": "pla'
+    assert json.loads(lines[2])["status"] == PLANNED_STATUS
+
+
+def test_batch_journal_remove(tmp_path):
+    journal_path = str(tmp_path / "nested" / "journal.jsonl")
+    journal = BatchJournal(journal_path)
+    journal.plan("file.docx", "file.html", True, True)
+    journal.remove()
+    assert not os.path.exists(journal_path)
+    with pytest.raises(RuntimeError):
+        journal.plan("file.docx", "file.html", True, True)
@@ -0,0 +1,86 @@
+import itertools
+import os
+import pytest
+from docx_html_converter import convertor, pandoc_ast
+from docx_html_converter.backends import PypandocBackend
+from docx_html_converter.cache import ConversionCache
+from docx_html_converter.constants import AST_ENGINE, PANDOC_ENGINE
+from docx_html_converter.convertor import convert_bytes
+from docx_html_converter.pandoc_ast import transform_ast
+
+
+class RecordingBackend(PypandocBackend):
+    def __init__(self):
+        self.input_formats = []
+
+    def convert_bytes(self, data, input_format, **kwargs):
+        self.input_formats.append(input_format)
+        return super().convert_bytes(data, input_format, **kwargs)
+
+
+@pytest.fixture
+def test_ast():
+    return {
+        "pandoc-api-version": [1, 23, 1],
+        "meta": {},
+        "blocks": [
+            {"t": "Para", "c": [{"t": "Str", "c": "Task"}]},
+            {"t": "BulletList", "c": [[{"t": "Plain", "c": [{"t": "Str", "c": "Item"}]}]]},
+            {
+                "t": "Header",
+                "c": [
+                    2,
+                    ["title", [], []],
+                    [{"t": "Strong", "c": [{"t": "Str", "c": "Title"}]}],
+                ],
+            },
+            {"t": "BulletList", "c": [[{"t": "Plain", "c": [{"t": "Str", "c": "Kept"}]}]]},
+        ],
+    }
+
+
+@pytest.fixture
+def test_docx_data():
+    with open(os.path.join("test_data", "test_data.docx"), "rb") as f:
+        return f.read()
+
+
+def test_transform_ast(test_ast):
+    transformed_ast = transform_ast(test_ast, remove_prefix=True, remove_strong=True)
+    assert transformed_ast["blocks"] == [
+        {"t": "Header", "c": [2, ["", [], []], [{"t": "Str", "c": "Title"}]]},
+        test_ast["blocks"][3],
+    ]
+    assert test_ast["blocks"][2]["c"][1][0] == "title"
+
+
+def test_transform_ast_keep(test_ast):
+    transformed_ast = transform_ast(test_ast, remove_prefix=False, remove_strong=False)
+    assert len(transformed_ast["blocks"]) == 4
+    assert transformed_ast["blocks"][2]["c"][2][0]["t"] == "Strong"
+
+
+def test_convert_bytes_ast_engine(monkeypatch, tmp_path, test_docx_data):
+    backend = RecordingBackend()
+    test_cache = ConversionCache(str(tmp_path / "cache"))
+    for module in (convertor, pandoc_ast):
+        monkeypatch.setattr(module, "get_backend", lambda: backend)
+        monkeypatch.setattr(module, "get_cache", lambda: test_cache)
+
+    for remove_prefix, remove_strong in itertools.product((True, False), repeat=2):
+        ast_html = convert_bytes(
+            test_docx_data,
+            remove_prefix=remove_prefix,
+            remove_strong=remove_strong,
+            engine=AST_ENGINE,
+        )
+        pandoc_html = convert_bytes(
+            test_docx_data,
+            remove_prefix=remove_prefix,
+            remove_strong=remove_strong,
+            engine=PANDOC_ENGINE,
+        )
+        assert ast_html.split() == pandoc_html.split()
+
+    assert backend.input_formats.count("docx") == 5
+    assert backend.input_formats.count("json") == 4
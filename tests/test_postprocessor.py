@@ -0,0 +1,107 @@
+import os
+import pytest
+from docx_html_converter.convertor import windows_fix
+from docx_html_converter.postprocessor import decode_charref, postprocess_html
+
+
+def postprocess(html_content, remove_prefix=False, remove_strong=False, fix_newlines=False):
+    chunks = []
+    postprocess_html(html_content, chunks.append, remove_prefix, remove_strong, fix_newlines)
+    return "".join(chunks)
+
+
+@pytest.fixture
+def test_html_data():
+    return (
+        '<h1 id="title">Title</h1>\n<ul>\n<li>First</li>\n</ul>\n'
+        '<p id="p1" class=" x  y " z=1 a=2 checked>Some <strong>bold</strong> text &amp; '
+        "&nbsp;&#150;&unknown;</p>\n   <p title=\"a'b\">Line<br>\n  next</br></p>\n"
+        "<pre>  keep\n    this  </pre>  \n\n  <!---->\n<div/><table><tr><td>1<td>2</table>"
+        "<script>a < b && c</script><b>x<i>y</b>z"
+    )
+
+
+def test_postprocess_html(test_html_data):
+    actual_result = postprocess(test_html_data, remove_prefix=True, remove_strong=True)
+    expected_result = (
+        '<p a="2" checked="" class="x y" z="1">Some bold text &amp; \xa0–&amp;unknown</p>\n'
+        "<p title=\"a'b\">Line<br/>\n  next</p>\n"
+        "<pre>  keep\n    this  </pre>\n<!-- -->\n<div></div><table><tr><td>1<td>2</td></td></tr></table>"
+        "<script>a < b && c</script><b>x<i>y</i></b>z"
+    )
+    assert actual_result == expected_result
+
+
+@pytest.mark.parametrize("remove_strong", [False, True])
+def test_postprocess_html_matches_legacy(test_html_data, remove_strong):
+    actual_result = postprocess(test_html_data, remove_prefix=False, remove_strong=remove_strong)
+    legacy_name = f"test_postprocessor_legacy_strong{remove_strong:d}.html"
+    legacy_path = os.path.join("test_data", legacy_name)
+    with open(legacy_path, "r", encoding="utf-8", newline="") as f:
+        expected_result = f.read()
+    assert actual_result == expected_result
+
+
+def test_postprocess_html_without_list():
+    actual_result = postprocess("<p>First</p>\n  <ul><li>Item</li>", remove_prefix=True)
+    assert actual_result == "<p>First</p>\n<ul><li>Item</li></ul>"
+
+
+def test_postprocess_html_nested_prefix_list():
+    actual_result = postprocess(
+        "<ol>\n<li>Step<ul><li>Note</li></ul></li>\n</ol>\n<ul>\n<li>Task<ul>\n<li>Sub</li>\n"
+        "</ul></li>\n<li>Task</li>\n</ul>\n  <p>Body\n  text</p>",
+        remove_prefix=True,
+    )
+    assert actual_result == "<p>Body\n  text</p>"
+
+
+def test_postprocess_html_fix_newlines():
+    actual_result = postprocess("<h1>Title\n\n</h1>\r\n<p>\n\n\n</p>", fix_newlines=True)
+    assert actual_result == windows_fix("<h1>Title\n\n</h1>\n<p>\n</p>")
+
+
+def test_postprocess_html_image_sources():
+    chunks = []
+    postprocess_html(
+        '<img src="media/image1.png" alt="a" /><img src="https://example.com/b.png">',
+        chunks.append,
+        False,
+        False,
+        image_sources={"media/image1.png": "assets/0123.png"},
+    )
+    assert "".join(chunks) == (
+        '<img alt="a" src="assets/0123.png"/><img src="https://example.com/b.png"/>'
+    )
+
+
+def test_postprocess_html_minify():
+    chunks = []
+    postprocess_html(
+        "<ul>\n<li><p>Task  <em>one</em>\n two</p></li>\n</ul>\n<!-- note -->\n"
+        "<p>Line<br />\n  next &amp; last</p>\n<pre>keep\n  this</pre>\n"
+        "<!--[if IE]><p>IE</p><![endif]-->\n",
+        chunks.append,
+        False,
+        True,
+        minify=True,
+    )
+    assert "".join(chunks) == (
+        "<ul><li><p>Task <em>one</em> two</p></li></ul><p>Line<br/>next &amp; last</p>"
+        "<pre>keep\n  this</pre><!--[if IE]><p>IE</p><![endif]-->"
+    )
+
+
+def test_postprocess_html_streams_output():
+    chunks = []
+    postprocess_html("<p>paragraph</p>\n" * 5000, chunks.append, False, False)
+    assert len(chunks) > 1
+    assert "".join(chunks) == "<p>paragraph</p>\n" * 5000
+
+
+def test_decode_charref():
+    assert decode_charref("65") == "A"
+    assert decode_charref("x41") == "A"
+    assert decode_charref("150") == "–"
+    assert decode_charref("129") == "\x81"
+    assert decode_charref("0") == "\ufffd"
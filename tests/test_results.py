@@ -0,0 +1,91 @@
+import csv
+import json
+import pytest
+from docx_html_converter.results import (
+    CANCELLED_STATUS,
+    FAILED_STATUS,
+    SKIPPED_STATUS,
+    SUCCESS_STATUS,
+    ConversionResult,
+    filter_failures,
+    format_report,
+    sort_results,
+    write_report,
+)
+from docx_html_converter.telemetry import ConversionTelemetry
+
+
+@pytest.fixture
+def test_results():
+    return [
+        ConversionResult(
+            "b.docx", "b.html", SUCCESS_STATUS, "b ok\n", duration_s=0.5, output_bytes=30
+        ),
+        ConversionResult(
+            "a.docx", "a.html", FAILED_STATUS, "a failed", error="broken", duration_s=2.0
+        ),
+        ConversionResult("c.docx", "c.html", SKIPPED_STATUS, "c skipped\n", output_bytes=10),
+        ConversionResult("d.docx", "d.html", CANCELLED_STATUS, "d cancelled"),
+    ]
+
+
+def test_from_telemetry():
+    telemetry = ConversionTelemetry("a.docx", "a.html")
+    telemetry.add_stage_time("total", 1.5)
+    telemetry.input_bytes = 100
+    telemetry.output_bytes = 50
+    telemetry.cached = True
+    result = ConversionResult.from_telemetry(telemetry, SUCCESS_STATUS, "a ok\n")
+    assert result.to_dict() == {
+        "docx_path": "a.docx",
+        "html_path": "a.html",
+        "status": SUCCESS_STATUS,
+        "duration_s": 1.5,
+        "input_bytes": 100,
+        "output_bytes": 50,
+        "cached": True,
+        "error": None,
+        "message": "a ok",
+    }
+    assert result.success
+    assert str(result) == "a ok\n"
+
+
+def test_sort_and_filter(test_results):
+    assert [result.docx_path for result in sort_results(test_results, "duration", True)] == [
+        "a.docx",
+        "b.docx",
+        "c.docx",
+        "d.docx",
+    ]
+    assert [result.docx_path for result in sort_results(test_results, "size")] == [
+        "a.docx",
+        "d.docx",
+        "c.docx",
+        "b.docx",
+    ]
+    assert [result.docx_path for result in sort_results(test_results, "status")] == [
+        "d.docx",
+        "a.docx",
+        "c.docx",
+        "b.docx",
+    ]
+    assert [result.docx_path for result in filter_failures(test_results)] == ["a.docx", "d.docx"]
+
+
+def test_write_report(tmp_path, test_results):
+    json_path = tmp_path / "report.json"
+    write_report(test_results, str(json_path))
+    report = json.loads(json_path.read_text(encoding="utf-8"))
+    assert (report["total"], report["succeeded"], report["failed"]) == (4, 2, 2)
+    assert report["results"][1]["error"] == "broken"
+
+    csv_path = tmp_path / "nested" / "report.CSV"
+    write_report(test_results, str(csv_path))
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["status"] for row in rows] == ["success", "failed", "skipped", "cancelled"]
+    assert rows[0]["output_bytes"] == "30"
+
+    with pytest.raises(ValueError):
+        format_report(test_results, "xml")
@@ -0,0 +1,207 @@
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+from docx_html_converter import service
+from docx_html_converter.service import ConversionService
+
+
+def fake_convert_bytes(data, remove_prefix, remove_strong):
+    if data == b"broken":
+        raise RuntimeError("broken document")
+    return f"<p>{data.decode()} {remove_prefix} {remove_strong}</p>"
+
+
+async def request(port, method, target, body=b"", headers=None):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    head = [f"{method} {target} HTTP/1.1", "Host: localhost"]
+    if body or method == "POST":
+        head.append(f"Content-Length: {len(body)}")
+    head.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+
+    response_head, _, response_body = response.partition(b"\r\n\r\n")
+    status_line, *header_lines = response_head.decode().split("\r\n")
+    response_headers = dict(line.split(": ", 1) for line in header_lines)
+    return int(status_line.split()[1]), response_headers, response_body
+
+
+def run_with_service(scenario, **kwargs):
+    async def main():
+        conversion_service = ConversionService(port=0, **kwargs)
+        await conversion_service.start()
+        try:
+            return await scenario(conversion_service)
+        finally:
+            await conversion_service.close()
+
+    return asyncio.run(main())
+
+
+@pytest.fixture
+def fake_service_convert(monkeypatch):
+    monkeypatch.setattr(service, "convert_bytes", fake_convert_bytes)
+
+
+@pytest.fixture
+def test_docx_content():
+    with open(os.path.join("test_data", "test_data.docx"), "rb") as f:
+        return f.read()
+
+
+def test_health_and_queue(fake_service_convert):
+    async def scenario(conversion_service):
+        health = await request(conversion_service.port, "GET", "/health")
+        queue = await request(conversion_service.port, "GET", "/queue")
+        return health, queue
+
+    (health_status, _, health_body), (queue_status, _, queue_body) = run_with_service(
+        scenario, max_workers=2, max_queue=3
+    )
+    assert health_status == 200
+    assert json.loads(health_body) == {"status": "ok"}
+    assert queue_status == 200
+    assert json.loads(queue_body) == {
+        "active": 0,
+        "queued": 0,
+        "workers": 2,
+        "max_queue": 3,
+        "rejected": 0,
+    }
+
+
+def test_convert(fake_service_convert):
+    async def scenario(conversion_service):
+        return await request(
+            conversion_service.port, "POST", "/convert?remove_strong=false", b"content"
+        )
+
+    status, headers, body = run_with_service(scenario)
+    assert status == 200
+    assert headers["Content-Type"] == "text/html; charset=utf-8"
+    assert body == b"<p>content True False</p>"
+
+
+@pytest.mark.parametrize(
+    "method, target, body, expected_status",
+    [
+        ("POST", "/convert", b"broken", 422),
+        ("POST", "/convert?remove_prefix=maybe", b"content", 400),
+        ("GET", "/convert", b"", 405),
+        ("GET", "/missing", b"", 404),
+        ("POST", "/convert", b"x" * 11, 413),
+    ],
+)
+def test_convert_errors(fake_service_convert, method, target, body, expected_status):
+    async def scenario(conversion_service):
+        return await request(conversion_service.port, method, target, body)
+
+    status, headers, body = run_with_service(scenario, max_upload_bytes=10)
+    assert status == expected_status
+    assert headers["Content-Type"] == "application/json"
+    assert json.loads(body)["error"]
+
+
+def test_convert_rejects_when_saturated(monkeypatch):
+    release_event = threading.Event()
+
+    def blocking_convert_bytes(data, remove_prefix, remove_strong):
+        release_event.wait(5)
+        return "<p>done</p>"
+
+    monkeypatch.setattr(service, "convert_bytes", blocking_convert_bytes)
+
+    async def scenario(conversion_service):
+        port = conversion_service.port
+        accepted = [
+            asyncio.create_task(request(port, "POST", "/convert", b"content"))
+            for _ in range(2)
+        ]
+        while conversion_service.active + conversion_service.queued < 2:
+            await asyncio.sleep(0.01)
+        queue_body = (await request(port, "GET", "/queue"))[2]
+        rejected = await request(port, "POST", "/convert", b"content")
+        release_event.set()
+        return json.loads(queue_body), rejected, await asyncio.gather(*accepted)
+
+    queue, rejected, accepted = run_with_service(scenario, max_workers=1, max_queue=1)
+    assert (queue["active"], queue["queued"]) == (1, 1)
+    assert rejected[0] == 503
+    assert rejected[1]["Retry-After"] == "1"
+    assert [status for status, _, _ in accepted] == [200, 200]
+
+
+def test_convert_rejects_before_reading_body(monkeypatch):
+    release_event = threading.Event()
+
+    def blocking_convert_bytes(data, remove_prefix, remove_strong):
+        release_event.wait(5)
+        return "<p>done</p>"
+
+    monkeypatch.setattr(service, "convert_bytes", blocking_convert_bytes)
+
+    async def scenario(conversion_service):
+        port = conversion_service.port
+        accepted = asyncio.create_task(request(port, "POST", "/convert", b"content"))
+        while conversion_service.active < 1:
+            await asyncio.sleep(0.01)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(b"POST /convert HTTP/1.1\r\nContent-Length: 1000000\r\n\r\n")
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), 5)
+        writer.close()
+        release_event.set()
+        await accepted
+        return response, conversion_service.get_queue_status()
+
+    response, queue = run_with_service(scenario, max_workers=1, max_queue=0)
+    assert response.startswith(b"HTTP/1.1 503 ")
+    assert (queue["active"], queue["queued"], queue["rejected"]) == (0, 0, 1)
+
+
+def test_incomplete_body_releases_reservation(fake_service_convert):
+    async def scenario(conversion_service):
+        reader, writer = await asyncio.open_connection("127.0.0.1", conversion_service.port)
+        writer.write(b"POST /convert HTTP/1.1\r\nContent-Length: 10\r\n\r\nabc")
+        writer.write_eof()
+        response = await reader.read()
+        writer.close()
+        return response, conversion_service.get_queue_status()
+
+    response, queue = run_with_service(scenario, max_workers=1, max_queue=0)
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert queue["queued"] == 0
+
+
+@pytest.mark.parametrize(
+    "host, expected_result",
+    [
+        ("127.0.0.1", True),
+        ("::1", True),
+        ("localhost", True),
+        ("0.0.0.0", False),
+        ("192.168.1.10", False),
+        ("example.com", False),
+    ],
+)
+def test_is_loopback(host, expected_result):
+    assert service.is_loopback(host) == expected_result
+
+
+def test_convert_docx(test_docx_content):
+    async def scenario(conversion_service):
+        return await request(
+            conversion_service.port, "POST", "/convert?remove_strong=0", test_docx_content
+        )
+
+    status, _, body = run_with_service(scenario)
+    expected_result = service.convert_bytes(
+        test_docx_content, remove_prefix=True, remove_strong=False
+    )
+    assert status == 200
+    assert body.decode("utf-8") == expected_result
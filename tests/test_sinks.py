@@ -0,0 +1,165 @@
+import gzip
+import io
+import os
+import shutil
+import sys
+import zipfile
+
+import pytest
+from docx_html_converter.batch import convert_batch
+from docx_html_converter.cli import main
+from docx_html_converter.constants import (
+    EXIT_OK,
+)
+from docx_html_converter.convertor import convert
+from docx_html_converter.sinks import DirectorySink, NullSink, OutputSink, StreamSink, ZipSink
+
+
+@pytest.fixture
+def test_docx_path():
+    return os.path.join("test_data", "test_data.docx")
+
+
+@pytest.fixture
+def test_input_dir(tmp_path, test_docx_path):
+    input_dir = tmp_path / "input"
+    (input_dir / "nested").mkdir(parents=True)
+    shutil.copy(test_docx_path, input_dir / "first.docx")
+    shutil.copy(test_docx_path, input_dir / "nested" / "second.docx")
+    return str(input_dir)
+
+
+def test_directory_sink(tmp_path):
+    sink = DirectorySink(str(tmp_path))
+    assert sink.write(os.path.join("nested", "file.html"), "<p>Straße</p>") == 14
+    assert (tmp_path / "nested" / "file.html").read_text(encoding="utf-8") == "<p>Straße</p>"
+    assert os.listdir(tmp_path / "nested") == ["file.html"]
+
+
+def test_directory_sink_keeps_old_file_on_failure(tmp_path):
+    html_path = tmp_path / "file.html"
+    html_path.write_text("<p>old</p>")
+    with pytest.raises(UnicodeEncodeError):
+        DirectorySink().write(str(html_path), "<p>\ud800</p>")
+    assert html_path.read_text() == "<p>old</p>"
+    assert os.listdir(tmp_path) == ["file.html"]
+
+
+def test_directory_sink_open(tmp_path):
+    sink = DirectorySink(str(tmp_path))
+    with sink.open("file.html") as writer:
+        writer.write("<p>Straße")
+        assert not (tmp_path / "file.html").exists()
+        writer.write("</p>")
+    assert writer.size == 14
+    assert (tmp_path / "file.html").read_text(encoding="utf-8") == "<p>Straße</p>"
+
+    with pytest.raises(RuntimeError):
+        with sink.open("file.html") as writer:
+            writer.write("<p>new")
+            raise RuntimeError("postprocessing failed")
+    assert os.listdir(tmp_path) == ["file.html"]
+    assert (tmp_path / "file.html").read_text(encoding="utf-8") == "<p>Straße</p>"
+
+
+def test_sink_open_buffers_chunks():
+    stream = io.StringIO()
+    with StreamSink(stream).open("file.html") as writer:
+        writer.write("<p>Straße")
+        writer.write("</p>")
+        assert stream.getvalue() == ""
+    assert stream.getvalue() == "<p>Straße</p>"
+    assert writer.size == 14
+
+
+def test_directory_sink_sidecars(tmp_path):
+    sink = DirectorySink(str(tmp_path), sidecars=("gz",))
+    size = sink.write("file.html", "<p>Straße</p>\n" * 100)
+    assert size == os.path.getsize(tmp_path / "file.html")
+    with gzip.open(tmp_path / "file.html.gz", "rb") as f:
+        assert f.read() == (tmp_path / "file.html").read_bytes()
+    assert sorted(os.listdir(tmp_path)) == ["file.html", "file.html.gz"]
+
+
+def test_output_sink_is_abstract():
+    with pytest.raises(TypeError):
+        OutputSink()
+
+
+def test_directory_sink_brotli_missing(monkeypatch):
+    monkeypatch.setitem(sys.modules, "brotli", None)
+    with pytest.raises(RuntimeError, match="brotli"):
+        DirectorySink(sidecars=("br",))
+    with pytest.raises(ValueError):
+        DirectorySink(sidecars=("zst",))
+
+
+def test_zip_sink(tmp_path):
+    zip_path = str(tmp_path / "output.zip")
+    with ZipSink(zip_path) as sink:
+        sink.write("first.html", "<p>first</p>")
+        sink.write(os.path.join("nested", "second.html"), "<p>second</p>")
+        assert not os.path.exists(zip_path)
+        with pytest.raises(RuntimeError):
+            sink.write("first.html", "<p>again</p>")
+        with pytest.raises(RuntimeError):
+            sink.write(os.path.join("..", "outside.html"), "<p>outside</p>")
+    with zipfile.ZipFile(zip_path) as archive:
+        assert archive.namelist() == ["first.html", "nested/second.html"]
+        assert archive.read("nested/second.html") == b"<p>second</p>"
+    assert os.listdir(tmp_path) == ["output.zip"]
+
+
+def test_zip_sink_abort(tmp_path):
+    with pytest.raises(KeyboardInterrupt):
+        with ZipSink(str(tmp_path / "output.zip")) as sink:
+            sink.write("first.html", "<p>first</p>")
+            raise KeyboardInterrupt
+    assert os.listdir(tmp_path) == []
+
+
+def test_stream_and_null_sinks():
+    stream = io.StringIO()
+    StreamSink(stream).write("file.html", "<p>Straße</p>")
+    assert stream.getvalue() == "<p>Straße</p>"
+    assert NullSink().write("file.html", "<p>Straße</p>") == 14
+
+
+def test_convert_null_sink(tmp_path, test_docx_path):
+    html_path = str(tmp_path / "test_data.html")
+    result = convert(test_docx_path, html_path, True, True, sink=NullSink())
+    assert result.success
+    assert result.output_bytes > 0
+    assert not os.path.exists(html_path)
+
+
+def test_convert_batch_zip_sink_processes(tmp_path, test_docx_path):
+    with ZipSink(str(tmp_path / "output.zip")) as sink:
+        with pytest.raises(ValueError):
+            convert_batch(
+                [(test_docx_path, "test_data.html")],
+                remove_prefix=True,
+                remove_strong=True,
+                use_processes=True,
+                sink=sink,
+            )
+
+
+def test_cli_zip(conversion_env, tmp_path, test_input_dir):
+    zip_path = str(tmp_path / "output.zip")
+    assert main([test_input_dir, "--zip", zip_path, "-j", "2", "-q"]) == EXIT_OK
+    with zipfile.ZipFile(zip_path) as archive:
+        assert sorted(archive.namelist()) == ["input/first.html", "input/nested/second.html"]
+        assert archive.read("input/first.html") == archive.read("input/nested/second.html")
+
+
+def test_cli_minify_compress(conversion_env, tmp_path, test_input_dir):
+    output_dir = tmp_path / "output"
+    assert main([test_input_dir, "-o", str(output_dir), "--minify", "--compress", "gz", "-q"]) == 0
+    html_content = (output_dir / "input" / "first.html").read_bytes()
+    assert b"\n" not in html_content
+    with gzip.open(output_dir / "input" / "first.html.gz", "rb") as f:
+        assert f.read() == html_content
+
+    with pytest.raises(SystemExit):
+        main([test_input_dir, "--compress", "gz", "--zip", str(tmp_path / "output.zip")])
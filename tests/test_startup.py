@@ -0,0 +1,70 @@
+import os
+import subprocess
+import sys
+import pytest
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+GUI_MODULES = ("tkinter", "tkinterdnd2")
+CONVERSION_MODULES = ("pypandoc", "bs4", "urllib.request", "ctypes", "multiprocessing")
+
+
+def get_imported_modules(module):
+    code = f"import sys, {module}\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "docx_html_converter",
+        "docx_html_converter.convertor",
+        "docx_html_converter.batch",
+        "docx_html_converter.cli",
+        "docx_html_converter.watcher",
+        "docx_html_converter.service",
+    ],
+)
+def test_import_is_lazy(module):
+    imported_modules = get_imported_modules(module)
+    assert not imported_modules.intersection(GUI_MODULES + CONVERSION_MODULES)
+
+
+def test_import_time_benchmark(tmp_path):
+    report_path = tmp_path / "import_time.json"
+    subprocess.run(
+        [
+            sys.executable,
+            os.path.join("benchmarks", "import_time.py"),
+            "docx_html_converter.convertor",
+            "-n",
+            "1",
+            "-o",
+            str(report_path),
+        ],
+        cwd=PROJECT_ROOT,
+        check=True,
+    )
+    result = subprocess.run(
+        [
+            sys.executable,
+            os.path.join("benchmarks", "import_time.py"),
+            "docx_html_converter.convertor",
+            "-n",
+            "1",
+            "--baseline",
+            str(report_path),
+            "--threshold",
+            "100",
+        ],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,171 @@
+import json
+import os
+import shutil
+
+import pytest
+from docx_html_converter.batch import convert_batch
+from docx_html_converter.cli import main
+from docx_html_converter.constants import (
+    EXIT_OK,
+)
+from docx_html_converter.convertor import convert
+from docx_html_converter.telemetry import (
+    ConversionTelemetry,
+    MemoryTracker,
+    TelemetryLog,
+    format_summary,
+    percentile,
+    summarize_telemetry,
+)
+
+
+def make_telemetry(**stages):
+    telemetry = ConversionTelemetry("file.docx", "file.html")
+    for name, seconds in stages.items():
+        telemetry.add_stage_time(name, seconds)
+    return telemetry
+
+
+@pytest.fixture
+def test_docx_path():
+    return os.path.join("test_data", "test_data.docx")
+
+
+@pytest.fixture
+def test_input_dir(tmp_path, test_docx_path):
+    input_dir = tmp_path / "input"
+    input_dir.mkdir()
+    for name in ("first.docx", "second.docx"):
+        shutil.copy(test_docx_path, input_dir / name)
+    return str(input_dir)
+
+
+def test_percentile():
+    values = [0.4, 0.1, 0.3, 0.2]
+    assert percentile(values, 0.5) == 0.2
+    assert percentile(values, 0.95) == 0.4
+    assert percentile([0.7], 0.5) == 0.7
+
+
+def test_summarize_telemetry():
+    telemetry_records = [make_telemetry(convert=index / 10, write=0.001) for index in range(1, 21)]
+    summary = summarize_telemetry(telemetry_records)
+    assert summary == {
+        "convert": {"p50": 1.0, "p95": 1.9},
+        "write": {"p50": 0.001, "p95": 0.001},
+    }
+    assert format_summary(summary) == [
+        "convert: p50 1000.0 ms | p95 1900.0 ms",
+        "write: p50 1.0 ms | p95 1.0 ms",
+    ]
+
+
+def test_telemetry_log(tmp_path):
+    log_path = str(tmp_path / "telemetry.jsonl")
+    with TelemetryLog(log_path) as telemetry_log:
+        telemetry_log.write(make_telemetry(convert=0.5))
+        telemetry_log.write(make_telemetry(convert=0.25))
+    with open(log_path) as f:
+        records = [json.loads(line) for line in f]
+    assert [record["stages"] for record in records] == [{"convert": 0.5}, {"convert": 0.25}]
+    assert records[0]["docx_path"] == "file.docx"
+
+
+def test_convert_telemetry(tmp_path, test_docx_path):
+    html_path = str(tmp_path / "test_data.html")
+    telemetry = ConversionTelemetry(test_docx_path, html_path)
+    convert(test_docx_path, html_path, remove_prefix=True, remove_strong=True, telemetry=telemetry)
+    assert telemetry.success
+    assert telemetry.input_bytes == os.path.getsize(test_docx_path)
+    assert telemetry.output_bytes == os.path.getsize(html_path)
+    assert set(telemetry.stages) == {"read", "convert", "postprocess", "write", "total"}
+    assert telemetry.stages["total"] >= telemetry.stages["convert"]
+
+
+def test_convert_telemetry_error(tmp_path):
+    telemetry = ConversionTelemetry("missing.docx", str(tmp_path / "missing.html"))
+    convert("missing.docx", telemetry.html_path, True, True, telemetry=telemetry)
+    assert not telemetry.success
+    assert telemetry.error == "missing.docx does not exist"
+
+
+def test_convert_batch_on_telemetry(tmp_path, test_input_dir):
+    path_pairs = [
+        (os.path.join(test_input_dir, name), str(tmp_path / f"{name}.html"))
+        for name in ("first.docx", "second.docx")
+    ]
+    telemetry_records = []
+    convert_batch(
+        path_pairs,
+        remove_prefix=True,
+        remove_strong=True,
+        max_workers=2,
+        on_telemetry=telemetry_records.append,
+    )
+    assert sorted(telemetry.docx_path for telemetry in telemetry_records) == [
+        docx_path for docx_path, _ in path_pairs
+    ]
+    assert all(telemetry.success for telemetry in telemetry_records)
+
+
+def test_memory_tracker_skips_overlapping_files():
+    import tracemalloc
+
+    first, second, third = (make_telemetry() for _ in range(3))
+    tracemalloc.start()
+    try:
+        with MemoryTracker(first):
+            with MemoryTracker(second):
+                pass
+        with MemoryTracker(third):
+            pass
+    finally:
+        tracemalloc.stop()
+    assert first.peak_memory_bytes is None
+    assert second.peak_memory_bytes is None
+    assert third.peak_memory_bytes is not None
+
+
+def test_cli_stats(conversion_env, tmp_path, capsys, test_input_dir):
+    log_path = tmp_path / "telemetry.jsonl"
+    exit_code = main(
+        [
+            test_input_dir,
+            "-o",
+            str(tmp_path / "output"),
+            "-j",
+            "1",
+            "--stats",
+            "--telemetry-log",
+            str(log_path),
+            "-q",
+        ]
+    )
+    assert exit_code == EXIT_OK
+    records = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert len(records) == 2
+    assert all(record["peak_memory_bytes"] is None for record in records)
+    assert all(record["stages"] for record in records)
+    stats_lines = capsys.readouterr().err.splitlines()
+    assert [line.split(":")[0] for line in stats_lines] == [
+        "read",
+        "convert",
+        "postprocess",
+        "write",
+        "total",
+    ]
+
+
+def test_cli_trace_memory(conversion_env, tmp_path, capsys, test_input_dir):
+    import tracemalloc
+
+    log_path = tmp_path / "telemetry.jsonl"
+    args = [test_input_dir, "-o", str(tmp_path / "output"), "-j", "1", "--stats", "-q"]
+    exit_code = main(args + ["--telemetry-log", str(log_path), "--trace-memory"])
+    assert exit_code == EXIT_OK
+    assert not tracemalloc.is_tracing()
+    records = [json.loads(line) for line in log_path.read_text().splitlines()]
+    assert all(record["peak_memory_bytes"] > 0 for record in records)
+    assert all(record["stages"] == {} for record in records)
+    stats_lines = capsys.readouterr().err.splitlines()
+    assert [line.split(":")[0] for line in stats_lines] == ["peak memory"]
@@ -0,0 +1,169 @@
+import os
+import sys
+import threading
+import time
+import pytest
+from docx_html_converter import watcher
+from docx_html_converter.results import FAILED_STATUS, SUCCESS_STATUS, ConversionResult
+from docx_html_converter.watcher import ConversionManifest, FolderWatcher, is_docx_file
+
+
+def fake_convert(docx_path, html_path, remove_prefix, remove_strong):
+    if "broken" in docx_path:
+        return ConversionResult(
+            docx_path,
+            html_path,
+            FAILED_STATUS,
+            f"Error converting {os.path.basename(docx_path)} to HTML: broken",
+        )
+    with open(docx_path, "r") as docx_file, open(html_path, "w") as html_file:
+        html_file.write(f"<p>{docx_file.read()}</p>")
+    return ConversionResult(
+        docx_path,
+        html_path,
+        SUCCESS_STATUS,
+        f"{os.path.basename(docx_path)} converted to HTML successfully!\n",
+    )
+
+
+@pytest.fixture
+def test_input_dir(tmp_path):
+    input_dir = tmp_path / "input"
+    (input_dir / "nested").mkdir(parents=True)
+    (input_dir / "first.docx").write_text("first")
+    (input_dir / "nested" / "second.docx").write_text("second")
+    (input_dir / "notes.txt").write_text("skipped")
+    return str(input_dir)
+
+
+@pytest.fixture
+def test_watcher(monkeypatch, tmp_path, test_input_dir):
+    monkeypatch.setattr(watcher, "convert", fake_convert)
+    return FolderWatcher(
+        [test_input_dir],
+        str(tmp_path / "output"),
+        remove_prefix=True,
+        remove_strong=True,
+        poll_interval=0.05,
+        use_inotify=False,
+    )
+
+
+def test_is_docx_file():
+    assert is_docx_file("file.docx")
+    assert is_docx_file("FILE.DOCX")
+    assert not is_docx_file("~$file.docx")
+    assert not is_docx_file("file.doc")
+
+
+def test_scan_mirrors_tree(tmp_path, test_watcher):
+    status_messages = test_watcher.scan()
+    assert len(status_messages) == 2
+    assert (tmp_path / "output" / "first.html").read_text() == "<p>first</p>"
+    assert (tmp_path / "output" / "nested" / "second.html").read_text() == "<p>second</p>"
+
+
+def test_scan_skips_up_to_date(test_watcher):
+    test_watcher.scan()
+    assert test_watcher.scan() == []
+
+
+def test_scan_after_restart(tmp_path, test_watcher, test_input_dir):
+    test_watcher.scan()
+    restarted_watcher = FolderWatcher(
+        [test_input_dir], str(tmp_path / "output"), remove_prefix=True, remove_strong=True
+    )
+    assert restarted_watcher.scan() == []
+
+
+def test_scan_converts_modified(tmp_path, test_watcher, test_input_dir):
+    test_watcher.scan()
+    docx_path = os.path.join(test_input_dir, "first.docx")
+    with open(docx_path, "w") as f:
+        f.write("changed")
+    assert len(test_watcher.scan()) == 1
+    assert (tmp_path / "output" / "first.html").read_text() == "<p>changed</p>"
+
+
+def test_scan_keeps_unchanged_output(tmp_path, test_watcher):
+    test_watcher.scan()
+    html_path = tmp_path / "output" / "first.html"
+    os.utime(html_path, (1, 1))
+    test_watcher.manifest.load()
+    test_watcher.manifest._entries.clear()
+    assert len(test_watcher.scan()) == 2
+    assert os.stat(html_path).st_mtime == 1
+    assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path / "output"))
+
+
+def test_scan_retries_failure_only_when_changed(tmp_path, test_watcher, test_input_dir):
+    broken_path = os.path.join(test_input_dir, "broken.docx")
+    with open(broken_path, "w") as f:
+        f.write("broken")
+    assert len(test_watcher.scan()) == 3
+    assert test_watcher.scan() == []
+
+    restarted_watcher = FolderWatcher(
+        [test_input_dir], str(tmp_path / "output"), remove_prefix=True, remove_strong=True
+    )
+    assert restarted_watcher.scan() == []
+
+    with open(broken_path, "w") as f:
+        f.write("still broken")
+    actual_result = restarted_watcher.scan()
+    assert [result.docx_path for result in actual_result] == [broken_path]
+    assert not actual_result[0].success
+
+
+def test_scan_after_restart_with_other_options(tmp_path, test_watcher, test_input_dir):
+    test_watcher.scan()
+    restarted_watcher = FolderWatcher(
+        [test_input_dir], str(tmp_path / "output"), remove_prefix=True, remove_strong=False
+    )
+    assert len(restarted_watcher.scan()) == 2
+    assert restarted_watcher.scan() == []
+
+
+def test_manifest_touched_file(tmp_path, test_input_dir):
+    docx_path = os.path.join(test_input_dir, "first.docx")
+    html_path = tmp_path / "first.html"
+    html_path.write_text("")
+    manifest = ConversionManifest(str(tmp_path / "manifest.json"))
+    manifest.update(docx_path, str(html_path), os.stat(docx_path))
+    os.utime(docx_path, (5, 5))
+    assert manifest.is_up_to_date(docx_path, str(html_path), os.stat(docx_path))
+    assert not manifest.is_up_to_date(docx_path, str(html_path), os.stat(docx_path), "other")
+    manifest.record_failure(docx_path, str(html_path), os.stat(docx_path), "options")
+    assert manifest.has_failed(docx_path, str(html_path), os.stat(docx_path), "options")
+    assert not manifest.has_failed(docx_path, str(html_path), os.stat(docx_path), "other")
+
+
+def run_until_converted(tmp_path, test_watcher, test_input_dir):
+    stop_event = threading.Event()
+    thread = threading.Thread(target=test_watcher.run, args=(stop_event,))
+    thread.start()
+    try:
+        time.sleep(0.2)
+        with open(os.path.join(test_input_dir, "third.docx"), "w") as f:
+            f.write("third")
+        deadline = time.monotonic() + 5
+        while not (tmp_path / "output" / "third.html").exists():
+            assert time.monotonic() < deadline
+            time.sleep(0.05)
+    finally:
+        stop_event.set()
+        thread.join()
+    return (tmp_path / "output" / "third.html").read_text()
+
+
+def test_run_polling(tmp_path, test_watcher, test_input_dir):
+    actual_result = run_until_converted(tmp_path, test_watcher, test_input_dir)
+    assert actual_result == "<p>third</p>"
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux only")
+def test_run_inotify(tmp_path, test_watcher, test_input_dir):
+    test_watcher.use_inotify = True
+    test_watcher.poll_interval = 60
+    actual_result = run_until_converted(tmp_path, test_watcher, test_input_dir)
+    assert actual_result == "<p>third</p>"